@@ -1,10 +1,12 @@
 from quick.orm.core.database import Quick
+from quick.orm.core.session import Session, IdentityMap
 from quick.orm import models, columns, validators, types, relations, migrations
 from quick.orm.exceptions import (
     QuickORMError,
     ConnectionError,
     QueryError,
     ValidationError,
+    BatchValidationError,
     ModelNotFoundError,
     RelationError,
     MigrationError,
@@ -12,6 +14,11 @@ from quick.orm.exceptions import (
     TransactionError,
     SchemaError,
     DuplicateEntryError,
+    VersionConflictError,
+    DeferredColumnError,
+    PoolOverloadedError,
+    PoolTimeoutError,
+    DeadlineExceededError,
 )
 from quick.orm.error_handler import ErrorHandler
 from quick.orm.cache import QueryCache, CacheManager
@@ -31,6 +38,8 @@ from quick.orm.mixins import SoftDeleteMixin
 
 __all__ = [
     "Quick",
+    "Session",
+    "IdentityMap",
     "models",
     "columns",
     "validators",
@@ -41,6 +50,7 @@ __all__ = [
     "ConnectionError",
     "QueryError",
     "ValidationError",
+    "BatchValidationError",
     "ModelNotFoundError",
     "RelationError",
     "MigrationError",
@@ -48,6 +58,11 @@ __all__ = [
     "TransactionError",
     "SchemaError",
     "DuplicateEntryError",
+    "VersionConflictError",
+    "DeferredColumnError",
+    "PoolOverloadedError",
+    "PoolTimeoutError",
+    "DeadlineExceededError",
     "ErrorHandler",
     "QueryCache",
     "CacheManager",
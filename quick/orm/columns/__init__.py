@@ -2,7 +2,7 @@ from quick.orm.columns.base import Column, ColumnMetadata
 from quick.orm.columns.numeric import Integer, BigInt, SmallInt, Float, Decimal
 from quick.orm.columns.string import String, Text, Char
 from quick.orm.columns.temporal import DateTime, Date, Time
-from quick.orm.columns.special import UUIDColumn as UUID, Boolean, JSON, JSONB, Binary, Array
+from quick.orm.columns.special import UUIDColumn as UUID, Boolean, JSON, JSONB, Binary, Array, Version
 
 
 __all__ = [
@@ -25,4 +25,5 @@ __all__ = [
     "JSONB",
     "Binary",
     "Array",
+    "Version",
 ]
@@ -8,6 +8,7 @@ class ColumnMetadata:
     sql_type: str
     primary_key: bool = False
     auto_increment: bool = False
+    server_generated: bool = False
     unique: bool = False
     nullable: bool = False
     default: Any = None
@@ -46,6 +47,7 @@ class Column:
         *,
         primary_key: bool = False,
         auto_increment: bool = False,
+        server_generated: bool = False,
         unique: bool = False,
         nullable: bool = False,
         default: Any = None,
@@ -58,6 +60,7 @@ class Column:
             sql_type=sql_type,
             primary_key=primary_key,
             auto_increment=auto_increment,
+            server_generated=server_generated,
             unique=unique,
             nullable=nullable,
             default=default,
@@ -67,6 +70,7 @@ class Column:
         )
         self._name: str | None = None
         self._model_class: type | None = None
+        self._slot: Any = None
     
     def __set_name__(self, owner: type, name: str) -> None:
         self._name = name
@@ -75,14 +79,36 @@ class Column:
     def __get__(self, instance: Any, owner: type) -> Any:
         if instance is None:
             return self
-        return instance.__dict__.get(self._name)
+        try:
+            if self._slot is not None:
+                return self._slot.__get__(instance, owner)
+            return instance.__dict__[self._name]
+        except (KeyError, AttributeError):
+            return instance._load_lazy(self)
     
     def __set__(self, instance: Any, value: Any) -> None:
         self.validate(value)
-        instance.__dict__[self._name] = value
+        
+        if instance.__record__ is not None:
+            instance._promote()
+        
+        self._store(instance, value)
+        
+        if instance._original is not None:
+            changed = instance._changed
+            if changed is None:
+                instance._changed = {self._name}
+            else:
+                changed.add(self._name)
+    
+    def _store(self, instance: Any, value: Any) -> None:
+        if self._slot is not None:
+            self._slot.__set__(instance, value)
+        else:
+            instance.__dict__[self._name] = value
     
     def validate(self, value: Any) -> None:
-        if value is None and not self.metadata.nullable:
+        if value is None and not self.metadata.nullable and not self.is_generated:
             raise ValueError(f"{self._name} cannot be None")
         
         if value is not None:
@@ -95,6 +121,10 @@ class Column:
             raise RuntimeError("Column name not set")
         return self._name
     
+    @property
+    def is_generated(self) -> bool:
+        return self.metadata.auto_increment or self.metadata.server_generated
+    
     @property
     def sql_definition(self) -> str:
         return self.metadata.to_sql()
@@ -25,6 +25,7 @@ class UUIDColumn(Column):
             python_type=UUID,
             sql_type="UUID",
             primary_key=primary_key,
+            server_generated=auto_generate,
             unique=unique,
             nullable=nullable,
             default=sql_default,
@@ -63,6 +64,7 @@ class JSON(Column):
         default: dict | list | None = None,
         index: bool = False,
         validators: list[Callable] | None = None,
+        codec: Any = None,
     ):
         super().__init__(
             python_type=dict,
@@ -73,6 +75,7 @@ class JSON(Column):
             index=index,
             validators=validators,
         )
+        self.codec = codec
 
 
 class JSONB(Column):
@@ -84,6 +87,7 @@ class JSONB(Column):
         default: dict | list | None = None,
         index: bool = False,
         validators: list[Callable] | None = None,
+        codec: Any = None,
     ):
         super().__init__(
             python_type=dict,
@@ -94,6 +98,7 @@ class JSONB(Column):
             index=index,
             validators=validators,
         )
+        self.codec = codec
 
 
 class Binary(Column):
@@ -139,4 +144,20 @@ class Array(Column):
         )
 
 
-__all__ = ["UUIDColumn", "Boolean", "JSON", "JSONB", "Binary", "Array"]
+class Version(Column):
+    def __init__(
+        self,
+        *,
+        default: int = 1,
+        index: bool = False,
+    ):
+        super().__init__(
+            python_type=int,
+            sql_type="INTEGER",
+            nullable=False,
+            default=default,
+            index=index,
+        )
+
+
+__all__ = ["UUIDColumn", "Boolean", "JSON", "JSONB", "Binary", "Array", "Version"]
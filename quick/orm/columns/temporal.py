@@ -27,6 +27,7 @@ class DateTime(Column):
         super().__init__(
             python_type=datetime,
             sql_type="TIMESTAMP",
+            server_generated=auto_now or auto_now_add,
             unique=unique,
             nullable=nullable,
             default=sql_default,
@@ -2,6 +2,12 @@ from quick.orm.core.database import Quick
 from quick.orm.core.config import DatabaseConfig
 from quick.orm.core.connection import ConnectionPool
 from quick.orm.core.transaction import Transaction
+from quick.orm.core.session import Session, IdentityMap
+from quick.orm.core.codecs import TypeCodec, JSONCodec
+from quick.orm.core.retry import RetryPolicy
+from quick.orm.core.metrics import MetricsSink
+from quick.orm.core.stats import PoolStats
+from quick.orm.core.adaptive import AdaptiveSizing, BackendBudget
 
 
-__all__ = ["Quick", "DatabaseConfig", "ConnectionPool", "Transaction"]
+__all__ = ["Quick", "DatabaseConfig", "ConnectionPool", "Transaction", "Session", "IdentityMap", "TypeCodec", "JSONCodec", "RetryPolicy", "MetricsSink", "PoolStats", "AdaptiveSizing", "BackendBudget"]
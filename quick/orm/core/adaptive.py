@@ -0,0 +1,168 @@
+from typing import Any, Iterator, Optional
+from contextlib import contextmanager
+import asyncio
+import json
+import os
+import time
+from quick.orm.exceptions import ConfigurationError
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+MIN_ADAPTIVE_LIMIT = 2
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class BackendBudget:
+    def __init__(self, path: str, limit: int):
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        if fcntl is None:
+            raise ConfigurationError(
+                "BackendBudget needs fcntl file locking, which is not available on this platform",
+                {"path": path},
+            )
+        self.path = path
+        self.limit = limit
+        self.pid = os.getpid()
+    
+    def key(self, owner: str) -> str:
+        return f"{self.pid}:{owner}"
+    
+    @contextmanager
+    def _allocations(self) -> Iterator[dict[str, int]]:
+        with open(self.path, "a+") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                handle.seek(0)
+                content = handle.read()
+                allocations = {
+                    key: count
+                    for key, count in (json.loads(content) if content else {}).items()
+                    if _alive(int(key.partition(":")[0]))
+                }
+                yield allocations
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps(allocations))
+                handle.flush()
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+    
+    def allocate(self, wanted: int, owner: str = "default", minimum: int = 1) -> int:
+        key = self.key(owner)
+        with self._allocations() as allocations:
+            others = sum(count for name, count in allocations.items() if name != key)
+            granted = max(minimum, min(wanted, self.limit - others))
+            allocations[key] = granted
+        return granted
+    
+    def release(self, owner: str = "default") -> None:
+        with self._allocations() as allocations:
+            allocations.pop(self.key(owner), None)
+    
+    def total(self) -> int:
+        with self._allocations() as allocations:
+            return sum(allocations.values())
+
+
+class AdaptiveSizing:
+    def __init__(
+        self,
+        interval: float = 1.0,
+        target_wait: float = 0.005,
+        cooldown: float = 60.0,
+        step: int = 2,
+        budget: Optional[BackendBudget] = None,
+    ):
+        if step < 1:
+            raise ValueError("step must be at least 1")
+        self.interval = interval
+        self.target_wait = target_wait
+        self.cooldown = cooldown
+        self.step = step
+        self.budget = budget
+
+
+class AdaptiveController:
+    def __init__(self, pool: Any, sizing: AdaptiveSizing):
+        self.pool = pool
+        self.sizing = sizing
+        self.ceiling = max(1, pool.config.min_pool_size, pool.config.max_pool_size)
+        self.floor = min(self.ceiling, max(MIN_ADAPTIVE_LIMIT, pool.config.min_pool_size))
+        self._acquires = 0
+        self._wait_total = 0.0
+        self._calm_since: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._owner = f"{pool.config.application_name}-{id(pool)}"
+    
+    async def start(self) -> None:
+        self.apply(await self._allocate(self.floor))
+        self._task = asyncio.create_task(self._run())
+    
+    async def _allocate(self, wanted: int) -> int:
+        if self.sizing.budget is None:
+            return wanted
+        return await asyncio.to_thread(self.sizing.budget.allocate, wanted, self._owner, self.floor)
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self.sizing.budget is not None:
+            await asyncio.to_thread(self.sizing.budget.release, self._owner)
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.sizing.interval)
+            self.apply(await self._allocate(self.target(time.monotonic())))
+    
+    def target(self, now: float) -> int:
+        monitor = self.pool.monitor
+        gate = self.pool.gate
+        limit = gate.capacity
+        
+        acquires = monitor.acquires - self._acquires
+        waited = monitor.acquire_wait.total - self._wait_total
+        self._acquires = monitor.acquires
+        self._wait_total = monitor.acquire_wait.total
+        mean_wait = waited / acquires if acquires else 0.0
+        
+        peak = monitor.peak_in_use
+        monitor.peak_in_use = monitor.in_use
+        
+        if gate.waiting or mean_wait > self.sizing.target_wait:
+            self._calm_since = None
+            return min(self.ceiling, limit + self.sizing.step)
+        
+        if peak > limit - self.sizing.step:
+            self._calm_since = None
+            return limit
+        
+        if self._calm_since is None:
+            self._calm_since = now
+        if now - self._calm_since < self.sizing.cooldown:
+            return limit
+        
+        self._calm_since = now
+        return max(self.floor, limit - self.sizing.step)
+    
+    def apply(self, limit: int) -> None:
+        limit = max(self.floor, min(limit, self.ceiling))
+        if limit != self.pool.gate.capacity:
+            self.pool.gate.resize(limit)
+        self.pool.metrics.gauge("quick.pool.limit", limit)
+
+
+__all__ = ["AdaptiveSizing", "AdaptiveController", "BackendBudget", "MIN_ADAPTIVE_LIMIT"]
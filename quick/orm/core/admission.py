@@ -0,0 +1,128 @@
+from typing import Any, Optional
+from heapq import heappop, heappush
+from itertools import count
+import asyncio
+from quick.orm.exceptions import ConfigurationError, PoolOverloadedError, PoolTimeoutError
+
+PRIORITIES = {"high": 0, "normal": 1, "low": 2}
+
+
+def priority_rank(priority: str) -> int:
+    rank = PRIORITIES.get(priority)
+    if rank is None:
+        raise ConfigurationError(
+            f"Unknown priority {priority!r}; expected one of {', '.join(PRIORITIES)}",
+            {"priority": priority},
+        )
+    return rank
+
+
+class AdmissionGate:
+    def __init__(self, capacity: int, max_waiters: Optional[int] = None):
+        self.capacity = capacity
+        self.max_waiters = max_waiters
+        self.active = 0
+        self.waiting = 0
+        self.shed = 0
+        self._queue: list[tuple[int, int, str, asyncio.Future]] = []
+        self._sequence = count()
+    
+    async def admit(self, priority: str, timeout: Optional[float] = None) -> None:
+        rank = priority_rank(priority)
+        
+        if self.active < self.capacity and not self.waiting:
+            self.active += 1
+            return
+        
+        if self.max_waiters is not None and self.waiting >= self.max_waiters:
+            self._shed(rank, priority)
+        
+        future = asyncio.get_running_loop().create_future()
+        heappush(self._queue, (rank, next(self._sequence), priority, future))
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self._abandon(future)
+            raise PoolTimeoutError(timeout, priority) from None
+        except BaseException:
+            self._abandon(future)
+            raise
+    
+    def _shed(self, rank: int, priority: str) -> None:
+        pending = [entry for entry in self._queue if not entry[3].done()]
+        victim = max(pending, default=None, key=lambda entry: (entry[0], entry[1]))
+        self.shed += 1
+        
+        if victim is None or victim[0] <= rank:
+            raise PoolOverloadedError(self.waiting, self.max_waiters, priority)
+        
+        self.waiting -= 1
+        victim[3].set_exception(PoolOverloadedError(self.waiting, self.max_waiters, victim[2]))
+    
+    def _abandon(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self.waiting -= 1
+        elif future.exception() is None:
+            self.release()
+    
+    def _wake(self) -> bool:
+        while self._queue:
+            future = heappop(self._queue)[3]
+            if not future.done():
+                self.waiting -= 1
+                future.set_result(None)
+                return True
+        return False
+    
+    def release(self) -> None:
+        if self.active > self.capacity or not self._wake():
+            self.active -= 1
+    
+    def resize(self, capacity: int) -> None:
+        self.capacity = capacity
+        while self.active < self.capacity and self._wake():
+            self.active += 1
+
+
+class AdmittedAcquire:
+    def __init__(self, gate: AdmissionGate, pool: Any, priority: str, timeout: Optional[float]):
+        self._gate = gate
+        self._pool = pool
+        self._priority = priority
+        self._timeout = timeout
+        self._context: Any = None
+    
+    async def __aenter__(self) -> Any:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await self._gate.admit(self._priority, self._timeout)
+        
+        try:
+            if self._timeout is None:
+                self._context = self._pool.acquire()
+            else:
+                remaining = max(self._timeout - (loop.time() - started), 0.001)
+                self._context = self._pool.acquire(timeout=remaining)
+            return await self._context.__aenter__()
+        except asyncio.TimeoutError:
+            self._context = None
+            self._gate.release()
+            raise PoolTimeoutError(self._timeout, self._priority) from None
+        except BaseException:
+            self._context = None
+            self._gate.release()
+            raise
+    
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if self._context is None:
+            return
+        
+        context, self._context = self._context, None
+        try:
+            await context.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._gate.release()
+
+
+__all__ = ["AdmissionGate", "AdmittedAcquire", "PRIORITIES", "priority_rank"]
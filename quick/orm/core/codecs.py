@@ -0,0 +1,140 @@
+from typing import Any, Callable, Iterable, Optional
+from uuid import UUID
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def default_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def default_loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class TypeCodec:
+    def __init__(
+        self,
+        typename: str,
+        encoder: Callable[[Any], Any],
+        decoder: Callable[[Any], Any],
+        schema: str = "pg_catalog",
+        format: str = "text",
+    ):
+        self.typename = typename
+        self.encoder = encoder
+        self.decoder = decoder
+        self.schema = schema
+        self.format = format
+    
+    async def register(self, connection: Any) -> None:
+        await connection.set_type_codec(
+            self.typename,
+            encoder=self.encoder,
+            decoder=self.decoder,
+            schema=self.schema,
+            format=self.format,
+        )
+    
+    def __repr__(self) -> str:
+        return f"TypeCodec({self.schema}.{self.typename}, format={self.format})"
+
+
+class JSONCodec:
+    def __init__(
+        self,
+        dumps: Optional[Callable[[Any], bytes | str]] = None,
+        loads: Optional[Callable[[bytes | str], Any]] = None,
+    ):
+        self.dumps = dumps or default_dumps
+        self.loads = loads or default_loads
+    
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, str):
+            return value.encode()
+        data = self.dumps(value)
+        return data.encode() if isinstance(data, str) else data
+    
+    def type_codec(self, typename: str, binary: bool = True) -> TypeCodec:
+        if not binary:
+            return TypeCodec(typename, lambda value: self.encode(value).decode(), self.loads)
+        
+        if typename == "jsonb":
+            return TypeCodec(
+                typename,
+                lambda value: b"\x01" + self.encode(value),
+                lambda data: self.loads(data[1:]),
+                format="binary",
+            )
+        return TypeCodec(typename, self.encode, self.loads, format="binary")
+
+
+def uuid_codec() -> TypeCodec:
+    return TypeCodec(
+        "uuid",
+        lambda value: (value if isinstance(value, UUID) else UUID(str(value))).bytes,
+        lambda data: UUID(bytes=data),
+        format="binary",
+    )
+
+
+def numeric_codec(decoder: Callable[[str], Any] = float) -> TypeCodec:
+    return TypeCodec("numeric", str, decoder)
+
+
+def build_codecs(config: Any, models: Iterable[type] = ()) -> list[TypeCodec]:
+    from quick.orm.exceptions import ConfigurationError
+    
+    json_codecs: dict[str, Optional[JSONCodec]] = {"json": config.json_codec, "jsonb": config.json_codec}
+    declared: dict[str, tuple[JSONCodec, str]] = dict()
+    
+    for model in models:
+        for column_name, column in model.__columns__.items():
+            codec = getattr(column, "codec", None)
+            if codec is None:
+                continue
+            
+            typename = column.metadata.sql_type.lower()
+            owner = f"{model.__name__}.{column_name}"
+            existing = declared.get(typename)
+            if existing is not None and existing[0] is not codec:
+                raise ConfigurationError(
+                    f"Conflicting {typename} codecs declared on {existing[1]} and {owner}",
+                    {"type": typename},
+                )
+            declared[typename] = (codec, owner)
+    
+    json_codecs.update({typename: codec for typename, (codec, _) in declared.items()})
+    
+    codecs = [
+        codec.type_codec(typename, config.binary_json)
+        for typename, codec in json_codecs.items()
+        if codec is not None
+    ]
+    
+    if config.native_uuid:
+        codecs.append(uuid_codec())
+    if config.numeric_as_float:
+        codecs.append(numeric_codec())
+    
+    codecs.extend(config.codecs)
+    return codecs
+
+
+__all__ = [
+    "TypeCodec",
+    "JSONCodec",
+    "default_dumps",
+    "default_loads",
+    "uuid_codec",
+    "numeric_codec",
+    "build_codecs",
+]
@@ -1,4 +1,75 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from typing import Any, Awaitable, Callable, Optional
+from quick.orm.core.adaptive import AdaptiveSizing
+from quick.orm.core.codecs import JSONCodec, TypeCodec
+from quick.orm.core.metrics import MetricsSink
+from quick.orm.core.retry import RetryPolicy
+from quick.orm.exceptions import ConfigurationError
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in ("true", "1", "yes", "on")
+
+
+def _parse_ssl(value: str) -> bool | str:
+    lowered = value.lower()
+    if lowered in ("true", "1", "yes", "on", "false", "0", "no", "off"):
+        return _parse_bool(lowered)
+    if lowered == "disable":
+        return False
+    return lowered
+
+
+URL_PARAMS: dict[str, Callable[[str], Any]] = {
+    "min_pool_size": int,
+    "max_pool_size": int,
+    "command_timeout": float,
+    "query_timeout": float,
+    "pool_recycle": int,
+    "echo": _parse_bool,
+    "ssl": _parse_ssl,
+    "sslmode": _parse_ssl,
+    "statement_cache_size": int,
+    "max_cached_statement_lifetime": float,
+    "max_cacheable_statement_size": int,
+    "max_inactive_connection_lifetime": float,
+    "max_queries": int,
+    "application_name": str,
+    "pooler_mode": str,
+    "acquire_timeout": float,
+    "max_waiters": int,
+    "default_priority": str,
+}
+
+POOLER_MODES = ("session", "transaction")
+
+DEFAULT_SERVER_SETTINGS = {"jit": "off"}
+
+URL_ALIASES = {"sslmode": "ssl"}
+
+SERVER_SETTING_PREFIX = "server_settings."
+
+DEFAULT_LANE = "default"
+
+
+@dataclass
+class LaneConfig:
+    min_pool_size: Optional[int] = None
+    max_pool_size: Optional[int] = None
+    command_timeout: Optional[float] = None
+    query_timeout: Optional[float] = None
+    acquire_timeout: Optional[float] = None
+    max_waiters: Optional[int] = None
+    default_priority: Optional[str] = None
+    adaptive: Optional[AdaptiveSizing] = None
+    server_settings: dict[str, str] = field(default_factory=dict)
+    
+    def overrides(self) -> dict[str, Any]:
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if value is not None and name != "server_settings"
+        }
 
 
 @dataclass
@@ -14,7 +85,29 @@ class DatabaseConfig:
     query_timeout: float = 60.0
     pool_recycle: int = 3600
     echo: bool = False
-    ssl: bool = False
+    ssl: bool | str = False
+    statement_cache_size: int = 100
+    max_cached_statement_lifetime: float = 300.0
+    max_cacheable_statement_size: int = 15 * 1024
+    max_inactive_connection_lifetime: float = 300.0
+    max_queries: int = 50000
+    application_name: str = "quick-opg"
+    server_settings: dict[str, str] = field(default_factory=lambda: dict(DEFAULT_SERVER_SETTINGS))
+    pooler_mode: str = "session"
+    init: Optional[Callable[[Any], Awaitable[None]]] = None
+    setup: Optional[Callable[[Any], Awaitable[None]]] = None
+    json_codec: Optional[JSONCodec] = field(default_factory=JSONCodec)
+    binary_json: bool = True
+    native_uuid: bool = False
+    numeric_as_float: bool = False
+    codecs: list[TypeCodec] = field(default_factory=list)
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    metrics: MetricsSink = field(default_factory=MetricsSink)
+    acquire_timeout: Optional[float] = None
+    max_waiters: Optional[int] = None
+    default_priority: str = "normal"
+    lanes: dict[str, LaneConfig] = field(default_factory=dict)
+    adaptive: Optional[AdaptiveSizing] = None
     
     @classmethod
     def from_url(cls, url: str) -> "DatabaseConfig":
@@ -30,19 +123,77 @@ class DatabaseConfig:
             password=parsed.password or "",
         )
         
-        if parsed.query:
-            query_params = parse_qs(parsed.query)
-            if "min_pool_size" in query_params:
-                config.min_pool_size = int(query_params["min_pool_size"][0])
-            if "max_pool_size" in query_params:
-                config.max_pool_size = int(query_params["max_pool_size"][0])
-            if "ssl" in query_params:
-                config.ssl = query_params["ssl"][0].lower() in ("true", "1", "yes")
+        for name, values in parse_qs(parsed.query).items():
+            value = values[-1]
+            if name.startswith(SERVER_SETTING_PREFIX):
+                config.server_settings[name[len(SERVER_SETTING_PREFIX):]] = value
+            elif name in URL_PARAMS:
+                setattr(config, URL_ALIASES.get(name, name), URL_PARAMS[name](value))
         
         return config
     
+    @property
+    def transaction_pooling(self) -> bool:
+        if self.pooler_mode not in POOLER_MODES:
+            raise ConfigurationError(
+                f"Unknown pooler_mode {self.pooler_mode!r}; expected one of {', '.join(POOLER_MODES)}",
+                {"pooler_mode": self.pooler_mode},
+            )
+        return self.pooler_mode == "transaction"
+    
+    def effective_statement_cache_size(self) -> int:
+        return 0 if self.transaction_pooling else self.statement_cache_size
+    
+    def session_settings(self) -> dict[str, str]:
+        settings = {"application_name": self.application_name} if self.application_name else {}
+        
+        if not self.transaction_pooling:
+            settings.update(self.server_settings)
+            return settings
+        
+        custom = {
+            name: value
+            for name, value in self.server_settings.items()
+            if name != "application_name" and DEFAULT_SERVER_SETTINGS.get(name) != value
+        }
+        if custom:
+            raise ConfigurationError(
+                f"server_settings {', '.join(sorted(custom))} cannot be set with pooler_mode='transaction'; "
+                "set them on the database role instead (ALTER ROLE ... SET)",
+                {"server_settings": custom},
+            )
+        
+        if "application_name" in self.server_settings:
+            settings["application_name"] = self.server_settings["application_name"]
+        return settings
+    
+    def require_session_pooling(self, feature: str) -> None:
+        if self.transaction_pooling:
+            raise ConfigurationError(
+                f"{feature} needs a dedicated server session and is not available with pooler_mode='transaction'",
+                {"feature": feature},
+            )
+    
+    def for_lane(self, name: str) -> "DatabaseConfig":
+        if name == DEFAULT_LANE:
+            return self
+        
+        lane = self.lanes.get(name)
+        if lane is None:
+            raise ConfigurationError(
+                f"Unknown lane {name!r}; configured lanes: {', '.join([DEFAULT_LANE, *self.lanes])}",
+                {"lane": name},
+            )
+        
+        return replace(
+            self,
+            server_settings={**self.server_settings, **lane.server_settings},
+            lanes={},
+            **lane.overrides(),
+        )
+    
     def to_dsn(self) -> str:
         return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
 
-__all__ = ["DatabaseConfig"]
+__all__ = ["DatabaseConfig", "LaneConfig", "DEFAULT_LANE"]
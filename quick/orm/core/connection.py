@@ -1,22 +1,52 @@
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar, Token
+from itertools import count
 import asyncpg
 import asyncio
+import time
+from quick.orm.core.adaptive import AdaptiveController
+from quick.orm.core.admission import AdmissionGate, AdmittedAcquire, priority_rank
+from quick.orm.core.codecs import TypeCodec, build_codecs
 from quick.orm.core.config import DatabaseConfig
+from quick.orm.core.deadline import effective_timeout
+from quick.orm.core.retry import RETRYABLE_ERRORS, infer_idempotent
+from quick.orm.core.stats import MonitoredAcquire, PoolMonitor, PoolStats
+from quick.orm.core.transaction import AmbientTransaction, BoundAcquire
+from quick.orm.exceptions import TransactionError
+
+STREAM_CURSOR = "quick_stream"
+STREAM_BATCH_SIZE = 500
 
 
 class ConnectionPool:
     def __init__(self, config: DatabaseConfig):
         self.config = config
         self._pool: Optional[asyncpg.Pool] = None
-        self.max_retries = 3
-        self.retry_delay = 1.0
+        self.retry_policy = config.retry_policy
+        self.metrics = config.metrics
+        self.monitor = PoolMonitor(config.metrics)
+        self._codecs: list[TypeCodec] = []
+        self._recycler: Optional[asyncio.Task] = None
+        self._adaptive: Optional[AdaptiveController] = None
+        self._bound: ContextVar[Optional[tuple[asyncpg.Connection, asyncio.Lock]]] = ContextVar(
+            f"quick_connection_{id(self)}", default=None
+        )
+        self._priority: ContextVar[str] = ContextVar(f"quick_priority_{id(self)}", default=config.default_priority)
+        self.gate = AdmissionGate(config.max_pool_size, config.max_waiters)
+        self._cursor_ids = count()
+        self._checkouts: dict[Any, MonitoredAcquire] = dict()
     
     async def connect(self) -> None:
         if self._pool is not None:
             return
         
-        last_error = None
-        for attempt in range(self.max_retries):
+        from quick.orm.models.decorators import get_all_models
+        self._codecs = build_codecs(self.config, get_all_models())
+        
+        started = time.monotonic()
+        attempt = 0
+        while True:
             try:
                 self._pool = await asyncpg.create_pool(
                     host=self.config.host,
@@ -27,63 +57,223 @@ class ConnectionPool:
                     min_size=self.config.min_pool_size,
                     max_size=self.config.max_pool_size,
                     command_timeout=self.config.command_timeout,
+                    max_queries=self.config.max_queries,
+                    max_inactive_connection_lifetime=self.config.max_inactive_connection_lifetime,
+                    statement_cache_size=self.config.effective_statement_cache_size(),
+                    max_cached_statement_lifetime=self.config.max_cached_statement_lifetime,
+                    max_cacheable_statement_size=self.config.max_cacheable_statement_size,
+                    server_settings=self.config.session_settings(),
+                    ssl=self.config.ssl or None,
+                    init=self._init_connection,
+                    setup=self.config.setup,
                 )
+                if self.config.pool_recycle > 0:
+                    self._recycler = asyncio.create_task(self._recycle_connections())
+                if self.config.adaptive is not None:
+                    self._adaptive = AdaptiveController(self, self.config.adaptive)
+                    await self._adaptive.start()
                 return
-            except (asyncpg.PostgresError, OSError, ConnectionRefusedError) as e:
-                last_error = e
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
-                continue
+            except RETRYABLE_ERRORS as e:
+                attempt += 1
+                delay = self.retry_policy.next_delay(e, attempt, True, time.monotonic() - started)
+                if delay is None:
+                    raise ConnectionError(f"Failed to connect after {attempt} attempts: {e}") from e
+                self._record_retry("connect", e, attempt, delay)
+                await asyncio.sleep(delay)
+    
+    async def _init_connection(self, connection: asyncpg.Connection) -> None:
+        self.monitor.track(connection)
         
-        raise ConnectionError(f"Failed to connect after {self.max_retries} attempts: {last_error}")
+        for codec in self._codecs:
+            await codec.register(connection)
+        
+        if self.config.init is not None:
+            await self.config.init(connection)
+    
+    async def _recycle_connections(self) -> None:
+        while self._pool is not None:
+            await asyncio.sleep(self.config.pool_recycle)
+            if self._pool is not None:
+                await self._pool.expire_connections()
     
     async def disconnect(self) -> None:
+        if self._recycler is not None:
+            self._recycler.cancel()
+            self._recycler = None
+        
+        if self._adaptive is not None:
+            await self._adaptive.stop()
+            self._adaptive = None
+        
         if self._pool is not None:
             await self._pool.close()
             self._pool = None
     
     async def execute(self, query: str, *args: Any) -> str:
-        if self._pool is None:
-            raise RuntimeError("Connection pool not initialized. Call connect() first.")
-        
-        return await self._execute_with_retry(lambda: self._pool.execute(query, *args))
+        return await self._run(query, lambda connection: connection.execute(query, *args, timeout=self.timeout()))
     
     async def fetch(self, query: str, *args: Any) -> list[asyncpg.Record]:
-        if self._pool is None:
-            raise RuntimeError("Connection pool not initialized. Call connect() first.")
-        
-        return await self._execute_with_retry(lambda: self._pool.fetch(query, *args))
+        return await self._run(query, lambda connection: connection.fetch(query, *args, timeout=self.timeout()))
     
     async def fetchrow(self, query: str, *args: Any) -> Optional[asyncpg.Record]:
-        if self._pool is None:
-            raise RuntimeError("Connection pool not initialized. Call connect() first.")
-        
-        return await self._execute_with_retry(lambda: self._pool.fetchrow(query, *args))
+        return await self._run(query, lambda connection: connection.fetchrow(query, *args, timeout=self.timeout()))
     
     async def fetchval(self, query: str, *args: Any, column: int = 0) -> Any:
-        if self._pool is None:
-            raise RuntimeError("Connection pool not initialized. Call connect() first.")
+        return await self._run(query, lambda connection: connection.fetchval(query, *args, column=column, timeout=self.timeout()))
+    
+    async def _run(self, query: str, operation: Callable[[asyncpg.Connection], Awaitable[Any]]) -> Any:
+        binding = self._bound.get()
+        if binding is not None:
+            connection, lock = binding
+            async with lock:
+                self.monitor.queried(connection)
+                return await operation(connection)
         
-        return await self._execute_with_retry(lambda: self._pool.fetchval(query, *args, column=column))
+        async def pooled() -> Any:
+            async with self.acquire(ambient=False) as connection:
+                self.monitor.queried(connection)
+                return await operation(connection)
+        
+        return await self._execute_with_retry(query, pooled)
     
-    async def _execute_with_retry(self, operation):
-        last_error = None
-        for attempt in range(self.max_retries):
+    async def _execute_with_retry(self, query: str, operation: Callable[[], Awaitable[Any]]) -> Any:
+        idempotent = infer_idempotent(query)
+        started = time.monotonic()
+        attempt = 0
+        
+        while True:
             try:
                 return await operation()
-            except (asyncpg.PostgresError, asyncpg.InterfaceError) as e:
-                last_error = e
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay)
-                continue
+            except RETRYABLE_ERRORS as e:
+                attempt += 1
+                delay = self.retry_policy.next_delay(e, attempt, idempotent, time.monotonic() - started)
+                if delay is None:
+                    raise
+                self._record_retry("query", e, attempt, delay)
+                await asyncio.sleep(delay)
+    
+    def _record_retry(self, operation: str, error: BaseException, attempt: int, delay: float) -> None:
+        reason = self.retry_policy.reason(error)
+        self.metrics.increment("quick.retry", operation=operation, reason=reason, attempt=attempt)
+        self.metrics.observe("quick.retry.delay", delay, operation=operation, reason=reason)
+    
+    def timeout(self, override: Optional[float] = None) -> Optional[float]:
+        if override is None:
+            return effective_timeout(self.config.query_timeout)
+        return min(override, effective_timeout(override))
+    
+    async def cursor(
+        self,
+        connection: asyncpg.Connection,
+        query: str,
+        *args: Any,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[asyncpg.Record]:
+        if not self.config.transaction_pooling:
+            async for row in connection.cursor(query, *args, timeout=self.timeout(timeout)):
+                yield row
+            return
+        
+        if not connection.is_in_transaction():
+            raise TransactionError("Cursors with pooler_mode='transaction' must run inside a transaction")
         
-        raise last_error
+        name = f"{STREAM_CURSOR}_{next(self._cursor_ids)}"
+        await connection.execute(f"DECLARE {name} NO SCROLL CURSOR FOR {query}", *args, timeout=self.timeout(timeout))
+        while True:
+            rows = await connection.fetch(f"FETCH {STREAM_BATCH_SIZE} FROM {name}", timeout=self.timeout(timeout))
+            if not rows:
+                break
+            for row in rows:
+                try:
+                    yield row
+                except GeneratorExit:
+                    await connection.execute(f"CLOSE {name}", timeout=self.timeout(timeout))
+                    raise
+        
+        await connection.execute(f"CLOSE {name}", timeout=self.timeout(timeout))
     
-    def acquire(self) -> asyncpg.pool.PoolAcquireContext:
+    def acquire(
+        self,
+        ambient: bool = True,
+        priority: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> MonitoredAcquire | BoundAcquire:
+        if ambient:
+            connection = self.bound_connection()
+            if connection is not None:
+                return BoundAcquire(connection)
+        
         if self._pool is None:
             raise RuntimeError("Connection pool not initialized. Call connect() first.")
         
-        return self._pool.acquire()
+        return MonitoredAcquire(
+            self.monitor,
+            AdmittedAcquire(
+                self.gate,
+                self._pool,
+                priority or self._priority.get(),
+                effective_timeout(timeout if timeout is not None else self.config.acquire_timeout),
+            ),
+            self._checkouts,
+        )
+    
+    async def release(self, connection: asyncpg.Connection) -> None:
+        context = self._checkouts.pop(connection, None)
+        if context is not None:
+            await context.__aexit__(None, None, None)
+    
+    @contextmanager
+    def priority(self, priority: str) -> Iterator[None]:
+        priority_rank(priority)
+        token = self._priority.set(priority)
+        try:
+            yield
+        finally:
+            self._priority.reset(token)
+    
+    def stats(self) -> PoolStats:
+        return self.monitor.snapshot(self._pool, self.config.min_pool_size, self.config.max_pool_size, self.gate.capacity)
+    
+    def transaction(
+        self,
+        isolation: Optional[str] = None,
+        readonly: bool = False,
+        deferrable: bool = False,
+    ) -> AmbientTransaction:
+        return AmbientTransaction(self, isolation, readonly, deferrable)
+    
+    @asynccontextmanager
+    async def pinned(self) -> AsyncIterator[asyncpg.Connection]:
+        connection = self.bound_connection()
+        if connection is not None:
+            yield connection
+            return
+        
+        async with self.acquire(ambient=False) as connection:
+            token = self.bind(connection)
+            try:
+                yield connection
+            finally:
+                self.unbind(token)
+    
+    def bound_connection(self) -> Optional[asyncpg.Connection]:
+        binding = self._bound.get()
+        return binding[0] if binding is not None else None
+    
+    @asynccontextmanager
+    async def serialized(self) -> AsyncIterator[None]:
+        binding = self._bound.get()
+        if binding is None:
+            yield
+            return
+        async with binding[1]:
+            yield
+    
+    def bind(self, connection: asyncpg.Connection) -> Token:
+        return self._bound.set((connection, asyncio.Lock()))
+    
+    def unbind(self, token: Token) -> None:
+        self._bound.reset(token)
     
     @property
     def is_connected(self) -> bool:
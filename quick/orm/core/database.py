@@ -1,10 +1,20 @@
-from typing import Any, Optional, Type, TypeVar, AsyncIterator
+from typing import Any, Awaitable, Callable, Iterator, Optional, Type, TypeVar, AsyncIterator
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from dataclasses import fields
+import asyncio
+import copy
 import asyncpg
-from quick.orm.core.config import DatabaseConfig
+from quick.orm.core.config import DatabaseConfig, DEFAULT_LANE
 from quick.orm.core.connection import ConnectionPool
-from quick.orm.core.transaction import Transaction
+from quick.orm.core.deadline import deadline
+from quick.orm.core.transaction import AmbientTransaction, transactional
+from quick.orm.core.session import Session
+from quick.orm.core.stats import PoolStats
 from quick.orm.models.base import Model
 from quick.orm.query.builder import QueryBuilder
+from quick.orm.query.batch import run_batch
+from quick.orm.query.prepared import PreparedQuery
 from quick.orm.query.insert import InsertBuilder
 from quick.orm.query.update import UpdateBuilder
 from quick.orm.query.delete import DeleteBuilder
@@ -12,6 +22,7 @@ from quick.orm.query.bulk import BulkInsertBuilder, BulkUpdateBuilder, BulkDelet
 from quick.orm.schema.inspector import SchemaInspector
 
 T = TypeVar("T", bound=Model)
+R = TypeVar("R")
 
 
 class Quick:
@@ -36,26 +47,50 @@ class Quick:
             max_pool_size=max_pool_size,
             **kwargs,
         )
-        self._pool = ConnectionPool(self.config)
+        self._lanes = {
+            name: ConnectionPool(self.config.for_lane(name))
+            for name in (DEFAULT_LANE, *self.config.lanes)
+        }
+        self._lane: ContextVar[str] = ContextVar(f"quick_lane_{id(self)}", default=DEFAULT_LANE)
+        self._pinned_lane: Optional[str] = None
     
     @classmethod
     def from_url(cls, url: str) -> "Quick":
         config = DatabaseConfig.from_url(url)
-        return cls(
-            host=config.host,
-            port=config.port,
-            database=config.database,
-            user=config.user,
-            password=config.password,
-            min_pool_size=config.min_pool_size,
-            max_pool_size=config.max_pool_size,
-        )
+        return cls(**{item.name: getattr(config, item.name) for item in fields(config)})
+    
+    @property
+    def _pool(self) -> ConnectionPool:
+        return self._lanes[self._pinned_lane or self._lane.get()]
     
     async def connect(self) -> None:
-        await self._pool.connect()
+        await asyncio.gather(*(pool.connect() for pool in self._lanes.values()))
     
     async def disconnect(self) -> None:
-        await self._pool.disconnect()
+        await asyncio.gather(*(pool.disconnect() for pool in self._lanes.values()))
+    
+    def _check_lane(self, name: str) -> None:
+        if name not in self._lanes:
+            self.config.for_lane(name)
+    
+    @contextmanager
+    def lane(self, name: str) -> Iterator[None]:
+        self._check_lane(name)
+        token = self._lane.set(name)
+        try:
+            yield
+        finally:
+            self._lane.reset(token)
+    
+    def using(self, name: str) -> "Quick":
+        self._check_lane(name)
+        view = copy.copy(self)
+        view._pinned_lane = name
+        return view
+    
+    @property
+    def lanes(self) -> tuple[str, ...]:
+        return tuple(self._lanes)
     
     async def __aenter__(self) -> "Quick":
         await self.connect()
@@ -76,9 +111,45 @@ class Quick:
     async def fetchval(self, query: str, *args: Any, column: int = 0) -> Any:
         return await self._pool.fetchval(query, *args, column=column)
     
-    async def transaction(self) -> Transaction:
-        connection = await self._pool.acquire().__aenter__()
-        return Transaction(connection)
+    def transaction(
+        self,
+        isolation: Optional[str] = None,
+        readonly: bool = False,
+        deferrable: bool = False,
+    ) -> AmbientTransaction:
+        return self._pool.transaction(isolation, readonly, deferrable)
+    
+    def transactional(
+        self,
+        retries: int = 5,
+        isolation: Optional[str] = "serializable",
+        readonly: bool = False,
+        deferrable: bool = False,
+    ) -> Callable[[Callable[..., Awaitable[R]]], Callable[..., Awaitable[R]]]:
+        return transactional(self._pool, retries, isolation, readonly, deferrable)
+    
+    def pool_stats(self, lane: Optional[str] = None) -> PoolStats:
+        if lane is not None:
+            return self.using(lane)._pool.stats()
+        return self._pool.stats()
+    
+    def priority(self, priority: str) -> AbstractContextManager[None]:
+        return self._pool.priority(priority)
+    
+    def deadline(self, seconds: Optional[float]) -> AbstractContextManager[None]:
+        return deadline(seconds)
+    
+    async def batch(self, *builders: QueryBuilder, parallel: bool = False) -> list[list[Any]]:
+        return await run_batch(self, builders, parallel)
+    
+    async def prepare(self, builder: QueryBuilder[T], mode: str = "all") -> PreparedQuery[T]:
+        self.config.require_session_pooling("prepare()")
+        prepared = PreparedQuery(builder, mode)
+        await prepared.warm()
+        return prepared
+    
+    def session(self) -> Session:
+        return Session(self)
     
     def select(self, model: Type[T]) -> QueryBuilder[T]:
         return QueryBuilder(model, self)
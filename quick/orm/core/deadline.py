@@ -0,0 +1,43 @@
+from typing import Iterator, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+from quick.orm.exceptions import DeadlineExceededError
+
+_deadline: ContextVar[Optional[float]] = ContextVar("quick_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    if seconds is None:
+        yield
+        return
+    if seconds <= 0:
+        raise ValueError("Deadline must be a positive number of seconds")
+    
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    expires = _deadline.get()
+    if expires is None:
+        return None
+    return expires - time.monotonic()
+
+
+def effective_timeout(default: Optional[float] = None) -> Optional[float]:
+    left = remaining()
+    if left is None:
+        return default
+    if left <= 0:
+        raise DeadlineExceededError(-left)
+    return left
+
+
+__all__ = ["deadline", "remaining", "effective_timeout"]
@@ -0,0 +1,31 @@
+from typing import Any
+
+
+class MetricsSink:
+    def increment(self, name: str, value: int = 1, **tags: Any) -> None:
+        pass
+    
+    def observe(self, name: str, value: float, **tags: Any) -> None:
+        pass
+    
+    def gauge(self, name: str, value: float, **tags: Any) -> None:
+        pass
+
+
+class RecordingMetrics(MetricsSink):
+    def __init__(self):
+        self.counters: list[tuple[str, int, dict[str, Any]]] = []
+        self.observations: list[tuple[str, float, dict[str, Any]]] = []
+        self.gauges: dict[str, float] = dict()
+    
+    def increment(self, name: str, value: int = 1, **tags: Any) -> None:
+        self.counters.append((name, value, tags))
+    
+    def observe(self, name: str, value: float, **tags: Any) -> None:
+        self.observations.append((name, value, tags))
+    
+    def gauge(self, name: str, value: float, **tags: Any) -> None:
+        self.gauges[name] = value
+
+
+__all__ = ["MetricsSink", "RecordingMetrics"]
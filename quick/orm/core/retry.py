@@ -0,0 +1,128 @@
+from typing import Optional
+import asyncio
+import random
+import re
+import asyncpg
+
+TRANSIENT = "transient"
+UNCERTAIN = "uncertain"
+PERMANENT = "permanent"
+
+TRANSIENT_SQLSTATES = frozenset({
+    "40001",
+    "40P01",
+    "53300",
+    "57P03",
+    "08001",
+    "08004",
+})
+
+UNCERTAIN_SQLSTATES = frozenset({
+    "57P01",
+    "57P02",
+})
+
+_LEADING_KEYWORD = re.compile(r"^\s*(?:/\*.*?\*/\s*|--[^\n]*\n\s*)*(\w+)", re.DOTALL)
+
+_WRITE_VERB = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+_ANALYZE = re.compile(r"\bANALYZE\b", re.IGNORECASE)
+
+_DO_NOTHING = re.compile(r"\bON\s+CONFLICT\b.*\bDO\s+NOTHING\b", re.IGNORECASE | re.DOTALL)
+
+
+def infer_idempotent(query: str) -> bool:
+    match = _LEADING_KEYWORD.match(query)
+    if match is None:
+        return False
+    
+    keyword = match.group(1).upper()
+    
+    if keyword in ("SELECT", "SHOW", "VALUES", "TABLE"):
+        return True
+    if keyword == "EXPLAIN":
+        return _ANALYZE.search(query) is None
+    if keyword == "WITH":
+        return _WRITE_VERB.search(query) is None
+    if keyword == "INSERT":
+        return _DO_NOTHING.search(query) is not None
+    return False
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.05,
+        max_delay: float = 2.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        deadline: Optional[float] = 10.0,
+        retry_uncertain: bool = True,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_uncertain = retry_uncertain
+    
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        return cls(max_attempts=1)
+    
+    def classify(self, error: BaseException) -> str:
+        sqlstate = getattr(error, "sqlstate", None)
+        
+        if sqlstate in TRANSIENT_SQLSTATES:
+            return TRANSIENT
+        if sqlstate in UNCERTAIN_SQLSTATES or (sqlstate or "").startswith("08"):
+            return UNCERTAIN
+        if isinstance(error, TimeoutError):
+            return PERMANENT
+        if isinstance(error, ConnectionRefusedError):
+            return TRANSIENT
+        if isinstance(error, (asyncpg.ConnectionDoesNotExistError, OSError)):
+            return UNCERTAIN
+        return PERMANENT
+    
+    def backoff(self, attempt: int) -> float:
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+    
+    def next_delay(self, error: BaseException, attempt: int, idempotent: bool, elapsed: float) -> Optional[float]:
+        if attempt >= self.max_attempts:
+            return None
+        
+        kind = self.classify(error)
+        if kind == PERMANENT:
+            return None
+        if kind == UNCERTAIN and not (idempotent and self.retry_uncertain):
+            return None
+        
+        delay = self.backoff(attempt)
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+    
+    @staticmethod
+    def reason(error: BaseException) -> str:
+        return getattr(error, "sqlstate", None) or type(error).__name__
+
+
+RETRYABLE_ERRORS = (asyncpg.PostgresError, asyncpg.InterfaceError, OSError, asyncio.TimeoutError)
+
+
+__all__ = [
+    "RetryPolicy",
+    "infer_idempotent",
+    "TRANSIENT",
+    "UNCERTAIN",
+    "PERMANENT",
+    "TRANSIENT_SQLSTATES",
+    "UNCERTAIN_SQLSTATES",
+    "RETRYABLE_ERRORS",
+]
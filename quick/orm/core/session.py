@@ -0,0 +1,311 @@
+from typing import Any, Optional, Type, TypeVar
+from contextlib import AbstractContextManager
+from contextvars import Token
+import asyncpg
+from quick.orm.core.transaction import Transaction
+from quick.orm.models.base import Model
+from quick.orm.query.builder import QueryBuilder
+from quick.orm.query.bulk import BulkInsertBuilder
+
+T = TypeVar("T", bound=Model)
+
+
+class IdentityMap:
+    def __init__(self):
+        self._instances: dict[tuple[type, Any], Model] = dict()
+    
+    @staticmethod
+    def key_for(model_class: type[Model], values: Any) -> Optional[tuple[type, Any]]:
+        primary_keys = model_class.get_primary_keys()
+        if not primary_keys:
+            return None
+        
+        try:
+            identity = tuple(values[name] for name in primary_keys)
+        except (KeyError, IndexError):
+            return None
+        
+        if any(value is None for value in identity):
+            return None
+        
+        return model_class, identity[0] if len(identity) == 1 else identity
+    
+    def identity_of(self, instance: Model) -> Optional[tuple[type, Any]]:
+        primary_keys = instance.get_primary_keys()
+        return self.key_for(type(instance), dict(zip(primary_keys, instance._identity_values())))
+    
+    def get(self, model_class: type[T], primary_key: Any) -> Optional[T]:
+        return self._instances.get((model_class, primary_key))
+    
+    def add(self, instance: Model) -> None:
+        key = self.identity_of(instance)
+        if key is not None:
+            self._instances[key] = instance
+    
+    def remove(self, instance: Model) -> None:
+        key = self.identity_of(instance)
+        if key is not None:
+            self._instances.pop(key, None)
+    
+    def load(self, model_class: type[T], record: Any, lazy: bool = False, deferred: Any = None) -> T:
+        key = self.key_for(model_class, record)
+        
+        if key is not None:
+            existing = self._instances.get(key)
+            if existing is not None:
+                return existing
+        
+        instance = model_class._hydrate(record, lazy, deferred)
+        
+        if key is not None:
+            self._instances[key] = instance
+        
+        return instance
+    
+    def values(self) -> list[Model]:
+        return list(self._instances.values())
+    
+    def clear(self) -> None:
+        self._instances.clear()
+    
+    def __contains__(self, instance: Model) -> bool:
+        key = self.identity_of(instance)
+        return key is not None and self._instances.get(key) is instance
+    
+    def __len__(self) -> int:
+        return len(self._instances)
+
+
+class Session:
+    def __init__(self, database: Any):
+        self._database = database
+        self._pool = database._pool
+        self.identity_map = IdentityMap()
+        self._new: list[Model] = []
+        self._deleted: list[Model] = []
+        self._acquire_context: Any = None
+        self._transaction: Optional[Transaction] = None
+        self._token: Optional[Token] = None
+    
+    async def __aenter__(self) -> "Session":
+        acquire_context = self._pool.acquire()
+        connection = await acquire_context.__aenter__()
+        token = None if self._pool.bound_connection() is connection else self._pool.bind(connection)
+        transaction = Transaction(connection)
+        
+        try:
+            async with self._pool.serialized():
+                await transaction.__aenter__()
+        except BaseException:
+            if token is not None:
+                self._pool.unbind(token)
+            await acquire_context.__aexit__(None, None, None)
+            raise
+        
+        self._acquire_context = acquire_context
+        self._transaction = transaction
+        self._token = token
+        return self
+    
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        try:
+            if exc_type is None:
+                try:
+                    await self.flush()
+                except BaseException as e:
+                    async with self._pool.serialized():
+                        await self._transaction.__aexit__(type(e), e, e.__traceback__)
+                    raise
+            async with self._pool.serialized():
+                await self._transaction.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._transaction = None
+            if self._token is not None:
+                self._pool.unbind(self._token)
+                self._token = None
+            await self._acquire_context.__aexit__(None, None, None)
+            self._acquire_context = None
+    
+    def _require_transaction(self) -> Transaction:
+        if self._transaction is None:
+            raise RuntimeError("Session not started. Use 'async with db.session()'.")
+        return self._transaction
+    
+    async def execute(self, query: str, *args: Any) -> str:
+        transaction = self._require_transaction()
+        async with self._pool.serialized():
+            return await transaction.execute(query, *args)
+    
+    async def fetch(self, query: str, *args: Any) -> list[asyncpg.Record]:
+        transaction = self._require_transaction()
+        async with self._pool.serialized():
+            return await transaction.fetch(query, *args)
+    
+    async def fetchrow(self, query: str, *args: Any) -> Optional[asyncpg.Record]:
+        transaction = self._require_transaction()
+        async with self._pool.serialized():
+            return await transaction.fetchrow(query, *args)
+    
+    async def fetchval(self, query: str, *args: Any, column: int = 0) -> Any:
+        transaction = self._require_transaction()
+        async with self._pool.serialized():
+            return await transaction.fetchval(query, *args, column=column)
+    
+    def deadline(self, seconds: Optional[float]) -> AbstractContextManager[None]:
+        return self._database.deadline(seconds)
+    
+    def using(self, name: str) -> "Session":
+        self._database._check_lane(name)
+        if self._database._lanes[name] is not self._pool:
+            raise ValueError(f"Session runs on a single connection and cannot switch to lane {name!r}")
+        return self
+    
+    def select(self, model: Type[T]) -> QueryBuilder[T]:
+        return QueryBuilder(model, self)
+    
+    async def get(self, model: Type[T], primary_key: Any) -> Optional[T]:
+        instance = self.identity_map.get(model, primary_key)
+        if instance is not None:
+            return instance
+        
+        primary_keys = model.get_primary_keys()
+        values = primary_key if len(primary_keys) > 1 else (primary_key,)
+        
+        builder = self.select(model)
+        for index, name in enumerate(primary_keys):
+            builder = builder.where(f"{name} = ${index + 1}", values[index])
+        
+        return await builder.first()
+    
+    def add(self, instance: Model) -> None:
+        if instance in self.identity_map or any(instance is new for new in self._new):
+            return
+        self._new.append(instance)
+    
+    def add_all(self, instances: list[Model]) -> None:
+        for instance in instances:
+            self.add(instance)
+    
+    def delete(self, instance: Model) -> None:
+        for index, new in enumerate(self._new):
+            if new is instance:
+                del self._new[index]
+                return
+        
+        if instance not in self.identity_map:
+            raise ValueError(f"{type(instance).__name__} instance is not persistent in this session")
+        
+        self._deleted.append(instance)
+    
+    @property
+    def new(self) -> list[Model]:
+        return list(self._new)
+    
+    @property
+    def dirty(self) -> list[Model]:
+        return [
+            instance
+            for instance in self.identity_map.values()
+            if instance.has_changes() and not self._is_deleted(instance)
+        ]
+    
+    @property
+    def deleted(self) -> list[Model]:
+        return list(self._deleted)
+    
+    def _is_deleted(self, instance: Model) -> bool:
+        return any(instance is deleted for deleted in self._deleted)
+    
+    async def flush(self) -> None:
+        transaction = self._require_transaction()
+        
+        await self._flush_inserts(transaction)
+        await self._flush_updates(transaction)
+        await self._flush_deletes(transaction)
+    
+    async def _flush_inserts(self, transaction: Transaction) -> None:
+        groups: dict[tuple[type, tuple[str, ...]], list[tuple[Model, dict[str, Any]]]] = dict()
+        
+        for instance in self._new:
+            record = {
+                name: value
+                for name, value in instance.to_dict().items()
+                if value is not None or not instance.__columns__[name].is_generated
+            }
+            groups.setdefault((type(instance), tuple(record)), []).append((instance, record))
+        
+        for (model_class, _), entries in groups.items():
+            builder = BulkInsertBuilder(model_class, self).values(*(record for _, record in entries)).returning()
+            rows: list[asyncpg.Record] = []
+            
+            for chunk in builder._chunks():
+                query, params = builder._build_bulk_insert_query(chunk)
+                rows.extend(await transaction.fetch(query, *params))
+            
+            for (instance, _), row in zip(entries, rows):
+                for name in instance.__columns__:
+                    if name in row.keys():
+                        setattr(instance, name, row[name])
+                instance._mark_clean()
+                self.identity_map.add(instance)
+        
+        self._new.clear()
+    
+    async def _flush_updates(self, transaction: Transaction) -> None:
+        groups: dict[tuple[type, tuple[str, ...]], list[Model]] = dict()
+        
+        for instance in self.dirty:
+            groups.setdefault((type(instance), tuple(instance.get_changes())), []).append(instance)
+        
+        for (model_class, changed), instances in groups.items():
+            if model_class.__version_column__ is not None:
+                for instance in instances:
+                    await instance.save(self)
+                continue
+            
+            primary_keys = model_class.get_primary_keys()
+            set_clause = ", ".join(f"{name} = ${index + 1}" for index, name in enumerate(changed))
+            where_clause = " AND ".join(
+                f"{name} = ${len(changed) + index + 1}" for index, name in enumerate(primary_keys)
+            )
+            query = f"UPDATE {model_class.get_table_name()} SET {set_clause} WHERE {where_clause}"
+            
+            await transaction.executemany(query, [
+                tuple(getattr(instance, name) for name in changed)
+                + tuple(instance._identity_values())
+                for instance in instances
+            ])
+            
+            for instance in instances:
+                instance._mark_clean()
+    
+    async def _flush_deletes(self, transaction: Transaction) -> None:
+        groups: dict[type, list[Model]] = dict()
+        
+        for instance in self._deleted:
+            groups.setdefault(type(instance), []).append(instance)
+        
+        for model_class, instances in groups.items():
+            primary_keys = model_class.get_primary_keys()
+            table_name = model_class.get_table_name()
+            
+            if len(primary_keys) == 1:
+                key = primary_keys[0]
+                await transaction.execute(
+                    f"DELETE FROM {table_name} WHERE {key} = ANY($1)",
+                    [instance._identity_values()[0] for instance in instances],
+                )
+            else:
+                where_clause = " AND ".join(f"{name} = ${index + 1}" for index, name in enumerate(primary_keys))
+                await transaction.executemany(
+                    f"DELETE FROM {table_name} WHERE {where_clause}",
+                    [tuple(instance._identity_values()) for instance in instances],
+                )
+            
+            for instance in instances:
+                self.identity_map.remove(instance)
+        
+        self._deleted.clear()
+
+
+__all__ = ["Session", "IdentityMap"]
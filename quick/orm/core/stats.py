@@ -0,0 +1,225 @@
+from typing import Any, Optional
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from weakref import WeakKeyDictionary
+import asyncio
+import time
+from quick.orm.exceptions import PoolOverloadedError
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LIFETIME_BUCKETS = (1.0, 10.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 14400.0, 86400.0)
+COUNT_BUCKETS = (1, 10, 100, 1000, 10000, 50000, 100000, 1000000)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+    
+    def percentile(self, quantile: float) -> float:
+        if not self.count:
+            return 0.0
+        
+        rank = quantile * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self.buckets[index], self.max) if index < len(self.buckets) else self.max
+        return self.max
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    def summary(self) -> "HistogramSummary":
+        return HistogramSummary(
+            count=self.count,
+            mean=self.mean,
+            p50=self.percentile(0.5),
+            p95=self.percentile(0.95),
+            p99=self.percentile(0.99),
+            max=self.max,
+        )
+
+
+@dataclass(frozen=True)
+class HistogramSummary:
+    count: int = 0
+    mean: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int = 0
+    min_size: int = 0
+    max_size: int = 0
+    limit: int = 0
+    in_use: int = 0
+    idle: int = 0
+    waiting: int = 0
+    acquires: int = 0
+    timeouts: int = 0
+    rejected: int = 0
+    queries: int = 0
+    connections_opened: int = 0
+    connections_closed: int = 0
+    acquire_wait: HistogramSummary = field(default_factory=HistogramSummary)
+    connection_lifetime: HistogramSummary = field(default_factory=HistogramSummary)
+    queries_per_connection: HistogramSummary = field(default_factory=HistogramSummary)
+    
+    @property
+    def utilization(self) -> float:
+        return self.in_use / self.limit if self.limit else 0.0
+    
+    @property
+    def saturated(self) -> bool:
+        return self.waiting > 0 and self.in_use >= self.limit
+
+
+class PoolMonitor:
+    def __init__(self, metrics: Any):
+        self.metrics = metrics
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.waiting = 0
+        self.acquires = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.queries = 0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.acquire_wait = Histogram(LATENCY_BUCKETS)
+        self.connection_lifetime = Histogram(LIFETIME_BUCKETS)
+        self.queries_per_connection = Histogram(COUNT_BUCKETS)
+        self._connections: "WeakKeyDictionary[Any, list[float]]" = WeakKeyDictionary()
+    
+    def track(self, connection: Any) -> None:
+        entry = [time.monotonic(), 0]
+        self._connections[connection] = entry
+        self.connections_opened += 1
+        connection.add_termination_listener(self._connection_closed)
+    
+    def queried(self, connection: Any) -> None:
+        self.queries += 1
+        entry = self._connections.get(getattr(connection, "_con", connection))
+        if entry is not None:
+            entry[1] += 1
+    
+    def _connection_closed(self, connection: Any) -> None:
+        entry = self._connections.pop(connection, None)
+        self.connections_closed += 1
+        if entry is None:
+            return
+        
+        lifetime = time.monotonic() - entry[0]
+        self.connection_lifetime.observe(lifetime)
+        self.queries_per_connection.observe(entry[1])
+        self.metrics.observe("quick.pool.connection_lifetime", lifetime)
+        self.metrics.observe("quick.pool.connection_queries", entry[1])
+    
+    def waited(self, seconds: float) -> None:
+        self.acquires += 1
+        self.acquire_wait.observe(seconds)
+        self.metrics.observe("quick.pool.acquire_wait", seconds)
+        self.metrics.gauge("quick.pool.in_use", self.in_use)
+        self.metrics.gauge("quick.pool.waiting", self.waiting)
+    
+    def timed_out(self) -> None:
+        self.timeouts += 1
+        self.metrics.increment("quick.pool.timeout")
+    
+    def overloaded(self, error: PoolOverloadedError) -> None:
+        self.rejected += 1
+        self.metrics.increment("quick.pool.rejected", priority=error.priority)
+    
+    def snapshot(self, pool: Optional[Any], min_size: int, max_size: int, limit: int) -> PoolStats:
+        size = pool.get_size() if pool is not None else 0
+        idle = pool.get_idle_size() if pool is not None else 0
+        return PoolStats(
+            size=size,
+            min_size=min_size,
+            max_size=max_size,
+            limit=limit,
+            in_use=self.in_use,
+            idle=idle,
+            waiting=self.waiting,
+            acquires=self.acquires,
+            timeouts=self.timeouts,
+            rejected=self.rejected,
+            queries=self.queries,
+            connections_opened=self.connections_opened,
+            connections_closed=self.connections_closed,
+            acquire_wait=self.acquire_wait.summary(),
+            connection_lifetime=self.connection_lifetime.summary(),
+            queries_per_connection=self.queries_per_connection.summary(),
+        )
+
+
+class MonitoredAcquire:
+    def __init__(self, monitor: PoolMonitor, context: Any, checkouts: dict[Any, "MonitoredAcquire"]):
+        self._monitor = monitor
+        self._context = context
+        self._checkouts = checkouts
+        self._acquired = False
+    
+    async def __aenter__(self) -> Any:
+        monitor = self._monitor
+        monitor.waiting += 1
+        started = time.perf_counter()
+        try:
+            connection = await self._context.__aenter__()
+        except asyncio.TimeoutError:
+            monitor.timed_out()
+            raise
+        except PoolOverloadedError as e:
+            monitor.overloaded(e)
+            raise
+        finally:
+            monitor.waiting -= 1
+        
+        monitor.in_use += 1
+        if monitor.in_use > monitor.peak_in_use:
+            monitor.peak_in_use = monitor.in_use
+        self._acquired = True
+        monitor.waited(time.perf_counter() - started)
+        return connection
+    
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if self._acquired:
+            self._acquired = False
+            self._monitor.in_use -= 1
+        await self._context.__aexit__(exc_type, exc_val, exc_tb)
+    
+    def __await__(self):
+        async def checkout() -> Any:
+            connection = await self.__aenter__()
+            self._checkouts[connection] = self
+            return connection
+        return checkout().__await__()
+
+
+__all__ = [
+    "Histogram",
+    "HistogramSummary",
+    "PoolStats",
+    "PoolMonitor",
+    "MonitoredAcquire",
+    "LATENCY_BUCKETS",
+    "LIFETIME_BUCKETS",
+    "COUNT_BUCKETS",
+]
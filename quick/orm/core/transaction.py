@@ -1,15 +1,46 @@
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+from functools import wraps
+import asyncio
 import asyncpg
 from contextlib import asynccontextmanager
+from quick.orm.core.deadline import effective_timeout
+
+R = TypeVar("R")
+
+ISOLATION_LEVELS = ("read_committed", "repeatable_read", "serializable")
+
+SERIALIZATION_ERRORS = (asyncpg.SerializationError, asyncpg.DeadlockDetectedError)
+
+
+def _check_options(isolation: Optional[str], deferrable: bool, readonly: bool) -> None:
+    if isolation is not None and isolation not in ISOLATION_LEVELS:
+        raise ValueError(f"Unknown isolation level {isolation!r}, expected one of {', '.join(ISOLATION_LEVELS)}")
+    if deferrable and not (readonly and isolation == "serializable"):
+        raise ValueError("deferrable requires readonly=True and isolation='serializable'")
 
 
 class Transaction:
-    def __init__(self, connection: asyncpg.Connection):
+    def __init__(
+        self,
+        connection: asyncpg.Connection,
+        isolation: Optional[str] = None,
+        readonly: bool = False,
+        deferrable: bool = False,
+    ):
+        _check_options(isolation, deferrable, readonly)
         self._connection = connection
         self._transaction: Optional[asyncpg.transaction.Transaction] = None
+        self.isolation = isolation
+        self.readonly = readonly
+        self.deferrable = deferrable
+        self.nested = False
     
     async def __aenter__(self) -> "Transaction":
-        self._transaction = self._connection.transaction()
+        self._transaction = self._connection.transaction(
+            isolation=self.isolation,
+            readonly=self.readonly,
+            deferrable=self.deferrable,
+        )
         await self._transaction.start()
         return self
     
@@ -35,16 +66,130 @@ class Transaction:
         await self._transaction.rollback()
     
     async def execute(self, query: str, *args: Any) -> str:
-        return await self._connection.execute(query, *args)
+        return await self._connection.execute(query, *args, timeout=effective_timeout())
+    
+    async def executemany(self, query: str, args: list[tuple[Any, ...]]) -> None:
+        await self._connection.executemany(query, args, timeout=effective_timeout())
     
     async def fetch(self, query: str, *args: Any) -> list[asyncpg.Record]:
-        return await self._connection.fetch(query, *args)
+        return await self._connection.fetch(query, *args, timeout=effective_timeout())
     
     async def fetchrow(self, query: str, *args: Any) -> Optional[asyncpg.Record]:
-        return await self._connection.fetchrow(query, *args)
+        return await self._connection.fetchrow(query, *args, timeout=effective_timeout())
     
     async def fetchval(self, query: str, *args: Any, column: int = 0) -> Any:
-        return await self._connection.fetchval(query, *args, column=column)
+        return await self._connection.fetchval(query, *args, column=column, timeout=effective_timeout())
+
+
+class BoundAcquire:
+    def __init__(self, connection: asyncpg.Connection):
+        self._connection = connection
+    
+    async def __aenter__(self) -> asyncpg.Connection:
+        return self._connection
+    
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        return None
+    
+    def __await__(self):
+        async def connection() -> asyncpg.Connection:
+            return self._connection
+        return connection().__await__()
+
+
+class AmbientTransaction:
+    def __init__(
+        self,
+        pool: Any,
+        isolation: Optional[str] = None,
+        readonly: bool = False,
+        deferrable: bool = False,
+    ):
+        _check_options(isolation, deferrable, readonly)
+        self._pool = pool
+        self._options = {"isolation": isolation, "readonly": readonly, "deferrable": deferrable}
+        self._acquire_context: Any = None
+        self._token: Any = None
+        self._transaction: Optional[Transaction] = None
+    
+    async def __aenter__(self) -> Transaction:
+        connection = self._pool.bound_connection()
+        
+        if connection is None:
+            self._acquire_context = self._pool.acquire(ambient=False)
+            connection = await self._acquire_context.__aenter__()
+            self._token = self._pool.bind(connection)
+        
+        self._transaction = Transaction(connection, **self._options)
+        self._transaction.nested = self._token is None
+        try:
+            async with self._pool.serialized():
+                await self._transaction.__aenter__()
+        except BaseException:
+            await self._release()
+            raise
+        return self._transaction
+    
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        try:
+            if self._transaction is not None:
+                async with self._pool.serialized():
+                    await self._transaction.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._transaction = None
+            await self._release()
+    
+    async def _release(self) -> None:
+        if self._token is not None:
+            self._pool.unbind(self._token)
+            self._token = None
+        
+        if self._acquire_context is not None:
+            acquire_context, self._acquire_context = self._acquire_context, None
+            await acquire_context.__aexit__(None, None, None)
+
+
+def transactional(
+    pool: Any,
+    retries: int = 5,
+    isolation: Optional[str] = None,
+    readonly: bool = False,
+    deferrable: bool = False,
+) -> Callable[[Callable[..., Awaitable[R]]], Callable[..., Awaitable[R]]]:
+    if retries < 0:
+        raise ValueError("retries cannot be negative")
+    _check_options(isolation, deferrable, readonly)
+    
+    def decorator(function: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+        @wraps(function)
+        async def wrapper(*args: Any, **kwargs: Any) -> R:
+            if pool.bound_connection() is not None:
+                async with pool.transaction():
+                    return await function(*args, **kwargs)
+            
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    async with pool.transaction(isolation, readonly, deferrable):
+                        return await function(*args, **kwargs)
+                except SERIALIZATION_ERRORS as e:
+                    if attempt > retries:
+                        raise
+                    delay = pool.retry_policy.backoff(attempt)
+                    pool._record_retry("transaction", e, attempt, delay)
+                    await asyncio.sleep(delay)
+        
+        return wrapper
+    
+    return decorator
 
 
-__all__ = ["Transaction"]
+__all__ = [
+    "Transaction",
+    "AmbientTransaction",
+    "BoundAcquire",
+    "transactional",
+    "ISOLATION_LEVELS",
+    "SERIALIZATION_ERRORS",
+]
@@ -26,6 +26,15 @@ class ValidationError(QuickORMError):
         self.value = value
 
 
+class BatchValidationError(QuickORMError):
+    def __init__(self, model: str, errors: dict[int, list[ValidationError]]):
+        count = sum(len(row_errors) for row_errors in errors.values())
+        message = f"{count} validation errors in {len(errors)} {model} rows"
+        super().__init__(message, {"model": model, "errors": errors})
+        self.model = model
+        self.errors = errors
+
+
 class ModelNotFoundError(QuickORMError):
     def __init__(self, model: str, conditions: Optional[dict] = None):
         message = f"Model {model} not found"
@@ -62,11 +71,57 @@ class DuplicateEntryError(QuickORMError):
         self.key = key
 
 
+class VersionConflictError(QuickORMError):
+    def __init__(self, model: str, expected_version: Any = None, key: Any = None):
+        message = f"Version conflict on {model}"
+        if key is not None:
+            message += f" {key}"
+        if expected_version is not None:
+            message += f": expected version {expected_version} was already changed"
+        super().__init__(message, {"model": model, "expected_version": expected_version, "key": key})
+        self.model = model
+        self.expected_version = expected_version
+        self.key = key
+
+
+class DeferredColumnError(QuickORMError):
+    def __init__(self, model: str, column: str):
+        message = f"Column {model}.{column} was deferred; await load_deferred() before reading it"
+        super().__init__(message, {"model": model, "column": column})
+        self.model = model
+        self.column = column
+
+
+class PoolOverloadedError(QuickORMError):
+    def __init__(self, waiting: int, max_waiters: int, priority: str):
+        message = f"Connection pool overloaded: {waiting} waiters already queued (max_waiters={max_waiters}), rejected {priority} request"
+        super().__init__(message, {"waiting": waiting, "max_waiters": max_waiters, "priority": priority})
+        self.waiting = waiting
+        self.max_waiters = max_waiters
+        self.priority = priority
+
+
+class PoolTimeoutError(QuickORMError, TimeoutError):
+    def __init__(self, timeout: float, priority: str):
+        message = f"Timed out after {timeout}s waiting for a {priority} connection"
+        super().__init__(message, {"timeout": timeout, "priority": priority})
+        self.timeout = timeout
+        self.priority = priority
+
+
+class DeadlineExceededError(QuickORMError, TimeoutError):
+    def __init__(self, overdue: float):
+        message = f"Deadline exceeded {overdue:.3f}s before the query could start"
+        super().__init__(message, {"overdue": overdue})
+        self.overdue = overdue
+
+
 __all__ = [
     "QuickORMError",
     "ConnectionError",
     "QueryError",
     "ValidationError",
+    "BatchValidationError",
     "ModelNotFoundError",
     "RelationError",
     "MigrationError",
@@ -74,4 +129,9 @@ __all__ = [
     "TransactionError",
     "SchemaError",
     "DuplicateEntryError",
+    "VersionConflictError",
+    "DeferredColumnError",
+    "PoolOverloadedError",
+    "PoolTimeoutError",
+    "DeadlineExceededError",
 ]
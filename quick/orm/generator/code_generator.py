@@ -21,6 +21,7 @@ class CodeGenerator:
         "jsonb": "columns.JSONB",
         "binary": "columns.Binary",
         "array": "columns.Array",
+        "version": "columns.Version",
     }
     
     VALIDATOR_TYPE_MAP = {
@@ -161,7 +162,10 @@ class CodeGenerator:
         lines.append("")
         lines.append("")
         lines.append(f'@models.table("{table_name}")')
-        lines.append(f"class {model_name}(models.Model):")
+        if model.get("slots"):
+            lines.append(f"class {model_name}(models.Model, slots=True):")
+        else:
+            lines.append(f"class {model_name}(models.Model):")
         
         for column in model["columns"]:
             lines.append(self.generate_column(column))
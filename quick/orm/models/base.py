@@ -1,5 +1,14 @@
-from typing import Any, Type, get_type_hints
+from typing import Any, Optional, Type, get_type_hints
+import copy
 from quick.orm.columns.base import Column
+from quick.orm.columns.special import Version
+from quick.orm.exceptions import VersionConflictError, DeferredColumnError
+from quick.orm.models.compiler import compile_init, compile_from_record, has_custom_init
+
+
+SLOT_NAMES = ("__relations__", "__record__", "__deferred__", "_original", "_changed")
+
+MUTABLE_TYPES = (dict, list, set, bytearray)
 
 
 class ModelMeta(type):
@@ -10,10 +19,8 @@ class ModelMeta(type):
         namespace: dict[str, Any],
         **kwargs: Any,
     ) -> Type["Model"]:
-        cls = super().__new__(mcs, name, bases, namespace)
-        
         if name == "Model":
-            return cls
+            return super().__new__(mcs, name, bases, namespace)
         
         columns: dict[str, Column] = dict()
         
@@ -25,11 +32,51 @@ class ModelMeta(type):
             if isinstance(attr_value, Column):
                 columns[attr_name] = attr_value
         
+        inherited_slots = any(getattr(base, "__slotted__", False) for base in bases)
+        slotted = kwargs.get("slots", inherited_slots)
+        
+        if inherited_slots and not slotted:
+            raise TypeError(f"{name} cannot disable slots inherited from a slotted model")
+        
+        if slotted and "__slots__" not in namespace:
+            unslotted = [column_name for column_name, column in columns.items() if column._slot is None]
+            base_slots = () if inherited_slots else SLOT_NAMES
+            namespace["__slots__"] = base_slots + tuple(mcs._slot_name(column_name) for column_name in unslotted)
+        
+        cls = super().__new__(mcs, name, bases, namespace)
+        
+        if slotted:
+            for column_name, column in list(columns.items()):
+                if column._slot is not None:
+                    continue
+                if column_name not in namespace:
+                    column = copy.copy(column)
+                    setattr(cls, column_name, column)
+                    columns[column_name] = column
+                column._slot = cls.__dict__[mcs._slot_name(column_name)]
+        
         cls.__columns__ = columns
+        cls.__column_positions__ = {column_name: index for index, column_name in enumerate(columns)}
+        cls.__slotted__ = slotted
+        cls.__lazy__ = kwargs.get("lazy", any(getattr(base, "__lazy__", False) for base in bases))
+        cls.__version_column__ = next(
+            (column_name for column_name, column in columns.items() if isinstance(column, Version)),
+            None,
+        )
         cls.__table_name__ = getattr(cls, "__table_name__", None) or mcs._get_table_name(name)
         
+        if has_custom_init(cls, Model):
+            cls._from_record = classmethod(Model._from_record.__func__)
+        else:
+            cls.__init__ = compile_init(cls)
+            cls._from_record = classmethod(compile_from_record(cls))
+        
         return cls
     
+    @staticmethod
+    def _slot_name(column_name: str) -> str:
+        return f"_value_{column_name}"
+    
     @staticmethod
     def _get_table_name(class_name: str) -> str:
         import re
@@ -42,12 +89,29 @@ class ModelMeta(type):
 class Model(metaclass=ModelMeta):
     __table_name__: str
     __columns__: dict[str, Column]
+    __version_column__: Optional[str] = None
+    __column_positions__: dict[str, int]
+    __slotted__: bool = False
+    __lazy__: bool = False
+    __slots__ = ()
+    __relations__: Optional[dict[str, Any]] = None
+    __record__: Any = None
+    __deferred__: Any = None
+    _original: Optional[tuple[Any, ...]] = None
+    _changed: Optional[set[str]] = None
     
     def __init__(self, **kwargs: Any):
+        if self.__slotted__:
+            self.__relations__ = None
+            self.__record__ = None
+            self.__deferred__ = None
+            self._original = None
+            self._changed = None
+        
         for column_name, column in self.__columns__.items():
             value = kwargs.get(column_name)
             
-            if value is None and column.metadata.default is not None:
+            if value is None and column.metadata.default is not None and not column.metadata.server_generated:
                 if callable(column.metadata.default):
                     value = column.metadata.default()
                 else:
@@ -57,17 +121,218 @@ class Model(metaclass=ModelMeta):
     
     def __repr__(self) -> str:
         attrs = ", ".join(
-            f"{name}={getattr(self, name, None)!r}"
+            f"{name}={self._peek(name)!r}"
             for name in self.__columns__.keys()
         )
         return f"{self.__class__.__name__}({attrs})"
     
     def to_dict(self) -> dict[str, Any]:
+        deferred = self.deferred_columns
         return {
             name: getattr(self, name, None)
             for name in self.__columns__.keys()
+            if name not in deferred or self._is_loaded(name)
         }
     
+    def _is_loaded(self, name: str) -> bool:
+        try:
+            getattr(self, name)
+        except DeferredColumnError:
+            return False
+        return True
+    
+    @classmethod
+    def _from_record(cls, record: Any) -> "Model":
+        instance = cls(**dict(record))
+        instance._mark_clean()
+        return instance
+    
+    @classmethod
+    def _from_record_lazy(cls, record: Any) -> "Model":
+        instance = object.__new__(cls)
+        if cls.__slotted__:
+            instance.__relations__ = None
+            instance.__deferred__ = None
+            instance._original = None
+            instance._changed = None
+        instance.__record__ = record
+        return instance
+    
+    @classmethod
+    def _hydrate(cls, record: Any, lazy: bool = False, deferred: Any = None) -> "Model":
+        if deferred is None:
+            return cls._from_record_lazy(record) if lazy else cls._from_record(record)
+        
+        instance = cls._from_record_lazy(record)
+        deferred.attach(instance)
+        if not lazy:
+            instance._promote()
+        return instance
+    
+    def _load_lazy(self, column: Column) -> Any:
+        deferred = self.__deferred__
+        if deferred is not None and column.name in deferred.columns:
+            raise DeferredColumnError(self.__class__.__name__, column.name)
+        
+        record = self.__record__
+        if record is None:
+            return None
+        
+        value = record.get(column.name)
+        default = column.metadata.default
+        if value is None and default is not None and not column.metadata.server_generated:
+            value = default() if callable(default) else default
+        
+        column._store(self, value)
+        return value
+    
+    def _promote(self) -> None:
+        for name in self.__columns__:
+            self._peek(name)
+        self.__record__ = None
+        self._mark_clean()
+    
+    def _peek(self, name: str) -> Any:
+        try:
+            return getattr(self, name)
+        except DeferredColumnError:
+            return None
+    
+    def _fill_deferred(self, columns: tuple[str, ...], row: Any) -> None:
+        changed = self._changed or ()
+        original = list(self._original) if self._original is not None else None
+        
+        for name in columns:
+            if name in changed:
+                continue
+            value = row[name] if row is not None else None
+            self.__columns__[name]._store(self, value)
+            if original is not None:
+                original[self.__column_positions__[name]] = value
+        
+        self.__deferred__ = None
+        if original is not None:
+            self._original = tuple(original)
+    
+    async def load_deferred(self) -> "Model":
+        if self.__deferred__ is not None:
+            await self.__deferred__.load()
+        return self
+    
+    @property
+    def deferred_columns(self) -> tuple[str, ...]:
+        deferred = self.__deferred__
+        return deferred.columns if deferred is not None else ()
+    
+    @property
+    def is_lazy(self) -> bool:
+        return self.__record__ is not None
+    
+    def _mark_clean(self) -> None:
+        if self.__slotted__:
+            self._original = tuple(self._peek(name) for name in self.__columns__)
+        else:
+            values = self.__dict__
+            self._original = tuple(values.get(name) for name in self.__columns__)
+        self._changed = None
+    
+    def _original_value(self, name: str) -> Any:
+        if self._original is None:
+            return getattr(self, name, None)
+        return self._original[self.__column_positions__[name]]
+    
+    @property
+    def is_persisted(self) -> bool:
+        return self._original is not None or self.__record__ is not None
+    
+    def get_changes(self) -> dict[str, Any]:
+        if self._original is None or not self._changed:
+            return {}
+        
+        return {
+            name: getattr(self, name, None)
+            for name in self.__columns__
+            if name in self._changed and self._differs(name, getattr(self, name, None))
+        }
+    
+    def _differs(self, name: str, value: Any) -> bool:
+        original = self._original_value(name)
+        if original is value:
+            return isinstance(value, MUTABLE_TYPES)
+        return original != value
+    
+    def has_changes(self) -> bool:
+        return bool(self.get_changes())
+    
+    def _identity_values(self) -> list[Any]:
+        return [self._original_value(name) for name in self.get_primary_keys()]
+    
+    async def save(self, database: Any) -> "Model":
+        if not self.is_persisted:
+            return await self._insert(database)
+        
+        version_column = self.__version_column__
+        changes = self.get_changes()
+        changes.pop(version_column, None)
+        if not changes:
+            return self
+        
+        primary_keys = self.get_primary_keys()
+        if not primary_keys:
+            raise ValueError(f"{self.__class__.__name__} has no primary key to update by")
+        
+        set_parts = [f"{name} = ${index + 1}" for index, name in enumerate(changes)]
+        where_parts = [f"{name} = ${len(changes) + index + 1}" for index, name in enumerate(primary_keys)]
+        params = [*changes.values(), *self._identity_values()]
+        
+        if version_column is None:
+            query = f"UPDATE {self.get_table_name()} SET {', '.join(set_parts)} WHERE {' AND '.join(where_parts)}"
+            await database.execute(query, *params)
+            self._mark_clean()
+            return self
+        
+        expected_version = self._original_value(version_column)
+        set_parts.append(f"{version_column} = {version_column} + 1")
+        where_parts.append(f"{version_column} = ${len(params) + 1}")
+        params.append(expected_version)
+        
+        query = (
+            f"UPDATE {self.get_table_name()} SET {', '.join(set_parts)} "
+            f"WHERE {' AND '.join(where_parts)} RETURNING {version_column}"
+        )
+        
+        row = await database.fetchrow(query, *params)
+        if row is None:
+            raise VersionConflictError(self.__class__.__name__, expected_version, self._identity_values())
+        
+        setattr(self, version_column, row[version_column])
+        self._mark_clean()
+        return self
+    
+    async def _insert(self, database: Any) -> "Model":
+        values = {
+            name: value
+            for name, value in self.to_dict().items()
+            if value is not None or not self.__columns__[name].is_generated
+        }
+        
+        if values:
+            columns = ", ".join(values)
+            placeholders = ", ".join(f"${index + 1}" for index in range(len(values)))
+            query = f"INSERT INTO {self.get_table_name()} ({columns}) VALUES ({placeholders}) RETURNING *"
+        else:
+            query = f"INSERT INTO {self.get_table_name()} DEFAULT VALUES RETURNING *"
+        
+        row = await database.fetchrow(query, *values.values())
+        
+        if row is not None:
+            for name in self.__columns__:
+                if name in row.keys():
+                    setattr(self, name, row[name])
+        
+        self._mark_clean()
+        return self
+    
     @classmethod
     def get_primary_keys(cls) -> list[str]:
         return [
@@ -76,6 +341,10 @@ class Model(metaclass=ModelMeta):
             if column.metadata.primary_key
         ]
     
+    @classmethod
+    def get_column_names(cls) -> list[str]:
+        return list(cls.__columns__)
+    
     @classmethod
     def get_table_name(cls) -> str:
         return cls.__table_name__
@@ -0,0 +1,106 @@
+from typing import Any, Callable
+from quick.orm.columns.base import Column
+
+
+def _value_source(column_name: str, column: Column, slotted: bool) -> str:
+    if slotted:
+        return f"self._value_{column_name}"
+    return f"values[{column_name!r}]"
+
+
+def _column_lines(index: int, column_name: str, column: Column, source: str, namespace: dict[str, Any]) -> list[str]:
+    value = f"v{index}"
+    metadata = column.metadata
+    lines = [f"    {value} = {source}.get({column_name!r})"]
+    
+    if metadata.default is not None and not metadata.server_generated:
+        namespace[f"default_{index}"] = metadata.default
+        call = "()" if callable(metadata.default) else ""
+        lines.append(f"    if {value} is None:")
+        lines.append(f"        {value} = default_{index}{call}")
+    
+    if type(column).validate is not Column.validate:
+        namespace[f"column_{index}"] = column
+        lines.append(f"    column_{index}.validate({value})")
+        return lines
+    
+    checks_none = not metadata.nullable and not column.is_generated
+    
+    if checks_none:
+        namespace[f"none_message_{index}"] = f"{column_name} cannot be None"
+        lines.append(f"    if {value} is None:")
+        lines.append(f"        raise ValueError(none_message_{index})")
+    
+    if metadata.validators:
+        indent = "    "
+        if metadata.nullable or column.is_generated:
+            lines.append(f"    if {value} is not None:")
+            indent = "        "
+        for position, validator in enumerate(metadata.validators):
+            namespace[f"validator_{index}_{position}"] = validator
+            lines.append(f"{indent}validator_{index}_{position}({value})")
+    
+    return lines
+
+
+def _body(cls: type, source: str) -> tuple[list[str], dict[str, Any]]:
+    namespace: dict[str, Any] = dict()
+    lines: list[str] = []
+    slotted = cls.__slotted__
+    
+    if slotted:
+        lines.append("    self.__relations__ = None")
+        lines.append("    self.__record__ = None")
+        lines.append("    self.__deferred__ = None")
+    else:
+        lines.append("    values = self.__dict__")
+    
+    for index, (column_name, column) in enumerate(cls.__columns__.items()):
+        lines.extend(_column_lines(index, column_name, column, source, namespace))
+        lines.append(f"    {_value_source(column_name, column, slotted)} = v{index}")
+    
+    return lines, namespace
+
+
+def _build(name: str, signature: str, lines: list[str], namespace: dict[str, Any], qualname: str) -> Callable:
+    source = f"def {name}({signature}):\n" + "\n".join(lines) + "\n"
+    exec(compile(source, f"<quick.orm generated {qualname}.{name}>", "exec"), namespace)
+    function = namespace[name]
+    function.__qualname__ = f"{qualname}.{name}"
+    function.__quick_generated__ = True
+    return function
+
+
+def compile_init(cls: type) -> Callable:
+    lines, namespace = _body(cls, "kwargs")
+    
+    if cls.__slotted__:
+        lines.append("    self._original = None")
+        lines.append("    self._changed = None")
+    
+    return _build("__init__", "self, **kwargs", lines, namespace, cls.__qualname__)
+
+
+def compile_from_record(cls: type) -> Callable:
+    lines, namespace = _body(cls, "record")
+    lines.insert(0, "    self = new(cls)")
+    namespace["new"] = object.__new__
+    
+    snapshot = ", ".join(f"v{index}" for index in range(len(cls.__columns__)))
+    lines.append(f"    self._original = ({snapshot}{',' if len(cls.__columns__) == 1 else ''})")
+    lines.append("    self._changed = None")
+    lines.append("    return self")
+    
+    return _build("_from_record", "cls, record", lines, namespace, cls.__qualname__)
+
+
+def has_custom_init(cls: type, base: type) -> bool:
+    for klass in cls.__mro__:
+        init = klass.__dict__.get("__init__")
+        if init is None:
+            continue
+        return klass is not base and not getattr(init, "__quick_generated__", False)
+    return False
+
+
+__all__ = ["compile_init", "compile_from_record", "has_custom_init"]
@@ -3,6 +3,8 @@ from quick.orm.query.insert import InsertBuilder
 from quick.orm.query.update import UpdateBuilder
 from quick.orm.query.delete import DeleteBuilder
 from quick.orm.query.bulk import BulkInsertBuilder, BulkUpdateBuilder, BulkDeleteBuilder
+from quick.orm.query.explain import QueryPlan, PlanNode
+from quick.orm.query.prepared import PreparedQuery
 
 
 __all__ = [
@@ -13,4 +15,7 @@ __all__ = [
     "BulkInsertBuilder",
     "BulkUpdateBuilder",
     "BulkDeleteBuilder",
+    "QueryPlan",
+    "PlanNode",
+    "PreparedQuery",
 ]
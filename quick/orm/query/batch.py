@@ -0,0 +1,124 @@
+from typing import Any, Optional
+import asyncio
+import re
+from quick.orm.query.builder import QueryBuilder
+from quick.orm.query.template import deferred_columns, render_select
+
+PLACEHOLDER = re.compile(r"\$(\d+)")
+
+BUILTIN_TYPES = frozenset({
+    "smallint", "integer", "bigint", "smallserial", "serial", "bigserial",
+    "real", "double precision", "numeric", "decimal",
+    "boolean", "uuid", "json", "jsonb", "bytea",
+    "varchar", "character varying", "char", "character", "text",
+    "timestamp", "timestamptz", "timestamp with time zone", "date",
+    "time", "timetz", "time with time zone", "interval",
+})
+
+
+def renumber(query: str, offset: int) -> str:
+    if not offset:
+        return query
+    return PLACEHOLDER.sub(lambda match: f"${int(match.group(1)) + offset}", query)
+
+
+def builtin_type(sql_type: str, text_codecs: frozenset[str] = frozenset()) -> bool:
+    name = sql_type.lower().removesuffix("[]").partition("(")[0].strip()
+    return name in BUILTIN_TYPES and name not in text_codecs
+
+
+def batchable(builder: QueryBuilder, text_codecs: frozenset[str] = frozenset()) -> bool:
+    if builder._select_fields or builder._group_by or builder._having_clauses or builder._lock:
+        return False
+    columns = builder._model.__columns__
+    return all(builtin_type(columns[name].metadata.sql_type, text_codecs) for name in column_names(builder))
+
+
+def column_names(builder: QueryBuilder) -> list[str]:
+    skipped = deferred_columns(builder._model, (), builder._deferred, builder._only)
+    return [name for name in builder._model.get_column_names() if name not in skipped]
+
+
+def build_batch_query(builders: list[QueryBuilder]) -> tuple[str, list[Any]]:
+    arrays = []
+    params: list[Any] = []
+    
+    for builder in builders:
+        names = column_names(builder)
+        if builder._joins:
+            table_name = builder._model.get_table_name()
+            names = [f"{table_name}.{name}" for name in names]
+        
+        query = render_select(
+            builder._model,
+            (f"ROW({', '.join(names)})",),
+            (),
+            (),
+            tuple(builder._joins),
+            tuple(builder._where_clauses),
+            (),
+            (),
+            tuple(builder._order_by),
+            builder._limit_value,
+            builder._offset_value,
+            None,
+        )
+        arrays.append(f"ARRAY({renumber(query, len(params))})")
+        params.extend(builder._where_params)
+    
+    return f"SELECT {', '.join(arrays)}", params
+
+
+async def run_batch(database: Any, builders: tuple[QueryBuilder, ...], parallel: bool = False) -> list[list[Any]]:
+    for builder in builders:
+        if not isinstance(builder, QueryBuilder):
+            raise ValueError(f"batch() expects select builders, got {type(builder).__name__}")
+    
+    if not builders:
+        return []
+    
+    if parallel and database._pool.bound_connection() is None:
+        return list(await asyncio.gather(*(builder.get() for builder in builders)))
+    
+    lanes: dict[Any, list[int]] = {}
+    for index, builder in enumerate(builders):
+        lanes.setdefault(builder._database._pool, []).append(index)
+    
+    results: list[list[Any]] = [[] for _ in builders]
+    timeouts = [builder._timeout for builder in builders if builder._timeout is not None]
+    with database.deadline(min(timeouts) if timeouts else None):
+        for pool, indexes in lanes.items():
+            async with pool.pinned():
+                lane_results = await _run_pinned(builders[indexes[0]]._database, [builders[index] for index in indexes])
+            for index, models in zip(indexes, lane_results):
+                results[index] = models
+    
+    return results
+
+
+async def _run_pinned(database: Any, builders: list[QueryBuilder]) -> list[list[Any]]:
+    results: list[Optional[list[Any]]] = [None] * len(builders)
+    text_codecs = frozenset(codec.typename for codec in database._pool._codecs if codec.format == "text")
+    combined = [index for index, builder in enumerate(builders) if batchable(builder, text_codecs)]
+    
+    if combined:
+        query, params = build_batch_query([builders[index] for index in combined])
+        row = await database.fetchrow(query, *params)
+        
+        for position, index in enumerate(combined):
+            builder = builders[index]
+            names = column_names(builder)
+            loader = builder._deferred_loader()
+            models = [builder._row_to_model(dict(zip(names, values)), loader) for values in row[position] or ()]
+            if builder._with_relations:
+                await builder._load_relations(models)
+            results[index] = models
+    
+    for index, builder in enumerate(builders):
+        if results[index] is None:
+            results[index] = await builder.get()
+    
+    return results
+
+
+__all__ = ["run_batch", "build_batch_query", "batchable", "builtin_type", "renumber", "BUILTIN_TYPES"]
@@ -1,6 +1,13 @@
 from typing import Any, TypeVar, Generic, Optional, AsyncIterator
+import asyncio
+from contextlib import aclosing
+from quick.orm.core.connection import STREAM_BATCH_SIZE
 from quick.orm.models.base import Model
+from quick.orm.query.deferred import DeferredLoader
+from quick.orm.query.explain import QueryPlan, explain_query
+from quick.orm.query.template import deferred_columns, render_select
 from quick.orm.relations.base import Relation
+from quick.orm.query.deadline import bounded
 
 T = TypeVar("T", bound=Model)
 
@@ -9,6 +16,7 @@ class QueryBuilder(Generic[T]):
     def __init__(self, model: type[T], database: Any):
         self._model = model
         self._database = database
+        self._timeout: Optional[float] = None
         self._select_fields: list[str] = []
         self._where_clauses: list[str] = []
         self._where_params: list[Any] = []
@@ -20,6 +28,10 @@ class QueryBuilder(Generic[T]):
         self._having_clauses: list[str] = []
         self._having_params: list[Any] = []
         self._joins: list[tuple[str, str, str]] = []
+        self._lock: Optional[tuple[str, tuple[str, ...], bool, bool]] = None
+        self._lazy: Optional[bool] = None
+        self._deferred: tuple[str, ...] = ()
+        self._only: tuple[str, ...] = ()
     
     def select(self, *fields: str) -> "QueryBuilder[T]":
         new_builder = self._clone()
@@ -74,6 +86,81 @@ class QueryBuilder(Generic[T]):
     def right_join(self, table: str, condition: str) -> "QueryBuilder[T]":
         return self.join(table, condition, "RIGHT")
     
+    def defer(self, *fields: str) -> "QueryBuilder[T]":
+        self._check_columns(fields)
+        primary_keys = [field for field in fields if field in self._model.get_primary_keys()]
+        if primary_keys:
+            raise ValueError(f"Primary key columns cannot be deferred: {', '.join(primary_keys)}")
+        
+        new_builder = self._clone()
+        new_builder._deferred = tuple(dict.fromkeys(self._deferred + fields))
+        return new_builder
+    
+    def only(self, *fields: str) -> "QueryBuilder[T]":
+        self._check_columns(fields)
+        new_builder = self._clone()
+        new_builder._only = tuple(dict.fromkeys(fields))
+        return new_builder
+    
+    def _check_columns(self, fields: tuple[str, ...]) -> None:
+        unknown = [field for field in fields if field not in self._model.__columns__]
+        if unknown:
+            raise ValueError(f"Unknown columns for {self._model.__name__}: {', '.join(unknown)}")
+    
+    def _deferred_columns(self) -> tuple[str, ...]:
+        return deferred_columns(self._model, tuple(self._select_fields), self._deferred, self._only)
+    
+    def _deferred_loader(self) -> Optional[DeferredLoader]:
+        deferred = self._deferred_columns()
+        if not deferred:
+            return None
+        return DeferredLoader(self._model, self._database, deferred)
+    
+    def lazy(self, enabled: bool = True) -> "QueryBuilder[T]":
+        new_builder = self._clone()
+        new_builder._lazy = enabled
+        return new_builder
+    
+    def for_update(
+        self,
+        skip_locked: bool = False,
+        nowait: bool = False,
+        of: Optional[list[str]] = None,
+        no_key: bool = False,
+    ) -> "QueryBuilder[T]":
+        strength = "NO KEY UPDATE" if no_key else "UPDATE"
+        return self._with_lock(strength, skip_locked, nowait, of)
+    
+    def for_share(
+        self,
+        skip_locked: bool = False,
+        nowait: bool = False,
+        of: Optional[list[str]] = None,
+        key: bool = False,
+    ) -> "QueryBuilder[T]":
+        strength = "KEY SHARE" if key else "SHARE"
+        return self._with_lock(strength, skip_locked, nowait, of)
+    
+    def _with_lock(self, strength: str, skip_locked: bool, nowait: bool, of: Optional[list[str]]) -> "QueryBuilder[T]":
+        if skip_locked and nowait:
+            raise ValueError("skip_locked and nowait cannot be combined")
+        
+        new_builder = self._clone()
+        new_builder._lock = (strength, tuple(of or ()), skip_locked, nowait)
+        return new_builder
+    
+    def timeout(self, seconds: float) -> "QueryBuilder[T]":
+        if seconds <= 0:
+            raise ValueError("timeout must be a positive number of seconds")
+        new_builder = self._clone()
+        new_builder._timeout = seconds
+        return new_builder
+    
+    def lane(self, name: str) -> "QueryBuilder[T]":
+        new_builder = self._clone()
+        new_builder._database = self._database.using(name)
+        return new_builder
+    
     def _clone(self) -> "QueryBuilder[T]":
         new_builder = QueryBuilder(self._model, self._database)
         new_builder._select_fields = self._select_fields.copy()
@@ -87,76 +174,97 @@ class QueryBuilder(Generic[T]):
         new_builder._having_clauses = self._having_clauses.copy()
         new_builder._having_params = self._having_params.copy()
         new_builder._joins = self._joins.copy()
+        new_builder._lock = self._lock
+        new_builder._lazy = self._lazy
+        new_builder._deferred = self._deferred
+        new_builder._only = self._only
+        new_builder._timeout = self._timeout
         return new_builder
     
     def _build_select_query(self) -> tuple[str, list[Any]]:
-        table_name = self._model.get_table_name()
-        
-        if self._select_fields:
-            fields = ", ".join(self._select_fields)
-        else:
-            fields = "*"
-        
-        query = f"SELECT {fields} FROM {table_name}"
-        params = []
-        
-        if self._joins:
-            for join_type, join_table, join_condition in self._joins:
-                query += f" {join_type} JOIN {join_table} ON {join_condition}"
-        
-        if self._where_clauses:
-            where_str = " AND ".join(self._where_clauses)
-            query += f" WHERE {where_str}"
-            params.extend(self._where_params)
-        
-        if self._group_by:
-            group_str = ", ".join(self._group_by)
-            query += f" GROUP BY {group_str}"
-        
-        if self._having_clauses:
-            having_str = " AND ".join(self._having_clauses)
-            query += f" HAVING {having_str}"
-            params.extend(self._having_params)
-        
-        if self._order_by:
-            order_str = ", ".join(self._order_by)
-            query += f" ORDER BY {order_str}"
-        
-        if self._limit_value is not None:
-            query += f" LIMIT {self._limit_value}"
-        
-        if self._offset_value is not None:
-            query += f" OFFSET {self._offset_value}"
-        
-        return query, params
+        query = render_select(
+            self._model,
+            tuple(self._select_fields),
+            self._deferred,
+            self._only,
+            tuple(self._joins),
+            tuple(self._where_clauses),
+            tuple(self._group_by),
+            tuple(self._having_clauses),
+            tuple(self._order_by),
+            self._limit_value,
+            self._offset_value,
+            self._lock,
+        )
+        return query, [*self._where_params, *self._having_params]
+    
+    @bounded
+    async def explain(
+        self,
+        analyze: bool = False,
+        buffers: Optional[bool] = None,
+        format: str = "json",
+    ) -> QueryPlan | str:
+        query, params = self._build_select_query()
+        return await explain_query(self._database, query, params, analyze, buffers, format, modifies_data=False)
     
+    @bounded
     async def get(self) -> list[T]:
         query, params = self._build_select_query()
         rows = await self._database.fetch(query, *params)
         
-        models = [self._row_to_model(row) for row in rows]
+        loader = self._deferred_loader()
+        models = [self._row_to_model(row, loader) for row in rows]
         
         if self._with_relations:
             await self._load_relations(models)
         
         return models
     
+    @bounded
     async def first(self) -> Optional[T]:
-        query, params = self._build_select_query()
-        query += " LIMIT 1"
+        query, params = self.limit(1)._build_select_query()
         
         row = await self._database.fetchrow(query, *params)
         
         if row is None:
             return None
         
-        model = self._row_to_model(row)
+        model = self._row_to_model(row, self._deferred_loader())
         
         if self._with_relations:
             await self._load_relations([model])
         
         return model
     
+    @bounded
+    async def claim(self, n: int, **values: Any) -> list[T]:
+        if not values:
+            raise ValueError("claim() requires column values to set on claimed rows")
+        
+        primary_keys = self._model.get_primary_keys()
+        if len(primary_keys) != 1:
+            raise ValueError("claim() requires a model with a single primary key")
+        
+        key = primary_keys[0]
+        inner = self.select(key).limit(n)
+        if inner._lock is None:
+            inner = inner.for_update(skip_locked=True)
+        
+        inner_query, params = inner._build_select_query()
+        
+        set_clauses = []
+        for column, value in values.items():
+            params.append(value)
+            set_clauses.append(f"{column} = ${len(params)}")
+        
+        table_name = self._model.get_table_name()
+        query = f"UPDATE {table_name} SET {', '.join(set_clauses)} WHERE {key} IN ({inner_query}) RETURNING *"
+        
+        rows = await self._database.fetch(query, *params)
+        return [self._row_to_model(row) for row in rows]
+    
+    @bounded
     async def count(self) -> int:
         table_name = self._model.get_table_name()
         query = f"SELECT COUNT(*) FROM {table_name}"
@@ -170,6 +278,7 @@ class QueryBuilder(Generic[T]):
         result = await self._database.fetchval(query, *params)
         return result or 0
     
+    @bounded
     async def sum(self, field: str) -> float:
         table_name = self._model.get_table_name()
         query = f"SELECT SUM({field}) FROM {table_name}"
@@ -183,6 +292,7 @@ class QueryBuilder(Generic[T]):
         result = await self._database.fetchval(query, *params)
         return float(result) if result is not None else 0.0
     
+    @bounded
     async def avg(self, field: str) -> float:
         table_name = self._model.get_table_name()
         query = f"SELECT AVG({field}) FROM {table_name}"
@@ -196,6 +306,7 @@ class QueryBuilder(Generic[T]):
         result = await self._database.fetchval(query, *params)
         return float(result) if result is not None else 0.0
     
+    @bounded
     async def min(self, field: str) -> Any:
         table_name = self._model.get_table_name()
         query = f"SELECT MIN({field}) FROM {table_name}"
@@ -208,6 +319,7 @@ class QueryBuilder(Generic[T]):
         
         return await self._database.fetchval(query, *params)
     
+    @bounded
     async def max(self, field: str) -> Any:
         table_name = self._model.get_table_name()
         query = f"SELECT MAX({field}) FROM {table_name}"
@@ -220,9 +332,12 @@ class QueryBuilder(Generic[T]):
         
         return await self._database.fetchval(query, *params)
     
-    def _row_to_model(self, row: Any) -> T:
-        data = dict(row)
-        return self._model(**data)
+    def _row_to_model(self, row: Any, loader: Optional[DeferredLoader] = None) -> T:
+        lazy = self._model.__lazy__ if self._lazy is None else self._lazy
+        identity_map = getattr(self._database, "identity_map", None)
+        if identity_map is not None:
+            return identity_map.load(self._model, row, lazy=lazy, deferred=loader)
+        return self._model._hydrate(row, lazy, loader)
     
     async def _load_relations(self, models: list[T]) -> None:
         if not models:
@@ -252,7 +367,7 @@ class QueryBuilder(Generic[T]):
             return
         
         placeholders = ", ".join(f"${i+1}" for i in range(len(foreign_keys)))
-        query = f"SELECT * FROM {related_model.get_table_name()} WHERE {relation.local_key} IN ({placeholders})"
+        query = f"SELECT {self._related_columns(related_model)} FROM {related_model.get_table_name()} WHERE {relation.local_key} IN ({placeholders})"
         
         rows = await self._database.fetch(query, *foreign_keys)
         related_dict = {getattr(self._row_to_related_model(row, related_model), relation.local_key): self._row_to_related_model(row, related_model) for row in rows}
@@ -271,7 +386,7 @@ class QueryBuilder(Generic[T]):
             return
         
         placeholders = ", ".join(f"${i+1}" for i in range(len(local_keys)))
-        query = f"SELECT * FROM {related_model.get_table_name()} WHERE {relation.foreign_key} IN ({placeholders})"
+        query = f"SELECT {self._related_columns(related_model)} FROM {related_model.get_table_name()} WHERE {relation.foreign_key} IN ({placeholders})"
         
         rows = await self._database.fetch(query, *local_keys)
         related_dict = {getattr(self._row_to_related_model(row, related_model), relation.foreign_key): self._row_to_related_model(row, related_model) for row in rows}
@@ -290,7 +405,7 @@ class QueryBuilder(Generic[T]):
             return
         
         placeholders = ", ".join(f"${i+1}" for i in range(len(local_keys)))
-        query = f"SELECT * FROM {related_model.get_table_name()} WHERE {relation.foreign_key} IN ({placeholders})"
+        query = f"SELECT {self._related_columns(related_model)} FROM {related_model.get_table_name()} WHERE {relation.foreign_key} IN ({placeholders})"
         
         rows = await self._database.fetch(query, *local_keys)
         
@@ -306,19 +421,133 @@ class QueryBuilder(Generic[T]):
             if lk_value in related_dict:
                 setattr(model, relation_name, related_dict[lk_value])
     
+    @staticmethod
+    def _related_columns(model_class: type[Model]) -> str:
+        return ", ".join(model_class.get_column_names()) or "*"
+    
     def _row_to_related_model(self, row: Any, model_class: type[Model]) -> Model:
-        data = dict(row)
-        return model_class(**data)
+        identity_map = getattr(self._database, "identity_map", None)
+        if identity_map is not None:
+            return identity_map.load(model_class, row, lazy=model_class.__lazy__)
+        return model_class._hydrate(row, model_class.__lazy__)
     
     async def stream(self) -> AsyncIterator[T]:
         query, params = self._build_select_query()
         
         async with self._database._pool.acquire() as connection:
             async with connection.transaction():
-                cursor = await connection.cursor(query, *params)
-                async for row in cursor:
-                    yield self._row_to_model(row)
+                async with aclosing(self._database._pool.cursor(connection, query, *params, timeout=self._timeout)) as rows:
+                    loader = None
+                    streamed = 0
+                    async for row in rows:
+                        if streamed % STREAM_BATCH_SIZE == 0:
+                            loader = self._deferred_loader()
+                        streamed += 1
+                        yield self._row_to_model(row, loader)
+    
+    async def parallel_stream(
+        self,
+        partitions: int = 8,
+        key: str = "id",
+        consistent: bool = False,
+        buffer_size: int = 1000,
+    ) -> AsyncIterator[T]:
+        if partitions < 1:
+            raise ValueError("partitions must be at least 1")
+        
+        if self._group_by or self._having_clauses or self._limit_value is not None or self._offset_value is not None:
+            raise ValueError("parallel_stream does not support GROUP BY, HAVING, LIMIT or OFFSET")
+        
+        if not consistent:
+            async with aclosing(self._merge_partitions(partitions, key, buffer_size, None, None)) as models:
+                async for model in models:
+                    yield model
+            return
+        
+        async with self._database._pool.acquire(ambient=False) as coordinator:
+            async with coordinator.transaction(isolation="repeatable_read", readonly=True):
+                snapshot = await coordinator.fetchval("SELECT pg_export_snapshot()", timeout=self._database._pool.timeout())
+                async with aclosing(self._merge_partitions(partitions, key, buffer_size, coordinator, snapshot)) as models:
+                    async for model in models:
+                        yield model
+    
+    async def _merge_partitions(
+        self,
+        partitions: int,
+        key: str,
+        buffer_size: int,
+        coordinator: Any,
+        snapshot: Optional[str],
+    ) -> AsyncIterator[T]:
+        range_query, range_params = self.select(f"MIN({key})", f"MAX({key})").order_by()._build_select_query()
+        
+        if coordinator is not None:
+            bounds = await coordinator.fetchrow(range_query, *range_params, timeout=self._database._pool.timeout())
+        else:
+            bounds = await self._database.fetchrow(range_query, *range_params)
+        
+        if bounds is None or bounds[0] is None:
+            return
+        
+        offset = len(self._where_params)
+        condition = f"{key} >= ${offset + 1} AND {key} < ${offset + 2}"
+        builders = [self.where(condition, low, high) for low, high in self._key_ranges(bounds[0], bounds[1], partitions)]
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        finished = object()
+        
+        async def scan(builder: "QueryBuilder[T]") -> None:
+            try:
+                query, params = builder._build_select_query()
+                async with self._database._pool.acquire(ambient=False) as connection:
+                    isolation = "repeatable_read" if snapshot else None
+                    async with connection.transaction(isolation=isolation, readonly=True):
+                        if snapshot:
+                            await connection.execute(f"SET TRANSACTION SNAPSHOT '{snapshot}'", timeout=self._database._pool.timeout())
+                        async with aclosing(self._database._pool.cursor(connection, query, *params, timeout=self._timeout)) as rows:
+                            loader = None
+                            streamed = 0
+                            async for row in rows:
+                                if streamed % STREAM_BATCH_SIZE == 0:
+                                    loader = self._deferred_loader()
+                                streamed += 1
+                                await queue.put(self._row_to_model(row, loader))
+                await queue.put(finished)
+            except Exception as e:
+                await queue.put(e)
+        
+        tasks = [asyncio.create_task(scan(builder)) for builder in builders]
+        remaining = len(tasks)
+        
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is finished:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    @staticmethod
+    def _key_ranges(low: Any, high: Any, partitions: int) -> list[tuple[int, int]]:
+        if not isinstance(low, int) or not isinstance(high, int):
+            raise ValueError("parallel_stream requires an integer partition key")
+        
+        span = high - low + 1
+        partitions = min(partitions, span)
+        step = -(-span // partitions)
+        
+        return [
+            (start, min(start + step, high + 1))
+            for start in range(low, high + 1, step)
+        ]
     
+    @bounded
     async def paginate(self, page: int, per_page: int = 15) -> dict[str, Any]:
         offset = (page - 1) * per_page
         
@@ -1,15 +1,24 @@
-from typing import Any, TypeVar, Generic, Type
+from typing import Any, TypeVar, Generic, Type, Optional
 from quick.orm.models.base import Model
+from quick.orm.query.conflict import OnConflict, INSERTED_FLAG
+from quick.orm.validators.engine import compile_validator
+from quick.orm.query.deadline import bounded
 
 T = TypeVar("T", bound=Model)
 
+MAX_QUERY_PARAMETERS = 32767
+
 
 class BulkInsertBuilder(Generic[T]):
     def __init__(self, model: type[T], database: Any):
         self._model = model
         self._database = database
+        self._timeout: Optional[float] = None
         self._values_list: list[dict[str, Any]] = []
         self._returning_fields: list[str] = []
+        self._on_conflict: Optional[OnConflict] = None
+        self._chunk_size: Optional[int] = None
+        self._validate = False
     
     def values(self, *records: dict[str, Any]) -> "BulkInsertBuilder[T]":
         new_builder = self._clone()
@@ -24,16 +33,84 @@ class BulkInsertBuilder(Generic[T]):
             new_builder._returning_fields = list(fields)
         return new_builder
     
+    def on_conflict(self, columns: tuple[str, ...] | list[str] | str = (), constraint: Optional[str] = None) -> "BulkInsertBuilder[T]":
+        new_builder = self._clone()
+        target = (columns,) if isinstance(columns, str) else tuple(columns)
+        new_builder._on_conflict = OnConflict(target, constraint)
+        return new_builder
+    
+    def do_nothing(self) -> "BulkInsertBuilder[T]":
+        new_builder = self._clone()
+        new_builder._on_conflict = new_builder._require_conflict().do_nothing()
+        return new_builder
+    
+    def do_update(
+        self,
+        set: Optional[list[str] | tuple[str, ...] | dict[str, str]] = None,
+        where: Optional[str] = None,
+    ) -> "BulkInsertBuilder[T]":
+        new_builder = self._clone()
+        assignments = OnConflict.normalize_assignments(set)
+        new_builder._on_conflict = new_builder._require_conflict().do_update(assignments, where)
+        return new_builder
+    
+    def chunk_size(self, size: int) -> "BulkInsertBuilder[T]":
+        if size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        new_builder = self._clone()
+        new_builder._chunk_size = size
+        return new_builder
+    
+    def validate(self, enabled: bool = True) -> "BulkInsertBuilder[T]":
+        new_builder = self._clone()
+        new_builder._validate = enabled
+        return new_builder
+    
+    def _require_conflict(self) -> OnConflict:
+        if self._on_conflict is None:
+            raise ValueError("Call on_conflict() before do_update() or do_nothing()")
+        return self._on_conflict
+    
+    def timeout(self, seconds: float) -> "BulkInsertBuilder[T]":
+        if seconds <= 0:
+            raise ValueError("timeout must be a positive number of seconds")
+        new_builder = self._clone()
+        new_builder._timeout = seconds
+        return new_builder
+    
+    def lane(self, name: str) -> "BulkInsertBuilder[T]":
+        new_builder = self._clone()
+        new_builder._database = self._database.using(name)
+        return new_builder
+    
     def _clone(self) -> "BulkInsertBuilder[T]":
         new_builder = BulkInsertBuilder(self._model, self._database)
         new_builder._values_list = self._values_list.copy()
         new_builder._returning_fields = self._returning_fields.copy()
+        new_builder._on_conflict = self._on_conflict.copy() if self._on_conflict else None
+        new_builder._chunk_size = self._chunk_size
+        new_builder._validate = self._validate
+        new_builder._timeout = self._timeout
         return new_builder
     
-    def _build_bulk_insert_query(self) -> tuple[str, list[Any]]:
+    def _chunks(self) -> list[list[dict[str, Any]]]:
+        if not self._values_list:
+            raise ValueError("No values provided for bulk insert")
+        
+        column_count = max(len(self._values_list[0]), 1)
+        size = min(self._chunk_size or MAX_QUERY_PARAMETERS, MAX_QUERY_PARAMETERS // column_count)
+        
+        return [self._values_list[i:i + size] for i in range(0, len(self._values_list), size)]
+    
+    def _build_bulk_insert_query(
+        self,
+        records: Optional[list[dict[str, Any]]] = None,
+        with_status: bool = False,
+    ) -> tuple[str, list[Any]]:
         table_name = self._model.get_table_name()
+        records = self._values_list if records is None else records
         
-        if not self._values_list:
+        if not records:
             raise ValueError("No values provided for bulk insert")
         
         columns = list(self._values_list[0].keys())
@@ -42,7 +119,7 @@ class BulkInsertBuilder(Generic[T]):
         params = []
         param_index = 1
         
-        for record in self._values_list:
+        for record in records:
             placeholders = []
             for col in columns:
                 placeholders.append(f"${param_index}")
@@ -52,30 +129,67 @@ class BulkInsertBuilder(Generic[T]):
         
         query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES {', '.join(value_groups)}"
         
-        if self._returning_fields:
-            query += f" RETURNING {', '.join(self._returning_fields)}"
+        if self._on_conflict is not None:
+            query += f" {self._on_conflict.to_sql(columns)}"
+        
+        returning_fields = self._returning_fields
+        if with_status:
+            returning_fields = (returning_fields or ["*"]) + [INSERTED_FLAG]
+        
+        if returning_fields:
+            query += f" RETURNING {', '.join(returning_fields)}"
         
         return query, params
     
+    @bounded
     async def execute(self) -> list[T]:
-        query, params = self._build_bulk_insert_query()
+        rows = await self._execute_chunks(with_status=False)
+        return [self._row_to_model(row) for row in rows]
+    
+    @bounded
+    async def execute_with_status(self) -> list[tuple[T, bool]]:
+        rows = await self._execute_chunks(with_status=True)
+        return [(self._row_to_model(row), row["inserted"]) for row in rows]
+    
+    async def _execute_chunks(self, with_status: bool) -> list[Any]:
+        chunks = self._chunks()
         
-        if self._returning_fields:
-            rows = await self._database.fetch(query, *params)
-            return [self._row_to_model(row) for row in rows]
-        else:
+        if self._validate:
+            compile_validator(self._model).check(self._values_list, list(self._values_list[0].keys()))
+        fetch_rows = with_status or bool(self._returning_fields)
+        
+        if len(chunks) == 1:
+            query, params = self._build_bulk_insert_query(chunks[0], with_status)
+            if fetch_rows:
+                return await self._database.fetch(query, *params)
             await self._database.execute(query, *params)
             return []
+        
+        rows: list[Any] = []
+        
+        async with self._database._pool.acquire() as connection:
+            async with connection.transaction():
+                for chunk in chunks:
+                    query, params = self._build_bulk_insert_query(chunk, with_status)
+                    if fetch_rows:
+                        rows.extend(await connection.fetch(query, *params, timeout=self._database._pool.timeout()))
+                    else:
+                        await connection.execute(query, *params, timeout=self._database._pool.timeout())
+        
+        return rows
     
     def _row_to_model(self, row: Any) -> T:
-        data = dict(row)
-        return self._model(**data)
+        identity_map = getattr(self._database, "identity_map", None)
+        if identity_map is not None:
+            return identity_map.load(self._model, row)
+        return self._model._from_record(row)
 
 
 class BulkUpdateBuilder(Generic[T]):
     def __init__(self, model: type[T], database: Any):
         self._model = model
         self._database = database
+        self._timeout: Optional[float] = None
         self._updates: list[tuple[dict[str, Any], str, list[Any]]] = []
     
     def add_update(self, values: dict[str, Any], condition: str, *params: Any) -> "BulkUpdateBuilder[T]":
@@ -83,11 +197,25 @@ class BulkUpdateBuilder(Generic[T]):
         new_builder._updates.append((values, condition, list(params)))
         return new_builder
     
+    def timeout(self, seconds: float) -> "BulkUpdateBuilder[T]":
+        if seconds <= 0:
+            raise ValueError("timeout must be a positive number of seconds")
+        new_builder = self._clone()
+        new_builder._timeout = seconds
+        return new_builder
+    
+    def lane(self, name: str) -> "BulkUpdateBuilder[T]":
+        new_builder = self._clone()
+        new_builder._database = self._database.using(name)
+        return new_builder
+    
     def _clone(self) -> "BulkUpdateBuilder[T]":
         new_builder = BulkUpdateBuilder(self._model, self._database)
         new_builder._updates = self._updates.copy()
+        new_builder._timeout = self._timeout
         return new_builder
     
+    @bounded
     async def execute(self) -> int:
         table_name = self._model.get_table_name()
         total_updated = 0
@@ -124,6 +252,7 @@ class BulkDeleteBuilder(Generic[T]):
     def __init__(self, model: type[T], database: Any):
         self._model = model
         self._database = database
+        self._timeout: Optional[float] = None
         self._conditions: list[tuple[str, list[Any]]] = []
     
     def add_condition(self, condition: str, *params: Any) -> "BulkDeleteBuilder[T]":
@@ -131,11 +260,25 @@ class BulkDeleteBuilder(Generic[T]):
         new_builder._conditions.append((condition, list(params)))
         return new_builder
     
+    def timeout(self, seconds: float) -> "BulkDeleteBuilder[T]":
+        if seconds <= 0:
+            raise ValueError("timeout must be a positive number of seconds")
+        new_builder = self._clone()
+        new_builder._timeout = seconds
+        return new_builder
+    
+    def lane(self, name: str) -> "BulkDeleteBuilder[T]":
+        new_builder = self._clone()
+        new_builder._database = self._database.using(name)
+        return new_builder
+    
     def _clone(self) -> "BulkDeleteBuilder[T]":
         new_builder = BulkDeleteBuilder(self._model, self._database)
         new_builder._conditions = self._conditions.copy()
+        new_builder._timeout = self._timeout
         return new_builder
     
+    @bounded
     async def execute(self) -> int:
         table_name = self._model.get_table_name()
         total_deleted = 0
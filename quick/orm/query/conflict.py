@@ -0,0 +1,81 @@
+from typing import Optional
+
+
+class OnConflict:
+    def __init__(self, target: tuple[str, ...] = (), constraint: Optional[str] = None):
+        self.target = target
+        self.constraint = constraint
+        self.action: Optional[str] = None
+        self.assignments: Optional[dict[str, str]] = None
+        self.where: Optional[str] = None
+    
+    def copy(self) -> "OnConflict":
+        clause = OnConflict(self.target, self.constraint)
+        clause.action = self.action
+        clause.assignments = None if self.assignments is None else self.assignments.copy()
+        clause.where = self.where
+        return clause
+    
+    def do_nothing(self) -> "OnConflict":
+        clause = self.copy()
+        clause.action = "nothing"
+        clause.assignments = None
+        clause.where = None
+        return clause
+    
+    def do_update(self, assignments: Optional[dict[str, str]] = None, where: Optional[str] = None) -> "OnConflict":
+        if not self.target and not self.constraint:
+            raise ValueError("DO UPDATE requires conflict target columns or a constraint name")
+        
+        clause = self.copy()
+        clause.action = "update"
+        clause.assignments = assignments
+        clause.where = where
+        return clause
+    
+    def to_sql(self, inserted_columns: list[str]) -> str:
+        if self.action is None:
+            raise ValueError("on_conflict() requires do_update() or do_nothing()")
+        
+        if self.constraint:
+            target = f" ON CONSTRAINT {self.constraint}"
+        elif self.target:
+            target = f" ({', '.join(self.target)})"
+        else:
+            target = ""
+        
+        if self.action == "nothing":
+            return f"ON CONFLICT{target} DO NOTHING"
+        
+        assignments = self.assignments
+        if assignments is None:
+            assignments = {
+                column: f"EXCLUDED.{column}"
+                for column in inserted_columns
+                if column not in self.target
+            }
+        
+        if not assignments:
+            raise ValueError("DO UPDATE has no columns to update")
+        
+        set_clause = ", ".join(f"{column} = {expression}" for column, expression in assignments.items())
+        sql = f"ON CONFLICT{target} DO UPDATE SET {set_clause}"
+        
+        if self.where:
+            sql += f" WHERE {self.where}"
+        
+        return sql
+    
+    @staticmethod
+    def normalize_assignments(values: Optional[list[str] | tuple[str, ...] | dict[str, str]]) -> Optional[dict[str, str]]:
+        if values is None:
+            return None
+        if isinstance(values, dict):
+            return dict(values)
+        return {column: f"EXCLUDED.{column}" for column in values}
+
+
+INSERTED_FLAG = "(xmax = 0) AS inserted"
+
+
+__all__ = ["OnConflict", "INSERTED_FLAG"]
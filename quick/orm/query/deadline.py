@@ -0,0 +1,18 @@
+from typing import Any, Awaitable, Callable, TypeVar
+from functools import wraps
+
+R = TypeVar("R")
+
+
+def bounded(method: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+    @wraps(method)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> R:
+        if self._timeout is None:
+            return await method(self, *args, **kwargs)
+        with self._database.deadline(self._timeout):
+            return await method(self, *args, **kwargs)
+    
+    return wrapper
+
+
+__all__ = ["bounded"]
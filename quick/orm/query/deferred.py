@@ -0,0 +1,55 @@
+from typing import Any
+from quick.orm.models.base import Model
+
+
+class DeferredLoader:
+    def __init__(self, model: type[Model], database: Any, columns: tuple[str, ...]):
+        self.model = model
+        self.database = database
+        self.columns = columns
+        self.instances: list[Model] = []
+    
+    def attach(self, instance: Model) -> Model:
+        instance.__deferred__ = self
+        self.instances.append(instance)
+        return instance
+    
+    def build_query(self, instances: list[Model]) -> tuple[str, list[Any]]:
+        primary_keys = self.model.get_primary_keys()
+        if not primary_keys:
+            raise ValueError(f"{self.model.__name__} has no primary key to load deferred columns by")
+        
+        fields = ", ".join([*primary_keys, *self.columns])
+        table_name = self.model.get_table_name()
+        
+        if len(primary_keys) == 1:
+            keys = [instance._identity_values()[0] for instance in instances]
+            return f"SELECT {fields} FROM {table_name} WHERE {primary_keys[0]} = ANY($1)", [keys]
+        
+        params: list[Any] = []
+        groups = []
+        for instance in instances:
+            values = instance._identity_values()
+            groups.append("(" + ", ".join(f"${len(params) + index + 1}" for index in range(len(values))) + ")")
+            params.extend(values)
+        
+        return f"SELECT {fields} FROM {table_name} WHERE ({', '.join(primary_keys)}) IN ({', '.join(groups)})", params
+    
+    async def load(self) -> None:
+        pending = [instance for instance in self.instances if instance.__deferred__ is self]
+        if not pending:
+            self.instances = []
+            return
+        
+        query, params = self.build_query(pending)
+        rows = await self.database.fetch(query, *params)
+        self.instances = []
+        
+        primary_keys = self.model.get_primary_keys()
+        by_key = {tuple(row[name] for name in primary_keys): row for row in rows}
+        
+        for instance in pending:
+            instance._fill_deferred(self.columns, by_key.get(tuple(instance._identity_values())))
+
+
+__all__ = ["DeferredLoader"]
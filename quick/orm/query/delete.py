@@ -1,5 +1,7 @@
-from typing import Any, TypeVar, Generic
+from typing import Any, TypeVar, Generic, Optional
 from quick.orm.models.base import Model
+from quick.orm.query.explain import QueryPlan, explain_query
+from quick.orm.query.deadline import bounded
 
 T = TypeVar("T", bound=Model)
 
@@ -8,6 +10,7 @@ class DeleteBuilder(Generic[T]):
     def __init__(self, model: type[T], database: Any):
         self._model = model
         self._database = database
+        self._timeout: Optional[float] = None
         self._where_clauses: list[str] = []
         self._where_params: list[Any] = []
         self._returning_fields: list[str] = []
@@ -26,11 +29,24 @@ class DeleteBuilder(Generic[T]):
             new_builder._returning_fields = list(fields)
         return new_builder
     
+    def timeout(self, seconds: float) -> "DeleteBuilder[T]":
+        if seconds <= 0:
+            raise ValueError("timeout must be a positive number of seconds")
+        new_builder = self._clone()
+        new_builder._timeout = seconds
+        return new_builder
+    
+    def lane(self, name: str) -> "DeleteBuilder[T]":
+        new_builder = self._clone()
+        new_builder._database = self._database.using(name)
+        return new_builder
+    
     def _clone(self) -> "DeleteBuilder[T]":
         new_builder = DeleteBuilder(self._model, self._database)
         new_builder._where_clauses = self._where_clauses.copy()
         new_builder._where_params = self._where_params.copy()
         new_builder._returning_fields = self._returning_fields.copy()
+        new_builder._timeout = self._timeout
         return new_builder
     
     def _build_delete_query(self) -> tuple[str, list[Any]]:
@@ -48,6 +64,17 @@ class DeleteBuilder(Generic[T]):
         
         return query, params
     
+    @bounded
+    async def explain(
+        self,
+        analyze: bool = False,
+        buffers: Optional[bool] = None,
+        format: str = "json",
+    ) -> QueryPlan | str:
+        query, params = self._build_delete_query()
+        return await explain_query(self._database, query, params, analyze, buffers, format, modifies_data=True)
+    
+    @bounded
     async def execute(self) -> int:
         query, params = self._build_delete_query()
         
@@ -0,0 +1,153 @@
+from typing import Any, Iterator, Optional
+import json
+
+
+EXPLAIN_FORMATS = ("json", "text", "yaml", "xml")
+INDEX_NODE_TYPES = ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+
+
+class PlanNode:
+    def __init__(self, data: dict[str, Any]):
+        self.data = data
+        self.node_type: str = data.get("Node Type", "")
+        self.relation_name: Optional[str] = data.get("Relation Name")
+        self.index_name: Optional[str] = data.get("Index Name")
+        self.startup_cost = float(data.get("Startup Cost", 0.0))
+        self.total_cost = float(data.get("Total Cost", 0.0))
+        self.estimated_rows: Optional[int] = data.get("Plan Rows")
+        self.actual_rows: Optional[float] = data.get("Actual Rows")
+        self.actual_loops: Optional[int] = data.get("Actual Loops")
+        self.children = [PlanNode(child) for child in data.get("Plans", [])]
+    
+    @property
+    def actual_total_rows(self) -> Optional[float]:
+        if self.actual_rows is None:
+            return None
+        return self.actual_rows * (self.actual_loops or 1)
+    
+    @property
+    def is_seq_scan(self) -> bool:
+        return self.node_type == "Seq Scan"
+    
+    @property
+    def is_index_scan(self) -> bool:
+        return self.node_type in INDEX_NODE_TYPES
+    
+    def walk(self) -> Iterator["PlanNode"]:
+        yield self
+        for child in self.children:
+            yield from child.walk()
+    
+    def __repr__(self) -> str:
+        target = f" on {self.relation_name}" if self.relation_name else ""
+        return f"PlanNode({self.node_type}{target}, cost={self.total_cost}, rows={self.estimated_rows})"
+
+
+class QueryPlan:
+    def __init__(self, raw: Any):
+        if isinstance(raw, (str, bytes)):
+            raw = json.loads(raw)
+        
+        entry = raw[0] if isinstance(raw, list) else raw
+        
+        self.raw = raw
+        self.root = PlanNode(entry["Plan"])
+        self.planning_time: Optional[float] = entry.get("Planning Time")
+        self.execution_time: Optional[float] = entry.get("Execution Time")
+    
+    @property
+    def total_cost(self) -> float:
+        return self.root.total_cost
+    
+    @property
+    def estimated_rows(self) -> Optional[int]:
+        return self.root.estimated_rows
+    
+    @property
+    def actual_rows(self) -> Optional[float]:
+        return self.root.actual_total_rows
+    
+    @property
+    def analyzed(self) -> bool:
+        return self.root.actual_rows is not None
+    
+    @property
+    def nodes(self) -> list[PlanNode]:
+        return list(self.root.walk())
+    
+    @property
+    def seq_scans(self) -> list[PlanNode]:
+        return [node for node in self.root.walk() if node.is_seq_scan]
+    
+    @property
+    def index_scans(self) -> list[PlanNode]:
+        return [node for node in self.root.walk() if node.is_index_scan]
+    
+    @property
+    def indexes_used(self) -> set[str]:
+        return {node.index_name for node in self.root.walk() if node.index_name}
+    
+    def misestimates(self, factor: float = 10.0) -> list[PlanNode]:
+        result = []
+        
+        for node in self.root.walk():
+            actual = node.actual_total_rows
+            if actual is None or node.estimated_rows is None:
+                continue
+            
+            estimated = max(node.estimated_rows * (node.actual_loops or 1), 1)
+            if max(actual, 1) / estimated >= factor or estimated / max(actual, 1) >= factor:
+                result.append(node)
+        
+        return result
+    
+    def __repr__(self) -> str:
+        return f"QueryPlan(total_cost={self.total_cost}, estimated_rows={self.estimated_rows}, actual_rows={self.actual_rows})"
+
+
+def build_explain_query(query: str, analyze: bool = False, buffers: Optional[bool] = None, format: str = "json") -> str:
+    if format.lower() not in EXPLAIN_FORMATS:
+        raise ValueError(f"Unsupported EXPLAIN format: {format}")
+    
+    if buffers is None:
+        buffers = analyze
+    
+    options = []
+    if analyze:
+        options.append("ANALYZE")
+    if buffers:
+        options.append("BUFFERS")
+    options.append(f"FORMAT {format.upper()}")
+    
+    return f"EXPLAIN ({', '.join(options)}) {query}"
+
+
+async def explain_query(
+    database: Any,
+    query: str,
+    params: list[Any],
+    analyze: bool = False,
+    buffers: Optional[bool] = None,
+    format: str = "json",
+    modifies_data: bool = False,
+) -> QueryPlan | str:
+    explain_sql = build_explain_query(query, analyze, buffers, format)
+    
+    if analyze and modifies_data:
+        async with database._pool.acquire() as connection:
+            transaction = connection.transaction()
+            await transaction.start()
+            try:
+                rows = await connection.fetch(explain_sql, *params, timeout=database._pool.timeout())
+            finally:
+                await transaction.rollback()
+    else:
+        rows = await database.fetch(explain_sql, *params)
+    
+    if format.lower() == "json":
+        return QueryPlan(rows[0][0])
+    
+    return "\n".join(row[0] for row in rows)
+
+
+__all__ = ["PlanNode", "QueryPlan", "build_explain_query", "explain_query"]
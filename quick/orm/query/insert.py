@@ -1,5 +1,7 @@
 from typing import Any, TypeVar, Generic, Optional
 from quick.orm.models.base import Model
+from quick.orm.query.conflict import OnConflict, INSERTED_FLAG
+from quick.orm.query.deadline import bounded
 
 T = TypeVar("T", bound=Model)
 
@@ -8,8 +10,10 @@ class InsertBuilder(Generic[T]):
     def __init__(self, model: type[T], database: Any):
         self._model = model
         self._database = database
+        self._timeout: Optional[float] = None
         self._values: dict[str, Any] = dict()
         self._returning_fields: list[str] = []
+        self._on_conflict: Optional[OnConflict] = None
     
     def values(self, **kwargs: Any) -> "InsertBuilder[T]":
         new_builder = self._clone()
@@ -24,13 +28,53 @@ class InsertBuilder(Generic[T]):
             new_builder._returning_fields = list(fields)
         return new_builder
     
+    def on_conflict(self, columns: tuple[str, ...] | list[str] | str = (), constraint: Optional[str] = None) -> "InsertBuilder[T]":
+        new_builder = self._clone()
+        target = (columns,) if isinstance(columns, str) else tuple(columns)
+        new_builder._on_conflict = OnConflict(target, constraint)
+        return new_builder
+    
+    def do_nothing(self) -> "InsertBuilder[T]":
+        new_builder = self._clone()
+        new_builder._on_conflict = new_builder._require_conflict().do_nothing()
+        return new_builder
+    
+    def do_update(
+        self,
+        set: Optional[list[str] | tuple[str, ...] | dict[str, str]] = None,
+        where: Optional[str] = None,
+    ) -> "InsertBuilder[T]":
+        new_builder = self._clone()
+        assignments = OnConflict.normalize_assignments(set)
+        new_builder._on_conflict = new_builder._require_conflict().do_update(assignments, where)
+        return new_builder
+    
+    def _require_conflict(self) -> OnConflict:
+        if self._on_conflict is None:
+            raise ValueError("Call on_conflict() before do_update() or do_nothing()")
+        return self._on_conflict
+    
+    def timeout(self, seconds: float) -> "InsertBuilder[T]":
+        if seconds <= 0:
+            raise ValueError("timeout must be a positive number of seconds")
+        new_builder = self._clone()
+        new_builder._timeout = seconds
+        return new_builder
+    
+    def lane(self, name: str) -> "InsertBuilder[T]":
+        new_builder = self._clone()
+        new_builder._database = self._database.using(name)
+        return new_builder
+    
     def _clone(self) -> "InsertBuilder[T]":
         new_builder = InsertBuilder(self._model, self._database)
         new_builder._values = self._values.copy()
         new_builder._returning_fields = self._returning_fields.copy()
+        new_builder._on_conflict = self._on_conflict.copy() if self._on_conflict else None
+        new_builder._timeout = self._timeout
         return new_builder
     
-    def _build_insert_query(self) -> tuple[str, list[Any]]:
+    def _build_insert_query(self, with_status: bool = False) -> tuple[str, list[Any]]:
         table_name = self._model.get_table_name()
         
         if not self._values:
@@ -42,11 +86,19 @@ class InsertBuilder(Generic[T]):
         
         query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(placeholders)})"
         
-        if self._returning_fields:
-            query += f" RETURNING {', '.join(self._returning_fields)}"
+        if self._on_conflict is not None:
+            query += f" {self._on_conflict.to_sql(columns)}"
+        
+        returning_fields = self._returning_fields
+        if with_status:
+            returning_fields = (returning_fields or ["*"]) + [INSERTED_FLAG]
+        
+        if returning_fields:
+            query += f" RETURNING {', '.join(returning_fields)}"
         
         return query, params
     
+    @bounded
     async def execute(self) -> Optional[T]:
         query, params = self._build_insert_query()
         
@@ -59,9 +111,21 @@ class InsertBuilder(Generic[T]):
             await self._database.execute(query, *params)
             return None
     
+    @bounded
+    async def execute_with_status(self) -> Optional[tuple[T, bool]]:
+        query, params = self._build_insert_query(with_status=True)
+        
+        row = await self._database.fetchrow(query, *params)
+        if row is None:
+            return None
+        
+        return self._row_to_model(row), row["inserted"]
+    
     def _row_to_model(self, row: Any) -> T:
-        data = dict(row)
-        return self._model(**data)
+        identity_map = getattr(self._database, "identity_map", None)
+        if identity_map is not None:
+            return identity_map.load(self._model, row)
+        return self._model._from_record(row)
 
 
 __all__ = ["InsertBuilder"]
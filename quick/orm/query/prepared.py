@@ -0,0 +1,63 @@
+from typing import Any, Generic, TypeVar
+from quick.orm.models.base import Model
+from quick.orm.query.builder import QueryBuilder
+
+T = TypeVar("T", bound=Model)
+
+MODES = ("all", "first", "value")
+
+
+class PreparedQuery(Generic[T]):
+    def __init__(self, builder: QueryBuilder[T], mode: str = "all"):
+        if not isinstance(builder, QueryBuilder):
+            raise ValueError(f"prepare() expects a select builder, got {type(builder).__name__}")
+        if mode not in MODES:
+            raise ValueError(f"Unknown result mode {mode!r}; expected one of {', '.join(MODES)}")
+        
+        self.builder = builder.limit(1) if mode == "first" else builder
+        self.model = builder._model
+        self.mode = mode
+        self.query, self.params = self.builder._build_select_query()
+        self._database = builder._database
+    
+    async def _validate(self, connection: Any) -> None:
+        await connection.prepare(self.query, timeout=self._database._pool.timeout())
+    
+    async def warm(self) -> None:
+        await self._database._pool._run(self.query, self._validate)
+    
+    async def _execute(self, connection: Any, args: tuple[Any, ...]) -> Any:
+        timeout = self._database._pool.timeout()
+        if self.mode == "value":
+            return await connection.fetchval(self.query, *self.params, *args, timeout=timeout)
+        if self.mode == "first":
+            return await connection.fetchrow(self.query, *self.params, *args, timeout=timeout)
+        return await connection.fetch(self.query, *self.params, *args, timeout=timeout)
+    
+    async def __call__(self, *args: Any) -> Any:
+        if self.builder._timeout is None:
+            return await self._run(args)
+        with self._database.deadline(self.builder._timeout):
+            return await self._run(args)
+    
+    async def _run(self, args: tuple[Any, ...]) -> Any:
+        result = await self._database._pool._run(self.query, lambda connection: self._execute(connection, args))
+        
+        if self.mode == "value":
+            return result
+        
+        loader = self.builder._deferred_loader()
+        if self.mode == "first":
+            if result is None:
+                return None
+            models = [self.builder._row_to_model(result, loader)]
+        else:
+            models = [self.builder._row_to_model(row, loader) for row in result]
+        
+        if self.builder._with_relations:
+            await self.builder._load_relations(models)
+        
+        return models[0] if self.mode == "first" else models
+
+
+__all__ = ["PreparedQuery", "MODES"]
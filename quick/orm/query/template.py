@@ -0,0 +1,121 @@
+from typing import Any, Optional
+from functools import lru_cache
+
+TEMPLATE_CACHE_SIZE = 1024
+
+LockClause = Optional[tuple[str, tuple[str, ...], bool, bool]]
+
+
+def deferred_columns(
+    model: Any,
+    select_fields: tuple[str, ...],
+    deferred: tuple[str, ...],
+    only: tuple[str, ...],
+) -> tuple[str, ...]:
+    if select_fields or not (deferred or only):
+        return ()
+    
+    primary_keys = model.get_primary_keys()
+    return tuple(
+        name
+        for name in model.__columns__
+        if name not in primary_keys
+        and (name in deferred or (only and name not in only))
+    )
+
+
+def column_list(
+    model: Any,
+    select_fields: tuple[str, ...],
+    deferred: tuple[str, ...],
+    only: tuple[str, ...],
+    joined: bool,
+) -> str:
+    if select_fields:
+        return ", ".join(select_fields)
+    
+    skipped = deferred_columns(model, select_fields, deferred, only)
+    names = [name for name in model.get_column_names() if name not in skipped]
+    if not names:
+        return "*"
+    
+    if joined:
+        table_name = model.get_table_name()
+        return ", ".join(f"{table_name}.{name}" for name in names)
+    return ", ".join(names)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def render_template(
+    model: Any,
+    select_fields: tuple[str, ...],
+    deferred: tuple[str, ...],
+    only: tuple[str, ...],
+    joins: tuple[tuple[str, str, str], ...],
+    where_clauses: tuple[str, ...],
+    group_by: tuple[str, ...],
+    having_clauses: tuple[str, ...],
+    order_by: tuple[str, ...],
+) -> str:
+    fields = column_list(model, select_fields, deferred, only, bool(joins))
+    query = f"SELECT {fields} FROM {model.get_table_name()}"
+    
+    for join_type, join_table, join_condition in joins:
+        query += f" {join_type} JOIN {join_table} ON {join_condition}"
+    
+    if where_clauses:
+        query += f" WHERE {' AND '.join(where_clauses)}"
+    
+    if group_by:
+        query += f" GROUP BY {', '.join(group_by)}"
+    
+    if having_clauses:
+        query += f" HAVING {' AND '.join(having_clauses)}"
+    
+    if order_by:
+        query += f" ORDER BY {', '.join(order_by)}"
+    
+    return query
+
+
+def lock_clause(lock: LockClause) -> str:
+    if lock is None:
+        return ""
+    
+    strength, tables, skip_locked, nowait = lock
+    clause = f" FOR {strength}"
+    if tables:
+        clause += f" OF {', '.join(tables)}"
+    if skip_locked:
+        clause += " SKIP LOCKED"
+    elif nowait:
+        clause += " NOWAIT"
+    return clause
+
+
+def render_select(
+    model: Any,
+    select_fields: tuple[str, ...],
+    deferred: tuple[str, ...],
+    only: tuple[str, ...],
+    joins: tuple[tuple[str, str, str], ...],
+    where_clauses: tuple[str, ...],
+    group_by: tuple[str, ...],
+    having_clauses: tuple[str, ...],
+    order_by: tuple[str, ...],
+    limit: Optional[int],
+    offset: Optional[int],
+    lock: LockClause,
+) -> str:
+    query = render_template(model, select_fields, deferred, only, joins, where_clauses, group_by, having_clauses, order_by)
+    
+    if limit is not None:
+        query += f" LIMIT {limit}"
+    
+    if offset is not None:
+        query += f" OFFSET {offset}"
+    
+    return query + lock_clause(lock)
+
+
+__all__ = ["TEMPLATE_CACHE_SIZE", "deferred_columns", "column_list", "lock_clause", "render_template", "render_select"]
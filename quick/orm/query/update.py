@@ -1,5 +1,8 @@
-from typing import Any, TypeVar, Generic
+from typing import Any, TypeVar, Generic, Optional
 from quick.orm.models.base import Model
+from quick.orm.exceptions import VersionConflictError
+from quick.orm.query.explain import QueryPlan, explain_query
+from quick.orm.query.deadline import bounded
 
 T = TypeVar("T", bound=Model)
 
@@ -8,10 +11,12 @@ class UpdateBuilder(Generic[T]):
     def __init__(self, model: type[T], database: Any):
         self._model = model
         self._database = database
+        self._timeout: Optional[float] = None
         self._values: dict[str, Any] = dict()
         self._where_clauses: list[str] = []
         self._where_params: list[Any] = []
         self._returning_fields: list[str] = []
+        self._version_check: Optional[tuple[str, Any]] = None
     
     def set(self, **kwargs: Any) -> "UpdateBuilder[T]":
         new_builder = self._clone()
@@ -24,6 +29,15 @@ class UpdateBuilder(Generic[T]):
         new_builder._where_params.extend(params)
         return new_builder
     
+    def where_version(self, expected: Any, column: Optional[str] = None) -> "UpdateBuilder[T]":
+        column = column or self._model.__version_column__
+        if column is None:
+            raise ValueError(f"{self._model.__name__} has no version column")
+        
+        new_builder = self._clone()
+        new_builder._version_check = (column, expected)
+        return new_builder
+    
     def returning(self, *fields: str) -> "UpdateBuilder[T]":
         new_builder = self._clone()
         if not fields:
@@ -32,18 +46,32 @@ class UpdateBuilder(Generic[T]):
             new_builder._returning_fields = list(fields)
         return new_builder
     
+    def timeout(self, seconds: float) -> "UpdateBuilder[T]":
+        if seconds <= 0:
+            raise ValueError("timeout must be a positive number of seconds")
+        new_builder = self._clone()
+        new_builder._timeout = seconds
+        return new_builder
+    
+    def lane(self, name: str) -> "UpdateBuilder[T]":
+        new_builder = self._clone()
+        new_builder._database = self._database.using(name)
+        return new_builder
+    
     def _clone(self) -> "UpdateBuilder[T]":
         new_builder = UpdateBuilder(self._model, self._database)
         new_builder._values = self._values.copy()
         new_builder._where_clauses = self._where_clauses.copy()
         new_builder._where_params = self._where_params.copy()
         new_builder._returning_fields = self._returning_fields.copy()
+        new_builder._version_check = self._version_check
+        new_builder._timeout = self._timeout
         return new_builder
     
     def _build_update_query(self) -> tuple[str, list[Any]]:
         table_name = self._model.get_table_name()
         
-        if not self._values:
+        if not self._values and self._version_check is None:
             raise ValueError("No values provided for update")
         
         set_clauses = []
@@ -55,10 +83,14 @@ class UpdateBuilder(Generic[T]):
             params.append(value)
             param_index += 1
         
+        if self._version_check is not None:
+            version_column = self._version_check[0]
+            set_clauses.append(f"{version_column} = {version_column} + 1")
+        
         query = f"UPDATE {table_name} SET {', '.join(set_clauses)}"
+        where_clauses_with_params = []
         
         if self._where_clauses:
-            where_clauses_with_params = []
             for clause in self._where_clauses:
                 adjusted_clause = clause
                 for old_param in range(len(self._where_params)):
@@ -69,23 +101,46 @@ class UpdateBuilder(Generic[T]):
                         param_index += 1
                 where_clauses_with_params.append(adjusted_clause)
             
-            query += f" WHERE {' AND '.join(where_clauses_with_params)}"
             params.extend(self._where_params)
         
+        if self._version_check is not None:
+            version_column, expected = self._version_check
+            where_clauses_with_params.append(f"{version_column} = ${len(params) + 1}")
+            params.append(expected)
+        
+        if where_clauses_with_params:
+            query += f" WHERE {' AND '.join(where_clauses_with_params)}"
+        
         if self._returning_fields:
             query += f" RETURNING {', '.join(self._returning_fields)}"
         
         return query, params
     
+    @bounded
+    async def explain(
+        self,
+        analyze: bool = False,
+        buffers: Optional[bool] = None,
+        format: str = "json",
+    ) -> QueryPlan | str:
+        query, params = self._build_update_query()
+        return await explain_query(self._database, query, params, analyze, buffers, format, modifies_data=True)
+    
+    @bounded
     async def execute(self) -> int:
         query, params = self._build_update_query()
         
         if self._returning_fields:
             rows = await self._database.fetch(query, *params)
-            return len(rows)
+            affected = len(rows)
         else:
             result = await self._database.execute(query, *params)
-            return int(result.split()[-1]) if result else 0
+            affected = int(result.split()[-1]) if result else 0
+        
+        if self._version_check is not None and affected == 0:
+            raise VersionConflictError(self._model.__name__, self._version_check[1])
+        
+        return affected
 
 
 __all__ = ["UpdateBuilder"]
@@ -27,13 +27,16 @@ class Relation:
         if instance is None:
             return self
         
-        if not hasattr(instance, f"_{self._name}_loaded"):
+        relations = instance.__relations__
+        if relations is None or self._name not in relations:
             return None
         
-        return getattr(instance, f"_{self._name}_loaded", None)
+        return relations[self._name]
     
     def __set__(self, instance: Any, value: Any) -> None:
-        setattr(instance, f"_{self._name}_loaded", value)
+        if instance.__relations__ is None:
+            instance.__relations__ = dict()
+        instance.__relations__[self._name] = value
     
     def get_related_model(self) -> Type[Model]:
         if isinstance(self.related_model, str):
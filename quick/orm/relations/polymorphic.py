@@ -22,13 +22,16 @@ class MorphTo:
         if instance is None:
             return self
         
-        if not hasattr(instance, f"_{self._name}_loaded"):
+        relations = instance.__relations__
+        if relations is None or self._name not in relations:
             return None
         
-        return getattr(instance, f"_{self._name}_loaded", None)
+        return relations[self._name]
     
     def __set__(self, instance: Any, value: Any) -> None:
-        setattr(instance, f"_{self._name}_loaded", value)
+        if instance.__relations__ is None:
+            instance.__relations__ = dict()
+        instance.__relations__[self._name] = value
 
 
 class MorphOne(Relation):
@@ -54,13 +57,16 @@ class MorphOne(Relation):
         if instance is None:
             return self
         
-        if not hasattr(instance, f"_{self._name}_loaded"):
+        relations = instance.__relations__
+        if relations is None or self._name not in relations:
             return None
         
-        return getattr(instance, f"_{self._name}_loaded", None)
+        return relations[self._name]
     
     def __set__(self, instance: Any, value: Any) -> None:
-        setattr(instance, f"_{self._name}_loaded", value)
+        if instance.__relations__ is None:
+            instance.__relations__ = dict()
+        instance.__relations__[self._name] = value
     
     def get_related_model(self) -> Type[Model]:
         if isinstance(self.related_model, str):
@@ -95,13 +101,16 @@ class MorphMany(Relation):
         if instance is None:
             return self
         
-        if not hasattr(instance, f"_{self._name}_loaded"):
+        relations = instance.__relations__
+        if relations is None or self._name not in relations:
             return []
         
-        return getattr(instance, f"_{self._name}_loaded", [])
+        return relations[self._name]
     
     def __set__(self, instance: Any, value: Any) -> None:
-        setattr(instance, f"_{self._name}_loaded", value)
+        if instance.__relations__ is None:
+            instance.__relations__ = dict()
+        instance.__relations__[self._name] = value
     
     def get_related_model(self) -> Type[Model]:
         if isinstance(self.related_model, str):
@@ -140,13 +149,16 @@ class HasManyThrough(Relation):
         if instance is None:
             return self
         
-        if not hasattr(instance, f"_{self._name}_loaded"):
+        relations = instance.__relations__
+        if relations is None or self._name not in relations:
             return []
         
-        return getattr(instance, f"_{self._name}_loaded", [])
+        return relations[self._name]
     
     def __set__(self, instance: Any, value: Any) -> None:
-        setattr(instance, f"_{self._name}_loaded", value)
+        if instance.__relations__ is None:
+            instance.__relations__ = dict()
+        instance.__relations__[self._name] = value
     
     def get_related_model(self) -> Type[Model]:
         if isinstance(self.related_model, str):
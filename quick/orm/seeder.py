@@ -7,14 +7,14 @@ class Seeder:
     def __init__(self, database):
         self.database = database
     
-    async def seed(self, model_class, data: List[Dict[str, Any]]) -> List[Any]:
+    async def seed(self, model_class, data: List[Dict[str, Any]], validate: bool = False) -> List[Any]:
         from quick.orm.query.bulk import BulkInsertBuilder
         
         builder = BulkInsertBuilder(model_class, self.database)
-        builder = builder.values(*data)
+        builder = builder.values(*data).validate(validate)
         return await builder.returning().execute()
     
-    async def seed_from_json(self, model_class, json_file: str) -> List[Any]:
+    async def seed_from_json(self, model_class, json_file: str, validate: bool = False) -> List[Any]:
         file_path = Path(json_file)
         
         if not file_path.exists():
@@ -23,7 +23,7 @@ class Seeder:
         with open(file_path, 'r') as f:
             data = json.load(f)
         
-        return await self.seed(model_class, data)
+        return await self.seed(model_class, data, validate)
     
     async def truncate(self, model_class) -> None:
         table_name = model_class.get_table_name()
@@ -59,14 +59,14 @@ class Factory:
         
         return results if count > 1 else results[0]
     
-    async def seed(self, database, count: int = 1, **overrides) -> List[Any]:
+    async def seed(self, database, count: int = 1, validate: bool = False, **overrides) -> List[Any]:
         data = self.create(count, **overrides)
         
         if not isinstance(data, list):
             data = [data]
         
         seeder = Seeder(database)
-        return await seeder.seed(self.model_class, data)
+        return await seeder.seed(self.model_class, data, validate)
 
 
 __all__ = ["Seeder", "Factory"]
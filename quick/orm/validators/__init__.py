@@ -1,5 +1,6 @@
 from quick.orm.validators.string import MinLength, MaxLength, Regex, Email, URL, PhoneNumber
 from quick.orm.validators.numeric import Range, Positive, Negative, NonNegative, NonPositive
+from quick.orm.validators.engine import BatchValidator, compile_validator, validate_batch
 
 
 __all__ = [
@@ -14,4 +15,7 @@ __all__ = [
     "Negative",
     "NonNegative",
     "NonPositive",
+    "BatchValidator",
+    "compile_validator",
+    "validate_batch",
 ]
@@ -0,0 +1,194 @@
+from typing import Any, Callable, Optional
+from functools import partial
+from itertools import compress, count
+from operator import ge, gt, is_not, itemgetter, le, lt, not_
+from weakref import WeakKeyDictionary
+from quick.orm.columns.base import Column
+from quick.orm.exceptions import ValidationError, BatchValidationError
+from quick.orm.validators.string import MinLength, MaxLength, Regex, Email, URL, PhoneNumber
+from quick.orm.validators.numeric import Range, Positive, Negative, NonNegative, NonPositive
+
+BatchCheck = Callable[[list[Any]], list[int]]
+
+PATTERN_VALIDATORS = (Regex, Email, URL, PhoneNumber)
+
+
+def _scalar_check(validator: Callable[[Any], None]) -> BatchCheck:
+    def check(values: list[Any]) -> list[int]:
+        failed = []
+        for index, value in enumerate(values):
+            try:
+                validator(value)
+            except (ValueError, TypeError):
+                failed.append(index)
+        return failed
+    
+    return check
+
+
+def _pattern_check(validator: Any) -> BatchCheck:
+    match = validator.pattern.match
+    fallback = _scalar_check(validator)
+    
+    def check(values: list[Any]) -> list[int]:
+        try:
+            unique = set(values)
+            if len(unique) * 2 < len(values):
+                rejected = set(compress(unique, map(not_, map(match, unique))))
+                if not rejected:
+                    return []
+                return list(compress(count(), map(rejected.__contains__, values)))
+            return list(compress(count(), map(not_, map(match, values))))
+        except TypeError:
+            return fallback(values)
+    
+    return check
+
+
+def _bounds_check(
+    validator: Any,
+    low: Optional[Any],
+    high: Optional[Any],
+    low_inclusive: bool = True,
+    high_inclusive: bool = True,
+    key: Optional[Callable[[Any], Any]] = None,
+) -> BatchCheck:
+    fallback = _scalar_check(validator)
+    below = partial(gt if low_inclusive else ge, low)
+    above = partial(lt if high_inclusive else le, high)
+    
+    def check(values: list[Any]) -> list[int]:
+        try:
+            data = values if key is None else list(map(key, values))
+            if any(value != value for value in data):
+                return fallback(values)
+            low_failed = low is not None and below(min(data))
+            high_failed = high is not None and above(max(data))
+            if not low_failed and not high_failed:
+                return []
+            
+            failed: set[int] = set()
+            if low_failed:
+                failed.update(compress(count(), map(below, data)))
+            if high_failed:
+                failed.update(compress(count(), map(above, data)))
+            return sorted(failed)
+        except TypeError:
+            return fallback(values)
+    
+    return check
+
+
+def compile_check(validator: Callable[[Any], None]) -> BatchCheck:
+    kind = type(validator)
+    
+    if kind in PATTERN_VALIDATORS:
+        return _pattern_check(validator)
+    if kind is Range:
+        return _bounds_check(validator, validator.min_value, validator.max_value)
+    if kind is Positive:
+        return _bounds_check(validator, 0, None, low_inclusive=False)
+    if kind is Negative:
+        return _bounds_check(validator, None, 0, high_inclusive=False)
+    if kind is NonNegative:
+        return _bounds_check(validator, 0, None)
+    if kind is NonPositive:
+        return _bounds_check(validator, None, 0)
+    if kind is MinLength:
+        return _bounds_check(validator, validator.min_length, None, key=len)
+    if kind is MaxLength:
+        return _bounds_check(validator, None, validator.max_length, key=len)
+    return _scalar_check(validator)
+
+
+class ColumnPlan:
+    def __init__(self, name: str, column: Column):
+        self.name = name
+        self.nullable = column.metadata.nullable or column.is_generated
+        self.custom = type(column).validate is not Column.validate
+        self.column = column
+        self.checks = [
+            (compile_check(validator), validator)
+            for validator in column.metadata.validators
+        ]
+    
+    def run(self, values: list[Any], errors: dict[int, list[ValidationError]]) -> None:
+        if self.custom:
+            for index, value in enumerate(values):
+                try:
+                    self.column.validate(value)
+                except (ValueError, TypeError) as error:
+                    errors.setdefault(index, []).append(ValidationError(str(error), self.name, value))
+            return
+        
+        positions: Optional[list[int]] = None
+        
+        if None in values:
+            positions = list(compress(count(), map(partial(is_not, None), values)))
+            if not self.nullable:
+                message = f"{self.name} cannot be None"
+                for index, value in enumerate(values):
+                    if value is None:
+                        errors.setdefault(index, []).append(ValidationError(message, self.name, None))
+            values = [values[index] for index in positions]
+        
+        if not values:
+            return
+        
+        for check, validator in self.checks:
+            for position in check(values):
+                index = position if positions is None else positions[position]
+                message = getattr(validator, "message", f"{self.name} is invalid")
+                errors.setdefault(index, []).append(ValidationError(message, self.name, values[position]))
+
+
+class BatchValidator:
+    def __init__(self, model: type):
+        self.model = model
+        self.plans = {name: ColumnPlan(name, column) for name, column in model.__columns__.items()}
+    
+    def validate(self, rows: list[dict[str, Any]], columns: Optional[list[str]] = None) -> dict[int, list[ValidationError]]:
+        errors: dict[int, list[ValidationError]] = dict()
+        if not rows:
+            return errors
+        
+        names = [
+            name
+            for name in (columns if columns is not None else rows[0].keys())
+            if name in self.plans
+        ]
+        
+        for name in names:
+            self.plans[name].run(self._column_values(rows, name), errors)
+        
+        return dict(sorted(errors.items()))
+    
+    @staticmethod
+    def _column_values(rows: list[dict[str, Any]], name: str) -> list[Any]:
+        try:
+            return list(map(itemgetter(name), rows))
+        except KeyError:
+            return [row.get(name) for row in rows]
+    
+    def check(self, rows: list[dict[str, Any]], columns: Optional[list[str]] = None) -> None:
+        errors = self.validate(rows, columns)
+        if errors:
+            raise BatchValidationError(self.model.__name__, errors)
+
+
+_compiled: "WeakKeyDictionary[type, BatchValidator]" = WeakKeyDictionary()
+
+
+def compile_validator(model: type) -> BatchValidator:
+    validator = _compiled.get(model)
+    if validator is None:
+        validator = BatchValidator(model)
+        _compiled[model] = validator
+    return validator
+
+
+def validate_batch(model: type, rows: list[dict[str, Any]]) -> dict[int, list[ValidationError]]:
+    return compile_validator(model).validate(rows)
+
+
+__all__ = ["BatchValidator", "ColumnPlan", "compile_check", "compile_validator", "validate_batch"]
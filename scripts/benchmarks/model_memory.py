@@ -0,0 +1,66 @@
+import gc
+import tracemalloc
+from datetime import datetime
+from quick.orm import models, columns, relations
+
+
+INSTANCES = 100_000
+
+
+def build_models(slots: bool) -> tuple[type, type]:
+    class User(models.Model, slots=slots):
+        id = columns.Integer(primary_key=True, auto_increment=True)
+        username = columns.String(max_length=50)
+        email = columns.String(max_length=100)
+        age = columns.Integer(nullable=True)
+        created_at = columns.DateTime(nullable=True)
+        
+        posts = relations.HasMany("posts", foreign_key="user_id")
+    
+    class Post(models.Model, slots=slots):
+        id = columns.Integer(primary_key=True, auto_increment=True)
+        user_id = columns.Integer()
+        title = columns.String(max_length=200)
+        content = columns.Text()
+        published_at = columns.DateTime(nullable=True)
+    
+    return User, Post
+
+
+def measure(model: type, record: dict) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    
+    instances = [model._from_record(record) for _ in range(INSTANCES)]
+    
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    per_instance = (after - before) / len(instances)
+    del instances
+    return per_instance
+
+
+def main() -> None:
+    now = datetime.now()
+    records = {
+        "User": {"id": 1, "username": "john_doe", "email": "john@example.com", "age": 30, "created_at": now},
+        "Post": {"id": 1, "user_id": 1, "title": "Hello", "content": "Body", "published_at": now},
+    }
+    
+    print(f"{'model':<8}{'dict bytes':>14}{'slots bytes':>14}{'saved':>10}")
+    
+    dict_models = build_models(slots=False)
+    slot_models = build_models(slots=True)
+    
+    for dict_model, slot_model in zip(dict_models, slot_models):
+        record = records[dict_model.__name__]
+        dict_size = measure(dict_model, record)
+        slot_size = measure(slot_model, record)
+        saved = 1 - slot_size / dict_size
+        print(f"{dict_model.__name__:<8}{dict_size:>14.0f}{slot_size:>14.0f}{saved:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,9 +24,8 @@ async def main():
     
     for user in users:
         print(f"User: {user['username']}")
-        if hasattr(user, "_posts_loaded"):
-            for post in user._posts_loaded:
-                print(f"  - Post: {post['title']}")
+        for post in user.posts or []:
+            print(f"  - Post: {post['title']}")
     
     await database.disconnect()
 
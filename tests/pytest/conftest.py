@@ -0,0 +1,165 @@
+import asyncio
+import asyncpg
+from quick.orm import Quick
+from quick.orm.core.metrics import RecordingMetrics
+
+
+class FakeTransaction:
+    def __init__(self, connection, options):
+        self.connection = connection
+        self.options = options
+        self.depth = 0
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+    
+    async def start(self):
+        connection = self.connection
+        if connection.depth and self.options.get("isolation"):
+            outer = connection.options[0].get("isolation") or "read_committed"
+            if self.options["isolation"] != outer:
+                raise asyncpg.InterfaceError("nested transaction has a different isolation level")
+        if not connection.depth:
+            connection.options.clear()
+        connection.depth += 1
+        self.depth = connection.depth
+        connection.options.append(self.options)
+        connection.log.append(("begin", self.depth))
+    
+    async def commit(self):
+        self.connection.depth -= 1
+        self.connection.log.append(("commit", self.depth))
+    
+    async def rollback(self):
+        self.connection.depth -= 1
+        self.connection.log.append(("rollback", self.depth))
+
+
+class FakeConnection:
+    def __init__(self, name="conn0", delay=0.0):
+        self.name = name
+        self.delay = delay
+        self.log = []
+        self.queries = []
+        self.args = []
+        self.timeouts = []
+        self.rows = []
+        self.responder = None
+        self.errors = []
+        self.options = []
+        self.prepared = []
+        self.depth = 0
+        self.busy = False
+        self.listeners = []
+    
+    def transaction(self, **options):
+        return FakeTransaction(self, options)
+    
+    def is_in_transaction(self):
+        return self.depth > 0
+    
+    async def _query(self, kind, query, args, timeout):
+        if self.busy:
+            raise asyncpg.InterfaceError("another operation is in progress")
+        self.busy = True
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.busy = False
+        
+        self.log.append((kind, query))
+        self.queries.append(query)
+        self.args.append(args)
+        self.timeouts.append(timeout)
+        
+        if self.errors:
+            raise self.errors.pop(0)
+        if kind != "fetch":
+            return None
+        if self.responder is not None:
+            return self.responder(query, args)
+        return self.rows.pop(0) if self.rows else []
+    
+    async def execute(self, query, *args, timeout=None):
+        await self._query("execute", query, args, timeout)
+        return self.name
+    
+    async def executemany(self, query, args, timeout=None):
+        await self._query("executemany", query, args, timeout)
+    
+    async def fetch(self, query, *args, timeout=None):
+        return await self._query("fetch", query, args, timeout)
+    
+    async def fetchrow(self, query, *args, timeout=None):
+        rows = await self._query("fetch", query, args, timeout)
+        return rows[0] if rows else None
+    
+    async def fetchval(self, query, *args, column=0, timeout=None):
+        row = await self.fetchrow(query, *args, timeout=timeout)
+        return list(row.values())[column] if row else None
+    
+    async def prepare(self, query, timeout=None):
+        self.prepared.append(query)
+    
+    def add_termination_listener(self, callback):
+        self.listeners.append(callback)
+    
+    def close(self):
+        for listener in self.listeners:
+            listener(self)
+
+
+class FakeAcquire:
+    def __init__(self, pool):
+        self.pool = pool
+        self.connection = None
+    
+    async def __aenter__(self):
+        await self.pool.semaphore.acquire()
+        self.connection = self.pool.idle.pop()
+        self.pool.acquired.append(self.connection)
+        return self.connection
+    
+    async def __aexit__(self, *exc):
+        self.connection.log.append(("release",))
+        self.pool.released.append(self.connection)
+        self.pool.idle.append(self.connection)
+        self.pool.semaphore.release()
+
+
+class FakePool:
+    def __init__(self, size=1, delay=0.0):
+        self.connections = [FakeConnection(f"conn{index}", delay) for index in range(size)]
+        self.idle = self.connections[::-1]
+        self.semaphore = asyncio.Semaphore(size)
+        self.acquired = []
+        self.released = []
+    
+    def acquire(self, timeout=None):
+        return FakeAcquire(self)
+    
+    def get_size(self):
+        return len(self.connections)
+    
+    def get_idle_size(self):
+        return len(self.idle)
+    
+    async def close(self):
+        pass
+
+
+async def make_database(size=1, delay=0.0, min_pool_size=1, **settings):
+    metrics = settings.pop("metrics", None) or RecordingMetrics()
+    database = Quick(min_pool_size=min_pool_size, max_pool_size=size, metrics=metrics, **settings)
+    for pool in database._lanes.values():
+        pool._pool = FakePool(pool.config.max_pool_size, delay)
+        for connection in pool._pool.connections:
+            await pool._init_connection(connection)
+    return database, metrics
@@ -0,0 +1,78 @@
+import uuid
+import pytest
+from quick.orm import models, columns, ConfigurationError
+from quick.orm.core.codecs import JSONCodec, TypeCodec, build_codecs
+from quick.orm.core.config import DatabaseConfig
+from quick.orm.core.connection import ConnectionPool
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.codecs = []
+    
+    async def set_type_codec(self, typename, *, encoder, decoder, schema, format):
+        self.codecs.append((schema, typename, format))
+    
+    def add_termination_listener(self, callback):
+        pass
+
+
+def test_jsonb_codec_uses_binary_format_with_version_byte():
+    codec = JSONCodec().type_codec("jsonb")
+    
+    encoded = codec.encoder({"a": [1, 2]})
+    
+    assert codec.format == "binary"
+    assert encoded[:1] == b"\x01"
+    assert codec.decoder(encoded) == {"a": [1, 2]}
+
+
+def test_json_codecs_pass_pre_serialized_strings_through():
+    binary = JSONCodec().type_codec("jsonb")
+    text = JSONCodec().type_codec("json", binary=False)
+    
+    assert binary.encoder('{"a": 1}') == b'\x01{"a": 1}'
+    assert text.encoder('{"a": 1}') == '{"a": 1}'
+    assert binary.decoder(binary.encoder('{"a": 1}')) == {"a": 1}
+
+
+def test_build_codecs_applies_config_options():
+    config = DatabaseConfig(native_uuid=True, numeric_as_float=True, codecs=[TypeCodec("money", str, str)])
+    
+    codecs = {codec.typename: codec for codec in build_codecs(config)}
+    value = uuid.uuid4()
+    
+    assert set(codecs) == {"json", "jsonb", "uuid", "numeric", "money"}
+    assert codecs["uuid"].decoder(codecs["uuid"].encoder(value)) == value
+    assert codecs["numeric"].decoder("1.50") == 1.5
+    assert [codec.typename for codec in build_codecs(DatabaseConfig(json_codec=None))] == []
+
+
+def test_column_declared_codec_replaces_default_and_detects_conflicts():
+    custom = JSONCodec(loads=lambda data: ("custom", data))
+    
+    class Event(models.Model):
+        id = columns.Integer(primary_key=True)
+        payload = columns.JSONB(codec=custom)
+    
+    class Audit(models.Model):
+        id = columns.Integer(primary_key=True)
+        payload = columns.JSONB(codec=JSONCodec())
+    
+    codecs = {codec.typename: codec for codec in build_codecs(DatabaseConfig(), [Event])}
+    
+    assert codecs["jsonb"].decoder(b"\x01{}")[0] == "custom"
+    
+    with pytest.raises(ConfigurationError):
+        build_codecs(DatabaseConfig(), [Event, Audit])
+
+
+@pytest.mark.asyncio
+async def test_pool_init_registers_codecs_on_each_connection():
+    pool = ConnectionPool(DatabaseConfig())
+    pool._codecs = build_codecs(pool.config)
+    connection = RecordingConnection()
+    
+    await pool._init_connection(connection)
+    
+    assert connection.codecs == [("pg_catalog", "json", "binary"), ("pg_catalog", "jsonb", "binary")]
@@ -0,0 +1,114 @@
+import pytest
+import asyncpg
+from conftest import FakeConnection, FakePool
+from quick.orm import Quick, ConfigurationError, TransactionError
+from quick.orm.core.config import DatabaseConfig
+from quick.orm.core.connection import ConnectionPool
+
+
+def test_from_url_parses_pool_and_session_settings():
+    config = DatabaseConfig.from_url(
+        "postgresql://app:secret@db:6432/main"
+        "?max_pool_size=50&statement_cache_size=0&max_inactive_connection_lifetime=60"
+        "&application_name=api&server_settings.work_mem=64MB&sslmode=verify-full&query_timeout=5"
+    )
+    
+    assert (config.host, config.port, config.database) == ("db", 6432, "main")
+    assert config.max_pool_size == 50
+    assert config.statement_cache_size == 0
+    assert config.max_inactive_connection_lifetime == 60.0
+    assert config.query_timeout == 5.0
+    assert config.ssl == "verify-full"
+    assert config.session_settings() == {"application_name": "api", "jit": "off", "work_mem": "64MB"}
+
+
+def test_quick_from_url_keeps_every_setting():
+    database = Quick.from_url("postgresql://u:p@h/d?statement_cache_size=10&pool_recycle=0")
+    
+    assert database.config.statement_cache_size == 10
+    assert database.config.pool_recycle == 0
+
+
+@pytest.mark.asyncio
+async def test_connect_passes_settings_to_pool(monkeypatch):
+    captured = {}
+    
+    async def create_pool(**kwargs):
+        captured.update(kwargs)
+        return FakePool()
+    
+    monkeypatch.setattr(asyncpg, "create_pool", create_pool)
+    pool = ConnectionPool(DatabaseConfig(pool_recycle=0, statement_cache_size=25, ssl="require"))
+    
+    await pool.connect()
+    await pool.disconnect()
+    
+    assert captured["statement_cache_size"] == 25
+    assert captured["max_inactive_connection_lifetime"] == 300.0
+    assert captured["server_settings"] == {"application_name": "quick-opg", "jit": "off"}
+    assert captured["ssl"] == "require"
+    assert captured["init"] == pool._init_connection
+
+
+def test_transaction_pooling_disables_statement_cache_and_session_settings():
+    config = DatabaseConfig(pooler_mode="transaction", statement_cache_size=500)
+    
+    assert config.effective_statement_cache_size() == 0
+    assert config.session_settings() == {"application_name": "quick-opg"}
+    
+    config.server_settings["work_mem"] = "64MB"
+    with pytest.raises(ConfigurationError):
+        config.session_settings()
+    
+    with pytest.raises(ConfigurationError):
+        config.require_session_pooling("prepare()")
+    
+    with pytest.raises(ConfigurationError):
+        DatabaseConfig(pooler_mode="statement").transaction_pooling
+
+
+def cursor_connection(*batches, in_transaction=True):
+    connection = FakeConnection()
+    connection.depth = 1 if in_transaction else 0
+    connection.rows = list(batches)
+    return connection
+
+
+@pytest.mark.asyncio
+async def test_transaction_pooling_streams_through_sql_cursor():
+    pool = ConnectionPool(DatabaseConfig(pooler_mode="transaction"))
+    connection = cursor_connection([{"id": 1}, {"id": 2}], [])
+    
+    rows = [row async for row in pool.cursor(connection, "SELECT id FROM t WHERE id > $1", 0)]
+    
+    assert rows == [{"id": 1}, {"id": 2}]
+    assert connection.queries[0] == "DECLARE quick_stream_0 NO SCROLL CURSOR FOR SELECT id FROM t WHERE id > $1"
+    assert connection.args[0] == (0,)
+    assert connection.queries[1] == "FETCH 500 FROM quick_stream_0"
+    assert connection.queries[-1] == "CLOSE quick_stream_0"
+    
+    with pytest.raises(TransactionError):
+        [row async for row in pool.cursor(cursor_connection(in_transaction=False), "SELECT 1")]
+
+
+@pytest.mark.asyncio
+async def test_sql_cursors_are_unique_and_closed_when_abandoned():
+    pool = ConnectionPool(DatabaseConfig(pooler_mode="transaction"))
+    connection = cursor_connection([{"id": 1}, {"id": 2}], [{"id": 3}], [])
+    
+    outer = pool.cursor(connection, "SELECT id FROM a")
+    async for row in outer:
+        inner = [row async for row in pool.cursor(connection, "SELECT id FROM b")]
+        break
+    await outer.aclose()
+    
+    assert inner == [{"id": 3}]
+    assert connection.queries == [
+        "DECLARE quick_stream_0 NO SCROLL CURSOR FOR SELECT id FROM a",
+        "FETCH 500 FROM quick_stream_0",
+        "DECLARE quick_stream_1 NO SCROLL CURSOR FOR SELECT id FROM b",
+        "FETCH 500 FROM quick_stream_1",
+        "FETCH 500 FROM quick_stream_1",
+        "CLOSE quick_stream_1",
+        "CLOSE quick_stream_0",
+    ]
@@ -156,3 +156,18 @@ def test_code_generator_generate_model():
     assert "class User(models.Model):" in code
     assert "id = columns.Integer" in code
     assert "username = columns.String" in code
+
+
+def test_code_generator_generate_slotted_model():
+    generator = CodeGenerator()
+    
+    model = {
+        "name": "events",
+        "model": "Event",
+        "slots": True,
+        "columns": [{"name": "id", "type": "integer", "primary_key": True}],
+    }
+    
+    code = generator.generate_model(model)
+    
+    assert "class Event(models.Model, slots=True):" in code
@@ -0,0 +1,248 @@
+import pytest
+from quick.orm import models, columns, validators
+
+
+@models.table("documents")
+class Document(models.Model):
+    id = columns.Integer(primary_key=True, auto_increment=True)
+    title = columns.String(max_length=200, validators=[validators.MinLength(1)])
+    payload = columns.JSONB(nullable=True)
+    views = columns.Integer(default=0)
+
+
+class RecordingDatabase:
+    def __init__(self, row=None):
+        self.calls = []
+        self.row = row
+    
+    async def execute(self, query, *args):
+        self.calls.append((query, args))
+        return "UPDATE 1"
+    
+    async def fetchrow(self, query, *args):
+        self.calls.append((query, args))
+        return self.row
+
+
+def test_new_instance_allows_missing_generated_primary_key():
+    document = Document(title="draft")
+    
+    assert document.id is None
+    assert document.views == 0
+    assert not document.is_persisted
+
+
+def test_hydrated_instance_tracks_only_real_changes():
+    document = Document._from_record({"id": 1, "title": "a", "payload": {"k": 1}, "views": 3})
+    
+    assert document.get_changes() == {}
+    
+    document.title = "a"
+    document.views = 4
+    
+    assert document.get_changes() == {"views": 4}
+
+
+@pytest.mark.asyncio
+async def test_save_updates_only_changed_columns():
+    database = RecordingDatabase()
+    document = Document._from_record({"id": 7, "title": "a", "payload": {"big": "x" * 100}, "views": 3})
+    
+    await document.save(database)
+    assert database.calls == []
+    
+    document.views = 4
+    await document.save(database)
+    
+    assert database.calls == [("UPDATE documents SET views = $1 WHERE id = $2", (4, 7))]
+    assert not document.has_changes()
+
+
+def test_reassigned_mutable_value_edited_in_place_is_dirty():
+    document = Document._from_record({"id": 1, "title": "a", "payload": {"k": 1}, "views": 3})
+    
+    payload = document.payload
+    payload["k"] = 2
+    document.payload = payload
+    
+    assert document.get_changes() == {"payload": {"k": 2}}
+    assert document.has_changes()
+
+
+@pytest.mark.asyncio
+async def test_save_inserts_new_instance():
+    database = RecordingDatabase(row={"id": 11, "title": "new", "payload": None, "views": 0})
+    document = Document(title="new")
+    
+    await document.save(database)
+    
+    assert database.calls == [(
+        "INSERT INTO documents (title, payload, views) VALUES ($1, $2, $3) RETURNING *",
+        ("new", None, 0),
+    )]
+    assert document.id == 11
+    assert document.is_persisted
+
+
+@models.table("counters")
+class Counter(models.Model):
+    id = columns.Integer(primary_key=True, auto_increment=True)
+    value = columns.Integer(default=0)
+    version = columns.Version()
+
+
+def test_version_column_is_detected():
+    assert Counter.__version_column__ == "version"
+    assert Document.__version_column__ is None
+    assert Counter(value=1).version == 1
+
+
+@pytest.mark.asyncio
+async def test_versioned_save_checks_and_bumps_version():
+    database = RecordingDatabase(row={"version": 4})
+    counter = Counter._from_record({"id": 2, "value": 10, "version": 3})
+    
+    counter.value = 11
+    await counter.save(database)
+    
+    assert database.calls == [(
+        "UPDATE counters SET value = $1, version = version + 1 WHERE id = $2 AND version = $3 RETURNING version",
+        (11, 2, 3),
+    )]
+    assert counter.version == 4
+    assert not counter.has_changes()
+
+
+@pytest.mark.asyncio
+async def test_versioned_save_raises_on_conflict():
+    from quick.orm.exceptions import VersionConflictError
+    
+    counter = Counter._from_record({"id": 2, "value": 10, "version": 3})
+    counter.value = 11
+    
+    with pytest.raises(VersionConflictError):
+        await counter.save(RecordingDatabase(row=None))
+
+
+def test_update_builder_where_version():
+    from quick.orm.query.update import UpdateBuilder
+    
+    query, params = UpdateBuilder(Counter, None).set(value=5).where("id = $1", 2).where_version(3)._build_update_query()
+    
+    assert query == "UPDATE counters SET value = $1, version = version + 1 WHERE id = $2 AND version = $3"
+    assert params == [5, 2, 3]
+
+
+def test_slotted_model_has_no_instance_dict():
+    from quick.orm import relations
+    
+    class Slotted(models.Model, slots=True):
+        id = columns.Integer(primary_key=True)
+        name = columns.String(max_length=20)
+        
+        children = relations.HasMany("documents", foreign_key="slotted_id")
+    
+    instance = Slotted._from_record({"id": 1, "name": "a"})
+    
+    assert not hasattr(instance, "__dict__")
+    assert instance.children is None
+    
+    instance.children = []
+    instance.name = "b"
+    
+    assert instance.children == []
+    assert instance.get_changes() == {"name": "b"}
+    assert instance.to_dict() == {"id": 1, "name": "b"}
+
+
+def test_slotted_subclass_adds_slots_for_new_columns():
+    class Base(models.Model, slots=True):
+        id = columns.Integer(primary_key=True)
+    
+    class Child(Base):
+        label = columns.String(max_length=20, nullable=True)
+    
+    child = Child(id=3, label="x")
+    
+    assert Child.__slotted__
+    assert not hasattr(child, "__dict__")
+    assert (child.id, child.label) == (3, "x")
+    
+    with pytest.raises(TypeError):
+        class Broken(Base, slots=False):
+            pass
+
+
+def test_generated_constructor_applies_defaults_and_validators():
+    assert getattr(Document.__init__, "__quick_generated__", False)
+    
+    document = Document(title="x")
+    
+    assert document.views == 0
+    assert document.payload is None
+    
+    with pytest.raises(ValueError):
+        Document(title="")
+    
+    with pytest.raises(ValueError):
+        Document()
+
+
+def test_generated_from_record_snapshots_values():
+    document = Document._from_record({"id": 5, "title": "t", "payload": None, "views": None})
+    
+    assert document.views == 0
+    assert document._original == (5, "t", None, 0)
+    assert not document.has_changes()
+
+
+def test_custom_init_keeps_generic_hydration():
+    class Custom(models.Model):
+        id = columns.Integer(primary_key=True)
+        
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.extra = "set"
+    
+    instance = Custom._from_record({"id": 1})
+    
+    assert instance.extra == "set"
+    assert instance.id == 1
+    assert instance.is_persisted
+
+
+class CountingRecord(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = []
+    
+    def get(self, key, default=None):
+        self.reads.append(key)
+        return super().get(key, default)
+
+
+def test_lazy_instance_decodes_only_accessed_columns():
+    record = CountingRecord({"id": 2, "title": "t", "payload": {"k": 1}, "views": None})
+    document = Document._from_record_lazy(record)
+    
+    assert document.is_lazy and document.is_persisted
+    assert document.title == "t"
+    assert document.title == "t"
+    assert document.views == 0
+    assert record.reads == ["title", "views"]
+    assert not document.has_changes()
+
+
+def test_lazy_instance_promotes_on_write():
+    class Wide(models.Model, slots=True, lazy=True):
+        id = columns.Integer(primary_key=True)
+        name = columns.String(max_length=20)
+        notes = columns.Text(nullable=True)
+    
+    instance = Wide._from_record_lazy({"id": 1, "name": "a", "notes": "n"})
+    instance.name = "b"
+    
+    assert Wide.__lazy__
+    assert not instance.is_lazy
+    assert instance._original == (1, "a", "n")
+    assert instance.get_changes() == {"name": "b"}
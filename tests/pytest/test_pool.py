@@ -0,0 +1,454 @@
+import pytest
+import asyncio
+from quick.orm import PoolOverloadedError, PoolTimeoutError, ConfigurationError, DeadlineExceededError, models, columns
+from quick.orm.core.adaptive import AdaptiveController, AdaptiveSizing, BackendBudget
+from quick.orm.core.config import DatabaseConfig, LaneConfig
+from quick.orm.core.stats import Histogram
+from conftest import make_database
+
+
+@models.table("lane_jobs")
+class LaneJob(models.Model):
+    id = columns.Integer(primary_key=True, auto_increment=True)
+    name = columns.String(max_length=100)
+
+
+def test_histogram_percentiles_use_bucket_bounds():
+    histogram = Histogram((0.01, 0.1, 1.0))
+    for value in (0.005, 0.005, 0.05, 0.5):
+        histogram.observe(value)
+    
+    summary = histogram.summary()
+    assert summary.count == 4
+    assert summary.p50 == 0.01
+    assert summary.p95 == 0.5
+    assert summary.max == 0.5
+    assert summary.mean == pytest.approx(0.14)
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_track_waits_queries_and_lifetimes():
+    database, metrics = await make_database(size=2, delay=0.01)
+    
+    await asyncio.gather(*(database.fetch("SELECT 1") for _ in range(4)))
+    stats = database.pool_stats()
+    
+    assert stats.size == 2
+    assert stats.idle == 2
+    assert stats.in_use == 0
+    assert stats.waiting == 0
+    assert stats.acquires == 4
+    assert stats.queries == 4
+    assert stats.acquire_wait.count == 4
+    assert stats.acquire_wait.max >= 0.005
+    
+    waits = [value for name, value, _ in metrics.observations if name == "quick.pool.acquire_wait"]
+    assert len(waits) == 4
+    assert metrics.gauges["quick.pool.waiting"] >= 0
+    
+    for connection in database._pool._pool.connections:
+        connection.close()
+    stats = database.pool_stats()
+    
+    assert stats.connections_opened == 2
+    assert stats.connections_closed == 2
+    assert stats.queries_per_connection.count == 2
+    assert stats.connection_lifetime.count == 2
+
+
+@pytest.mark.asyncio
+async def test_awaited_acquire_is_tracked_until_release():
+    database, _ = await make_database(size=1)
+    pool = database._pool
+    
+    connection = await pool.acquire()
+    assert connection is pool._pool.connections[0]
+    assert pool.stats().in_use == 1
+    
+    await connection.execute("SELECT 1")
+    await pool.release(connection)
+    await pool.release(connection)
+    
+    assert pool.stats().in_use == 0
+    assert pool.stats().queries == 0
+    assert pool._pool.released == [connection]
+    assert pool.gate.active == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_report_saturation_while_waiting():
+    database, _ = await make_database(size=1)
+    pool = database._pool
+    
+    async with pool.acquire():
+        waiter = asyncio.create_task(database.fetch("SELECT 1"))
+        await asyncio.sleep(0)
+        stats = database.pool_stats()
+        assert stats.in_use == 1
+        assert stats.waiting == 1
+        assert stats.utilization == 1.0
+        assert stats.saturated
+    
+    await waiter
+    assert database.pool_stats().waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_timeout_raises_pool_timeout():
+    database, metrics = await make_database(size=1, acquire_timeout=0.01)
+    
+    async with database._pool.acquire():
+        with pytest.raises(PoolTimeoutError):
+            await database.fetch("SELECT 1")
+    
+    assert database.pool_stats().timeouts == 1
+    assert database._pool.gate.waiting == 0
+    assert database._pool.gate.active == 0
+    assert ("quick.pool.timeout", 1, {}) in metrics.counters
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_by_priority():
+    database, _ = await make_database(size=1)
+    order = []
+    
+    async def query(name, priority):
+        with database.priority(priority):
+            await database.fetch("SELECT 1")
+        order.append(name)
+    
+    async with database._pool.acquire():
+        tasks = [
+            asyncio.create_task(query("low", "low")),
+            asyncio.create_task(query("normal", "normal")),
+            asyncio.create_task(query("high", "high")),
+        ]
+        await asyncio.sleep(0)
+    
+    await asyncio.gather(*tasks)
+    assert order == ["high", "normal", "low"]
+    
+    with pytest.raises(ConfigurationError):
+        database.priority("urgent").__enter__()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_sheds_lowest_priority_waiter_first():
+    database, _ = await make_database(size=1, max_waiters=1)
+    
+    async def query(priority):
+        with database.priority(priority):
+            return await database.fetch("SELECT 1")
+    
+    async with database._pool.acquire():
+        low = asyncio.create_task(query("low"))
+        await asyncio.sleep(0)
+        normal = asyncio.create_task(query("normal"))
+        await asyncio.sleep(0)
+        
+        with pytest.raises(PoolOverloadedError):
+            await low
+        with pytest.raises(PoolOverloadedError) as error:
+            await query("low")
+        assert error.value.priority == "low"
+    
+    assert await normal == []
+    assert database.pool_stats().rejected == 2
+    assert database._pool.gate.waiting == 0
+    assert database._pool.gate.active == 0
+
+
+def test_lane_config_overrides_size_timeouts_and_settings():
+    config = DatabaseConfig(
+        max_pool_size=20,
+        lanes={"batch": LaneConfig(max_pool_size=4, query_timeout=600.0, server_settings={"work_mem": "256MB"})},
+    )
+    
+    batch = config.for_lane("batch")
+    assert batch.max_pool_size == 4
+    assert batch.min_pool_size == config.min_pool_size
+    assert batch.query_timeout == 600.0
+    assert batch.server_settings == {"jit": "off", "work_mem": "256MB"}
+    assert batch.lanes == {}
+    assert config.for_lane("default") is config
+    
+    with pytest.raises(ConfigurationError):
+        config.for_lane("reports")
+
+
+@pytest.mark.asyncio
+async def test_builders_and_context_select_lanes():
+    database, _ = await make_database(lanes={"batch": LaneConfig(max_pool_size=1, server_settings={"statement_timeout": "10min"})})
+    default = database._lanes["default"]._pool.connections[0]
+    batch = database._lanes["batch"]._pool.connections[0]
+    
+    assert database.lanes == ("default", "batch")
+    assert database._lanes["batch"].gate.capacity == 1
+    
+    await database.select(LaneJob).lane("batch").get()
+    await database.select(LaneJob).get()
+    assert len(batch.queries) == 1
+    assert len(default.queries) == 1
+    
+    with database.lane("batch"):
+        await database.select(LaneJob).get()
+        await database.fetch("SELECT 1")
+    assert len(batch.queries) == 3
+    assert database.pool_stats("batch").acquires == 3
+    
+    with pytest.raises(ConfigurationError):
+        database.select(LaneJob).lane("reports")
+
+
+@pytest.mark.asyncio
+async def test_adaptive_controller_grows_on_waiters_and_shrinks_after_cooldown():
+    database, metrics = await make_database(size=8, min_pool_size=2)
+    pool = database._pool
+    controller = AdaptiveController(pool, AdaptiveSizing(step=2, cooldown=10.0, target_wait=0.005))
+    controller.apply(controller.floor)
+    assert pool.gate.capacity == 2
+    
+    pool.gate.waiting = 3
+    controller.apply(controller.target(0.0))
+    assert pool.gate.capacity == 4
+    
+    pool.gate.waiting = 0
+    pool.monitor.waited(0.05)
+    controller.apply(controller.target(1.0))
+    assert pool.gate.capacity == 6
+    
+    assert controller.target(2.0) == 6
+    assert controller.target(11.0) == 6
+    assert controller.target(12.0) == 4
+    
+    pool.monitor.peak_in_use = 4
+    assert controller.target(30.0) == 4
+    assert metrics.gauges["quick.pool.limit"] == 6
+
+
+def test_backend_budget_is_shared_between_owners(tmp_path):
+    path = str(tmp_path / "budget.json")
+    budget = BackendBudget(path, limit=10)
+    
+    assert budget.allocate(6, "api") == 6
+    assert budget.allocate(6, "worker") == 4
+    assert budget.total() == 10
+    
+    budget.release("api")
+    assert budget.allocate(6, "worker") == 6
+    
+    with open(path, "w") as handle:
+        handle.write('{"4194305:gone": 9}')
+    assert budget.allocate(8, "worker") == 8
+    
+    assert budget.allocate(5, "api") == 2
+    assert budget.allocate(5, "cron") == 1
+    assert budget.total() == 11
+
+
+def test_backend_budget_requires_file_locking(tmp_path, monkeypatch):
+    from quick.orm.core import adaptive
+    
+    monkeypatch.setattr(adaptive, "fcntl", None)
+    with pytest.raises(ConfigurationError):
+        BackendBudget(str(tmp_path / "budget.json"), limit=4)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_controller_claims_and_releases_budget(tmp_path):
+    budget = BackendBudget(str(tmp_path / "budget.json"), limit=3)
+    budget.allocate(2, "other")
+    database, _ = await make_database(size=8, min_pool_size=2)
+    controller = AdaptiveController(database._pool, AdaptiveSizing(interval=60.0, budget=budget))
+    
+    await controller.start()
+    assert database._pool.gate.capacity == 2
+    assert database.pool_stats().limit == 2
+    assert budget.total() == 4
+    
+    controller.apply(1)
+    assert database._pool.gate.capacity == 2
+    
+    await controller.stop()
+    assert budget.total() == 2
+
+
+@pytest.mark.asyncio
+async def test_adaptive_floor_leaves_room_for_consistent_parallel_streams():
+    database, _ = await make_database(size=8, min_pool_size=1)
+    controller = AdaptiveController(database._pool, AdaptiveSizing())
+    single, _ = await make_database(size=1, min_pool_size=1)
+    
+    assert controller.floor == 2
+    assert AdaptiveController(single._pool, AdaptiveSizing()).floor == 1
+
+
+@pytest.mark.asyncio
+async def test_deadlines_and_builder_timeouts_bound_query_timeouts():
+    database, _ = await make_database(size=1, query_timeout=30.0)
+    connection = database._pool._pool.connections[0]
+    
+    await database.fetch("SELECT 1")
+    with database.deadline(5.0):
+        await database.fetch("SELECT 1")
+        await database.select(LaneJob).timeout(0.5).get()
+        await database.select(LaneJob).timeout(60.0).get()
+    await database.select(LaneJob).timeout(120.0).get()
+    
+    assert connection.timeouts[0] == 30.0
+    assert 4.0 < connection.timeouts[1] <= 5.0
+    assert connection.timeouts[2] <= 0.5
+    assert 4.0 < connection.timeouts[3] <= 5.0
+    assert 119.0 < connection.timeouts[4] <= 120.0
+    
+    with pytest.raises(ValueError):
+        database.select(LaneJob).timeout(0)
+
+
+@pytest.mark.asyncio
+async def test_expired_deadline_fails_before_sending_query():
+    database, _ = await make_database(size=1)
+    connection = database._pool._pool.connections[0]
+    
+    with database.deadline(0.01):
+        await asyncio.sleep(0.02)
+        with pytest.raises(DeadlineExceededError):
+            await database.fetch("SELECT 1")
+    
+    assert connection.queries == []
+    assert database._pool.gate.active == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_query_releases_connection():
+    database, _ = await make_database(size=1)
+    database._pool._pool.connections[0].delay = 10.0
+    
+    task = asyncio.create_task(database.fetch("SELECT pg_sleep(10)"))
+    await asyncio.sleep(0.01)
+    assert database.pool_stats().in_use == 1
+    
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    
+    stats = database.pool_stats()
+    assert stats.in_use == 0
+    assert stats.idle == 1
+    assert database._pool.gate.active == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_selects_in_one_round_trip_on_one_connection():
+    database, _ = await make_database(size=2)
+    first, second = database._pool._pool.connections
+    first.rows = [[([(1, "a"), (2, "b")], [(3, "c")])], [{"id": 9, "name": "z"}]]
+    
+    jobs, named, selected = await database.batch(
+        database.select(LaneJob).order_by("id"),
+        database.select(LaneJob).where("name = $1", "c"),
+        database.select(LaneJob).select("id", "name"),
+    )
+    
+    assert [(job.id, job.name) for job in jobs] == [(1, "a"), (2, "b")]
+    assert [job.name for job in named] == ["c"]
+    assert [job.id for job in selected] == [9]
+    assert len(first.queries) == 2
+    assert first.queries[0].startswith("SELECT ARRAY(SELECT ROW(id, name) FROM lane_jobs ORDER BY id), ARRAY(")
+    assert second.queries == []
+    assert database.pool_stats().acquires == 1
+    
+    assert await database.batch() == []
+    with pytest.raises(ValueError):
+        await database.batch(database.insert(LaneJob).values(name="x"))
+
+
+@pytest.mark.asyncio
+async def test_parallel_batch_spreads_across_connections():
+    database, _ = await make_database(size=2, delay=0.01)
+    
+    results = await database.batch(database.select(LaneJob), database.select(LaneJob), parallel=True)
+    
+    assert results == [[], []]
+    assert all(len(connection.queries) == 1 for connection in database._pool._pool.connections)
+
+
+@pytest.mark.asyncio
+async def test_prepared_query_survives_pool_checkouts():
+    database, _ = await make_database(size=2)
+    first, second = database._pool._pool.connections
+    
+    find = await database.prepare(database.select(LaneJob).where("id = $1"), mode="first")
+    assert find.query == "SELECT id, name FROM lane_jobs WHERE id = $1 LIMIT 1"
+    assert first.prepared == [find.query]
+    
+    first.rows = [[{"id": 7, "name": "a"}], []]
+    job = await find(7)
+    assert (job.id, job.name) == (7, "a")
+    assert await find(8) is None
+    assert first.queries == [find.query, find.query]
+    
+    async with database._pool.acquire():
+        second.rows = [[{"id": 9, "name": "b"}]]
+        assert (await find(9)).id == 9
+    assert second.queries == [find.query]
+    
+    named = await database.prepare(database.select(LaneJob).where("name = $1", "a").where("id > $2"))
+    first.rows = [[{"id": 1, "name": "a"}, {"id": 2, "name": "a"}]]
+    assert [job.id for job in await named(0)] == [1, 2]
+    assert first.queries[-1] == "SELECT id, name FROM lane_jobs WHERE name = $1 AND id > $2"
+    
+    total = await database.prepare(database.select(LaneJob).select("COUNT(*)"), mode="value")
+    first.rows = [[{"count": 3}]]
+    assert await total() == 3
+
+
+@pytest.mark.asyncio
+async def test_prepare_rejects_invalid_handles():
+    database, _ = await make_database(size=1)
+    
+    with pytest.raises(ValueError):
+        await database.prepare(database.select(LaneJob), mode="one")
+    with pytest.raises(ValueError):
+        await database.prepare(database.insert(LaneJob).values(name="x"))
+    
+    pooled, _ = await make_database(size=1, pooler_mode="transaction")
+    with pytest.raises(ConfigurationError):
+        await pooled.prepare(pooled.select(LaneJob))
+
+
+@pytest.mark.asyncio
+async def test_prepared_query_uses_a_fresh_deferred_loader_per_call():
+    database, _ = await make_database(size=1)
+    connection = database._pool._pool.connections[0]
+    
+    find = await database.prepare(database.select(LaneJob).only("id"))
+    connection.rows = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+    
+    earlier = await find()
+    later = await find()
+    
+    assert earlier[0].__deferred__ is earlier[1].__deferred__
+    assert later[0].__deferred__ is not earlier[0].__deferred__
+    assert later[0].__deferred__.instances == later
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_lane_pinned_builders_on_their_lane():
+    database, _ = await make_database(lanes={"batch": LaneConfig(max_pool_size=1)})
+    default = database._lanes["default"]._pool.connections[0]
+    batch = database._lanes["batch"]._pool.connections[0]
+    default.rows = [[([(1, "a")], [(2, "b")])]]
+    batch.rows = [[([(3, "c")],)]]
+    
+    first, pinned, second = await database.batch(
+        database.select(LaneJob),
+        database.select(LaneJob).lane("batch"),
+        database.select(LaneJob).where("id > $1", 1),
+    )
+    
+    assert [job.id for job in first] == [1]
+    assert [job.id for job in pinned] == [3]
+    assert [job.id for job in second] == [2]
+    assert len(default.queries) == 1 and len(batch.queries) == 1
+    assert batch.queries[0] == "SELECT ARRAY(SELECT ROW(id, name) FROM lane_jobs)"
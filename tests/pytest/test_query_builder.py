@@ -0,0 +1,344 @@
+import pytest
+from conftest import make_database
+from quick.orm import models, columns
+from quick.orm.query.builder import QueryBuilder
+from quick.orm.query.batch import build_batch_query, batchable
+
+
+@models.table("articles")
+class Article(models.Model):
+    id = columns.Integer(primary_key=True, auto_increment=True)
+    title = columns.String(max_length=200)
+    body = columns.Text(nullable=True)
+
+
+@models.table("tickets")
+class Ticket(models.Model):
+    id = columns.Integer(primary_key=True, auto_increment=True)
+    tags = columns.Array("VARCHAR(20)", nullable=True)
+    mood = columns.Column(str, "mood", nullable=True)
+
+
+def test_key_ranges_cover_span():
+    ranges = QueryBuilder._key_ranges(1, 100, 8)
+    
+    assert ranges[0][0] == 1
+    assert ranges[-1][1] == 101
+    assert all(ranges[i][1] == ranges[i + 1][0] for i in range(len(ranges) - 1))
+    assert len(ranges) == 8
+
+
+def test_key_ranges_small_span():
+    ranges = QueryBuilder._key_ranges(5, 6, 8)
+    
+    assert ranges == [(5, 6), (6, 7)]
+
+
+def test_key_ranges_rejects_non_integer_keys():
+    with pytest.raises(ValueError):
+        QueryBuilder._key_ranges("a", "z", 4)
+
+
+@pytest.mark.asyncio
+async def test_parallel_stream_rejects_limit():
+    builder = QueryBuilder(Article, None).limit(10)
+    
+    with pytest.raises(ValueError):
+        async for _ in builder.parallel_stream():
+            pass
+
+
+def stream_rows(query, args):
+    if query.startswith("SELECT MIN"):
+        return [(1, 4)]
+    if query.startswith("FETCH"):
+        return [{"id": key, "title": f"t{key}", "body": None} for key in range(1, 5)]
+    return []
+
+
+@pytest.mark.asyncio
+async def test_parallel_stream_closes_cursor_when_abandoned():
+    database, _ = await make_database(size=2, pooler_mode="transaction")
+    for connection in database._pool._pool.connections:
+        connection.responder = stream_rows
+    
+    stream = database.select(Article).parallel_stream(partitions=1, buffer_size=1)
+    first = await stream.__anext__()
+    await stream.aclose()
+    
+    scanner = database._pool._pool.released[-1]
+    closed = scanner.log.index(("execute", "CLOSE quick_stream_0"))
+    
+    assert first.title == "t1"
+    assert scanner.log[closed + 1:] == [("rollback", 1), ("release",)]
+
+
+def test_build_explain_query_options():
+    from quick.orm.query.explain import build_explain_query
+    
+    sql = build_explain_query("SELECT 1", analyze=True, buffers=True, format="json")
+    
+    assert sql == "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT 1"
+    assert build_explain_query("SELECT 1") == "EXPLAIN (FORMAT JSON) SELECT 1"
+    assert build_explain_query("SELECT 1", analyze=True) == "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT 1"
+    assert build_explain_query("SELECT 1", analyze=True, buffers=False) == "EXPLAIN (ANALYZE, FORMAT JSON) SELECT 1"
+    
+    with pytest.raises(ValueError):
+        build_explain_query("SELECT 1", format="html")
+
+
+def test_query_plan_parsing():
+    from quick.orm.query.explain import QueryPlan
+    
+    raw = """[{"Plan": {"Node Type": "Nested Loop", "Total Cost": 42.5, "Plan Rows": 10,
+        "Actual Rows": 900, "Actual Loops": 1, "Plans": [
+            {"Node Type": "Seq Scan", "Relation Name": "articles", "Total Cost": 20.0, "Plan Rows": 10,
+             "Actual Rows": 900, "Actual Loops": 1},
+            {"Node Type": "Index Scan", "Relation Name": "users", "Index Name": "users_pkey",
+             "Total Cost": 0.3, "Plan Rows": 1, "Actual Rows": 1, "Actual Loops": 900}
+        ]}, "Planning Time": 0.1, "Execution Time": 3.2}]"""
+    
+    plan = QueryPlan(raw)
+    
+    assert plan.total_cost == 42.5
+    assert plan.estimated_rows == 10
+    assert plan.actual_rows == 900
+    assert plan.analyzed
+    assert [node.relation_name for node in plan.seq_scans] == ["articles"]
+    assert plan.indexes_used == {"users_pkey"}
+    assert {node.node_type for node in plan.misestimates()} == {"Nested Loop", "Seq Scan"}
+
+
+def test_insert_on_conflict_do_update():
+    from quick.orm.query.insert import InsertBuilder
+    
+    builder = (
+        InsertBuilder(Article, None)
+        .values(id=1, title="Hello")
+        .on_conflict(("id",))
+        .do_update(set=["title"], where="articles.title IS DISTINCT FROM EXCLUDED.title")
+    )
+    
+    query, params = builder._build_insert_query(with_status=True)
+    
+    assert query == (
+        "INSERT INTO articles (id, title) VALUES ($1, $2) "
+        "ON CONFLICT (id) DO UPDATE SET title = EXCLUDED.title "
+        "WHERE articles.title IS DISTINCT FROM EXCLUDED.title "
+        "RETURNING *, (xmax = 0) AS inserted"
+    )
+    assert params == [1, "Hello"]
+
+
+def test_insert_on_conflict_requires_action():
+    from quick.orm.query.insert import InsertBuilder
+    
+    builder = InsertBuilder(Article, None).values(title="Hello").on_conflict("id")
+    
+    with pytest.raises(ValueError):
+        builder._build_insert_query()
+    
+    with pytest.raises(ValueError):
+        InsertBuilder(Article, None).do_nothing()
+
+
+def test_bulk_upsert_defaults_to_all_non_target_columns():
+    from quick.orm.query.bulk import BulkInsertBuilder
+    
+    builder = (
+        BulkInsertBuilder(Article, None)
+        .values({"id": 1, "title": "a"}, {"id": 2, "title": "b"})
+        .on_conflict(["id"])
+        .do_update()
+    )
+    
+    query, params = builder._build_bulk_insert_query()
+    
+    assert query.endswith("ON CONFLICT (id) DO UPDATE SET title = EXCLUDED.title")
+    assert params == [1, "a", 2, "b"]
+
+
+def test_bulk_insert_chunks_respect_parameter_limit():
+    from quick.orm.query.bulk import BulkInsertBuilder, MAX_QUERY_PARAMETERS
+    
+    records = [{"id": i, "title": str(i)} for i in range(40000)]
+    builder = BulkInsertBuilder(Article, None).values(*records)
+    
+    chunks = builder._chunks()
+    
+    assert sum(len(chunk) for chunk in chunks) == 40000
+    assert all(len(chunk) * 2 <= MAX_QUERY_PARAMETERS for chunk in chunks)
+    assert len(builder.chunk_size(1000)._chunks()) == 40
+
+
+def test_for_update_skip_locked():
+    query, _ = QueryBuilder(Article, None).where("body IS NULL").order_by("id").limit(5).for_update(
+        skip_locked=True, of=["articles"]
+    )._build_select_query()
+    
+    assert query == "SELECT id, title, body FROM articles WHERE body IS NULL ORDER BY id LIMIT 5 FOR UPDATE OF articles SKIP LOCKED"
+
+
+def test_for_share_nowait_and_conflicting_options():
+    query, _ = QueryBuilder(Article, None).for_share(nowait=True, key=True)._build_select_query()
+    
+    assert query == "SELECT id, title, body FROM articles FOR KEY SHARE NOWAIT"
+    
+    with pytest.raises(ValueError):
+        QueryBuilder(Article, None).for_update(skip_locked=True, nowait=True)
+
+
+class FetchRecorder:
+    def __init__(self):
+        self.calls = []
+    
+    async def fetch(self, query, *args):
+        self.calls.append((query, args))
+        return [{"id": 3, "title": "claimed", "body": "worker-1"}]
+
+
+@pytest.mark.asyncio
+async def test_claim_selects_and_updates_in_one_statement():
+    database = FetchRecorder()
+    
+    claimed = await QueryBuilder(Article, database).where("body IS NULL").order_by("id").claim(10, body="worker-1")
+    
+    assert database.calls == [(
+        "UPDATE articles SET body = $1 WHERE id IN "
+        "(SELECT id FROM articles WHERE body IS NULL ORDER BY id LIMIT 10 FOR UPDATE SKIP LOCKED) RETURNING *",
+        ("worker-1",),
+    )]
+    assert claimed[0].title == "claimed"
+
+
+@pytest.mark.asyncio
+async def test_lazy_builder_wraps_records():
+    database = FetchRecorder()
+    
+    articles = await QueryBuilder(Article, database).lazy().get()
+    eager = await QueryBuilder(Article, database).get()
+    
+    assert articles[0].is_lazy
+    assert articles[0].title == "claimed"
+    assert not eager[0].is_lazy
+
+
+def test_select_lists_model_columns_and_respects_defer():
+    query, _ = QueryBuilder(Article, None).defer("body")._build_select_query()
+    only_query, _ = QueryBuilder(Article, None).only("title")._build_select_query()
+    
+    assert query == "SELECT id, title FROM articles"
+    assert only_query == "SELECT id, title FROM articles"
+    
+    with pytest.raises(ValueError):
+        QueryBuilder(Article, None).defer("id")
+    
+    with pytest.raises(ValueError):
+        QueryBuilder(Article, None).only("missing")
+
+
+class DeferredRecorder:
+    def __init__(self):
+        self.calls = []
+    
+    async def fetch(self, query, *args):
+        self.calls.append((query, args))
+        if "ANY" in query:
+            return [{"id": 1, "body": "first"}, {"id": 2, "body": "second"}]
+        return [{"id": 1, "title": "a"}, {"id": 2, "title": "b"}]
+
+
+@pytest.mark.asyncio
+async def test_deferred_columns_load_in_one_batched_query():
+    from quick.orm import DeferredColumnError
+    
+    database = DeferredRecorder()
+    articles = await QueryBuilder(Article, database).defer("body").get()
+    
+    assert articles[0].title == "a"
+    assert articles[0].deferred_columns == ("body",)
+    with pytest.raises(DeferredColumnError):
+        articles[0].body
+    
+    articles[1].title = "edited"
+    await articles[0].load_deferred()
+    await articles[1].load_deferred()
+    
+    assert database.calls[1] == ("SELECT id, body FROM articles WHERE id = ANY($1)", ([1, 2],))
+    assert len(database.calls) == 2
+    assert [article.body for article in articles] == ["first", "second"]
+    assert articles[1].get_changes() == {"title": "edited"}
+
+
+@pytest.mark.asyncio
+async def test_stream_shares_one_deferred_loader_per_chunk():
+    database, _ = await make_database(pooler_mode="transaction")
+    connection = database._pool._pool.connections[0]
+    connection.rows = [
+        [{"id": 1, "title": "a"}, {"id": 2, "title": "b"}, {"id": 3, "title": "c"}],
+        [],
+        [{"id": key, "body": f"body {key}"} for key in (1, 2, 3)],
+    ]
+    
+    articles = [article async for article in database.select(Article).defer("body").stream()]
+    loaders = {id(article.__deferred__) for article in articles}
+    await articles[0].load_deferred()
+    
+    assert len(loaders) == 1
+    assert connection.queries[-1] == "SELECT id, body FROM articles WHERE id = ANY($1)"
+    assert connection.args[-1] == ([1, 2, 3],)
+    assert [article.body for article in articles] == ["body 1", "body 2", "body 3"]
+
+
+@pytest.mark.asyncio
+async def test_to_dict_skips_unloaded_deferred_columns():
+    articles = await QueryBuilder(Article, DeferredRecorder()).defer("body").get()
+    
+    assert articles[0].to_dict() == {"id": 1, "title": "a"}
+    
+    articles[1].body = "set"
+    assert articles[1].to_dict() == {"id": 2, "title": "b", "body": "set"}
+    
+    await articles[0].load_deferred()
+    assert articles[0].to_dict() == {"id": 1, "title": "a", "body": "first"}
+
+
+def test_select_templates_are_cached():
+    from quick.orm.query.template import render_template
+    
+    builder = QueryBuilder(Article, None).where("id > $1", 1).order_by("id")
+    
+    first, params = builder._build_select_query()
+    hits = render_template.cache_info().hits
+    second, _ = builder.where("title = $2", "x").where("id > $1", 1)._build_select_query()
+    again, _ = QueryBuilder(Article, None).where("id > $1", 5).order_by("id")._build_select_query()
+    
+    assert first == again == "SELECT id, title, body FROM articles WHERE id > $1 ORDER BY id"
+    assert second != first
+    assert render_template.cache_info().hits == hits + 1
+    assert params == [1]
+    
+    entries = render_template.cache_info().currsize
+    pages = [builder.limit(15).offset(15 * page)._build_select_query()[0] for page in range(5)]
+    assert render_template.cache_info().currsize == entries
+    assert pages[2] == "SELECT id, title, body FROM articles WHERE id > $1 ORDER BY id LIMIT 15 OFFSET 30"
+
+
+def test_batch_query_combines_selects_and_renumbers_placeholders():
+    first = QueryBuilder(Article, None).where("id > $1", 10).order_by("id").limit(5)
+    second = QueryBuilder(Article, None).only("title").where("title = $1 AND id < $2", "a", 3)
+    
+    query, params = build_batch_query([first, second])
+    
+    assert query == (
+        "SELECT ARRAY(SELECT ROW(id, title, body) FROM articles WHERE id > $1 ORDER BY id LIMIT 5), "
+        "ARRAY(SELECT ROW(id, title) FROM articles WHERE title = $2 AND id < $3)"
+    )
+    assert params == [10, "a", 3]
+    assert not batchable(QueryBuilder(Article, None).select("COUNT(*)"))
+    assert not batchable(QueryBuilder(Article, None).for_update())
+    
+    assert batchable(QueryBuilder(Article, None))
+    assert not batchable(QueryBuilder(Article, None), text_codecs=frozenset({"text"}))
+    assert batchable(QueryBuilder(Ticket, None).defer("mood"))
+    assert not batchable(QueryBuilder(Ticket, None))
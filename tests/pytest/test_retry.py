@@ -0,0 +1,77 @@
+import pytest
+import asyncpg
+from conftest import FakePool
+from quick.orm.core.config import DatabaseConfig
+from quick.orm.core.connection import ConnectionPool
+from quick.orm.core.metrics import RecordingMetrics
+from quick.orm.core.retry import RetryPolicy, infer_idempotent, TRANSIENT, UNCERTAIN, PERMANENT
+
+
+def test_classifies_sqlstates():
+    policy = RetryPolicy()
+    
+    assert policy.classify(asyncpg.SerializationError("x")) == TRANSIENT
+    assert policy.classify(asyncpg.DeadlockDetectedError("x")) == TRANSIENT
+    assert policy.classify(asyncpg.ConnectionDoesNotExistError("x")) == UNCERTAIN
+    assert policy.classify(asyncpg.UniqueViolationError("x")) == PERMANENT
+    assert policy.classify(asyncpg.PostgresSyntaxError("x")) == PERMANENT
+    assert policy.classify(TimeoutError()) == PERMANENT
+
+
+def test_infers_idempotency_from_statement():
+    assert infer_idempotent("SELECT * FROM users")
+    assert infer_idempotent("  /* report */ WITH t AS (SELECT 1) SELECT * FROM t")
+    assert not infer_idempotent("DELETE FROM users WHERE id = $1")
+    assert infer_idempotent("INSERT INTO t (a) VALUES ($1) ON CONFLICT (a) DO NOTHING")
+    assert infer_idempotent("INSERT INTO t (a) VALUES ($1)\nON CONFLICT (a)\nDO\tNOTHING")
+    assert infer_idempotent("WITH t AS (SELECT deleted_at FROM users) SELECT * FROM t")
+    assert not infer_idempotent("WITH t AS (SELECT 1)\nINSERT\nINTO log SELECT * FROM t")
+    assert not infer_idempotent("WITH t AS (SELECT 1) DELETE\tFROM log")
+    assert not infer_idempotent("INSERT INTO t (a) VALUES ($1)")
+    assert not infer_idempotent("UPDATE t SET n = n + 1")
+    assert not infer_idempotent("EXPLAIN ANALYZE DELETE FROM t")
+
+
+def test_backoff_is_exponential_capped_and_bounded_by_deadline():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.5, jitter=False, deadline=1.0)
+    error = asyncpg.SerializationError("x")
+    
+    assert [policy.backoff(attempt) for attempt in (1, 2, 3, 4)] == [0.1, 0.2, 0.4, 0.5]
+    assert policy.next_delay(error, 1, False, 0.0) == 0.1
+    assert policy.next_delay(error, 2, False, 0.95) is None
+    assert policy.next_delay(error, 4, False, 0.0) is None
+    assert policy.next_delay(asyncpg.ConnectionDoesNotExistError("x"), 1, False, 0.0) is None
+    assert policy.next_delay(asyncpg.ConnectionDoesNotExistError("x"), 1, True, 0.0) == 0.1
+
+
+@pytest.mark.asyncio
+async def test_pool_retries_transient_errors_and_emits_metrics():
+    metrics = RecordingMetrics()
+    pool = ConnectionPool(DatabaseConfig(metrics=metrics, retry_policy=RetryPolicy(base_delay=0, jitter=False)))
+    pool._pool = FakePool()
+    connection = pool._pool.connections[0]
+    connection.errors = [asyncpg.DeadlockDetectedError("x"), asyncpg.SerializationError("x")]
+    
+    assert await pool.execute("UPDATE t SET a = 1") == "conn0"
+    assert len(connection.queries) == 3
+    assert [(name, tags["reason"]) for name, _, tags in metrics.counters] == [
+        ("quick.retry", "40P01"),
+        ("quick.retry", "40001"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pool_does_not_retry_integrity_errors_or_uncertain_inserts():
+    pool = ConnectionPool(DatabaseConfig(retry_policy=RetryPolicy(base_delay=0)))
+    pool._pool = FakePool()
+    connection = pool._pool.connections[0]
+    connection.errors = [asyncpg.UniqueViolationError("dup")]
+    
+    with pytest.raises(asyncpg.UniqueViolationError):
+        await pool.execute("INSERT INTO t (a) VALUES (1)")
+    assert len(connection.queries) == 1
+    
+    connection.errors = [asyncpg.ConnectionDoesNotExistError("lost")]
+    with pytest.raises(asyncpg.ConnectionDoesNotExistError):
+        await pool.execute("INSERT INTO t (a) VALUES (1)")
+    assert len(connection.queries) == 2
@@ -0,0 +1,157 @@
+import pytest
+import asyncpg
+from conftest import make_database
+from quick.orm import models, columns
+from quick.orm.core.config import LaneConfig
+from quick.orm.core.session import Session, IdentityMap
+
+
+@models.table("members")
+class Member(models.Model):
+    id = columns.Integer(primary_key=True, auto_increment=True)
+    name = columns.String(max_length=50)
+    email = columns.String(max_length=100, nullable=True)
+
+
+def respond(query, args):
+    if query.startswith("INSERT"):
+        return [{"id": 101 + offset // 2, "name": args[offset], "email": args[offset + 1]} for offset in range(0, len(args), 2)]
+    if query.startswith("SELECT"):
+        return [{"id": 1, "name": "ann", "email": None}]
+    return []
+
+
+def test_identity_map_reuses_instances():
+    identity_map = IdentityMap()
+    
+    first = identity_map.load(Member, {"id": 1, "name": "ann", "email": None})
+    second = identity_map.load(Member, {"id": 1, "name": "changed", "email": None})
+    
+    assert first is second
+    assert identity_map.get(Member, 1) is first
+    assert len(identity_map) == 1
+
+
+def test_identity_map_tracks_changes():
+    identity_map = IdentityMap()
+    
+    member = identity_map.load(Member, {"id": 1, "name": "ann", "email": None})
+    member.email = "ann@example.com"
+    
+    assert member.get_changes() == {"email": "ann@example.com"}
+
+
+@pytest.mark.asyncio
+async def test_session_flushes_grouped_statements():
+    database, _ = await make_database()
+    connection = database._pool._pool.connections[0]
+    connection.responder = respond
+    
+    async with Session(database) as session:
+        loaded = await session.get(Member, 1)
+        again = await session.get(Member, 1)
+        loaded.name = "anna"
+        
+        session.add(Member(name="bob"))
+        session.add(Member(name="cid"))
+        
+        session.delete(loaded)
+    
+    assert loaded is again
+    assert connection.queries[0] == "SELECT id, name, email FROM members WHERE id = $1 LIMIT 1"
+    assert connection.queries[1] == "INSERT INTO members (name, email) VALUES ($1, $2), ($3, $4) RETURNING *"
+    assert connection.queries[2] == "DELETE FROM members WHERE id = ANY($1)"
+    assert connection.args[2] == ([1],)
+    assert connection.log[-2:] == [("commit", 1), ("release",)]
+
+
+@pytest.mark.asyncio
+async def test_session_batches_updates_by_changed_columns():
+    database, _ = await make_database()
+    connection = database._pool._pool.connections[0]
+    
+    async with Session(database) as session:
+        members = [session.identity_map.load(Member, {"id": i, "name": f"m{i}", "email": None}) for i in range(3)]
+        for member in members:
+            member.name = member.name.upper()
+    
+    assert connection.queries == ["UPDATE members SET name = $1 WHERE id = $2"]
+    assert connection.args == [[("M0", 0), ("M1", 1), ("M2", 2)]]
+
+
+@pytest.mark.asyncio
+async def test_session_rolls_back_on_error():
+    database, _ = await make_database()
+    connection = database._pool._pool.connections[0]
+    
+    with pytest.raises(RuntimeError):
+        async with Session(database) as session:
+            session.add(Member(name="bob"))
+            raise RuntimeError("boom")
+    
+    assert connection.log == [("begin", 1), ("rollback", 1), ("release",)]
+
+
+@pytest.mark.asyncio
+async def test_session_binds_its_connection_for_pool_queries():
+    database, _ = await make_database(size=2)
+    pool = database._pool._pool
+    
+    async with Session(database) as session:
+        assert database._pool.bound_connection() is pool.connections[0]
+        await session.execute("UPDATE members SET name = $1", "x")
+        await database.execute("UPDATE members SET email = NULL")
+        async with database._pool.acquire() as connection:
+            assert connection is pool.connections[0]
+    
+    assert database._pool.bound_connection() is None
+    assert pool.acquired == pool.released == [pool.connections[0]]
+    assert pool.connections[0].log[-2:] == [("commit", 1), ("release",)]
+
+
+@pytest.mark.asyncio
+async def test_session_releases_its_connection_when_begin_fails():
+    database, _ = await make_database()
+    pool = database._pool._pool
+    
+    def refuse(**options):
+        raise asyncpg.InterfaceError("cannot begin")
+    
+    pool.connections[0].transaction = refuse
+    
+    with pytest.raises(asyncpg.InterfaceError):
+        async with Session(database):
+            pass
+    
+    assert database._pool.bound_connection() is None
+    assert pool.released == [pool.connections[0]]
+    assert pool.get_idle_size() == 1
+
+
+@pytest.mark.asyncio
+async def test_session_queries_honour_builder_timeout():
+    database, _ = await make_database()
+    connection = database._pool._pool.connections[0]
+    connection.responder = respond
+    
+    async with Session(database) as session:
+        members = await session.select(Member).timeout(5).get()
+        await session.select(Member).get()
+    
+    assert [member.name for member in members] == ["ann"]
+    assert 0 < connection.timeouts[0] <= 5
+    assert connection.timeouts[1] is None
+
+
+@pytest.mark.asyncio
+async def test_session_builders_accept_only_the_session_lane():
+    database, _ = await make_database(lanes={"reports": LaneConfig(max_pool_size=1)})
+    connection = database._pool._pool.connections[0]
+    connection.responder = respond
+    
+    async with Session(database) as session:
+        assert await session.select(Member).lane("default").first() is not None
+        with pytest.raises(ValueError):
+            session.select(Member).lane("reports")
+    
+    assert len(connection.queries) == 1
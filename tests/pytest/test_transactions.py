@@ -0,0 +1,179 @@
+import pytest
+import asyncio
+import asyncpg
+from conftest import FakePool, make_database
+from quick.orm.core.config import DatabaseConfig
+from quick.orm.core.connection import ConnectionPool
+from quick.orm.core.retry import RetryPolicy
+
+
+def make_pool(**settings):
+    pool = ConnectionPool(DatabaseConfig(**settings))
+    pool._pool = FakePool(2)
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_transaction_binds_connection_and_releases_it():
+    pool = make_pool()
+    
+    async with pool.transaction():
+        assert await pool.execute("UPDATE t SET a = 1") == "conn0"
+        async with pool.acquire() as connection:
+            assert connection is pool._pool.acquired[0]
+    
+    assert pool.bound_connection() is None
+    assert pool._pool.released == pool._pool.acquired
+    assert pool._pool.acquired[0].log == [("begin", 1), ("execute", "UPDATE t SET a = 1"), ("commit", 1), ("release",)]
+    assert await pool.execute("UPDATE t SET a = 1") == "conn0"
+    assert len(pool._pool.acquired) == 2
+
+
+@pytest.mark.asyncio
+async def test_transaction_rolls_back_and_releases_on_error():
+    pool = make_pool()
+    
+    with pytest.raises(RuntimeError):
+        async with pool.transaction():
+            raise RuntimeError("boom")
+    
+    assert pool._pool.acquired[0].log == [("begin", 1), ("rollback", 1), ("release",)]
+    assert pool._pool.released == pool._pool.acquired
+    assert pool.bound_connection() is None
+
+
+@pytest.mark.asyncio
+async def test_nested_transaction_reuses_bound_connection():
+    pool = make_pool()
+    
+    async with pool.transaction():
+        async with pool.transaction():
+            await pool.execute("SELECT 1")
+    
+    assert len(pool._pool.acquired) == 1
+    assert pool._pool.acquired[0].log == [
+        ("begin", 1),
+        ("begin", 2),
+        ("execute", "SELECT 1"),
+        ("commit", 2),
+        ("commit", 1),
+        ("release",),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_get_their_own_connection():
+    pool = make_pool()
+    
+    async def work():
+        async with pool.transaction():
+            await asyncio.sleep(0)
+            return await pool.execute("SELECT 1")
+    
+    assert sorted(await asyncio.gather(work(), work())) == ["conn0", "conn1"]
+    assert len(pool._pool.released) == 2
+
+
+@pytest.mark.asyncio
+async def test_child_tasks_share_the_transaction_connection_one_query_at_a_time():
+    pool = make_pool()
+    
+    async def nested():
+        async with pool.transaction():
+            return await pool.execute("SELECT 3")
+    
+    async with pool.transaction():
+        assert await asyncio.gather(pool.execute("SELECT 1"), pool.execute("SELECT 2")) == ["conn0", "conn0"]
+        assert await asyncio.wait_for(nested(), 1) == "conn0"
+        assert await asyncio.wait_for(pool.execute("SELECT 4"), 1) == "conn0"
+    
+    assert len(pool._pool.acquired) == 1
+    assert [entry for entry in pool._pool.acquired[0].log if entry[0] == "execute"] == [
+        ("execute", "SELECT 1"),
+        ("execute", "SELECT 2"),
+        ("execute", "SELECT 3"),
+        ("execute", "SELECT 4"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_nested_transaction_is_a_savepoint_and_passes_options():
+    pool = make_pool()
+    
+    async with pool.transaction(isolation="serializable", readonly=True, deferrable=True) as outer:
+        async with pool.transaction() as inner:
+            assert not outer.nested
+            assert inner.nested
+    
+    assert pool._pool.acquired[0].options[0] == {"isolation": "serializable", "readonly": True, "deferrable": True}
+    
+    with pytest.raises(ValueError):
+        pool.transaction(isolation="snapshot")
+    with pytest.raises(ValueError):
+        pool.transaction(deferrable=True)
+
+
+@pytest.mark.asyncio
+async def test_transactional_retries_serialization_failures():
+    database, metrics = await make_database(retry_policy=RetryPolicy(base_delay=0, jitter=False))
+    failures = [asyncpg.SerializationError("conflict"), asyncpg.DeadlockDetectedError("deadlock")]
+    
+    @database.transactional(retries=5)
+    async def increment(amount):
+        await database.execute("UPDATE counters SET value = value + $1", amount)
+        if failures:
+            raise failures.pop(0)
+        return amount
+    
+    assert await increment(3) == 3
+    
+    connection = database._pool._pool.connections[0]
+    outcomes = [entry for entry in connection.log if entry[0] in ("rollback", "commit")]
+    assert outcomes == [("rollback", 1), ("rollback", 1), ("commit", 1)]
+    assert connection.options[0]["isolation"] == "serializable"
+    assert len(database._pool._pool.released) == 3
+    assert [tags["reason"] for _, _, tags in metrics.counters] == ["40001", "40P01"]
+
+
+@pytest.mark.asyncio
+async def test_transactional_gives_up_after_retries_and_does_not_retry_nested():
+    database, _ = await make_database(retry_policy=RetryPolicy(base_delay=0))
+    calls = []
+    
+    @database.transactional(retries=1)
+    async def conflict():
+        calls.append(1)
+        raise asyncpg.SerializationError("conflict")
+    
+    with pytest.raises(asyncpg.SerializationError):
+        await conflict()
+    assert len(calls) == 2
+    
+    calls.clear()
+    with pytest.raises(asyncpg.SerializationError):
+        async with database.transaction():
+            await conflict()
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_transactional_inside_transaction_runs_in_a_savepoint():
+    database, _ = await make_database()
+    
+    @database.transactional()
+    async def record():
+        return await database.execute("INSERT INTO audit DEFAULT VALUES")
+    
+    async with database.transaction():
+        assert await record() == "conn0"
+    
+    connection = database._pool._pool.acquired[0]
+    assert connection.log == [
+        ("begin", 1),
+        ("begin", 2),
+        ("execute", "INSERT INTO audit DEFAULT VALUES"),
+        ("commit", 2),
+        ("commit", 1),
+        ("release",),
+    ]
+    assert connection.options[1] == {"isolation": None, "readonly": False, "deferrable": False}
@@ -0,0 +1,73 @@
+import pytest
+from quick.orm import models, columns, validators, BatchValidationError
+from quick.orm.query.bulk import BulkInsertBuilder
+from quick.orm.validators import compile_validator, validate_batch
+from quick.orm.validators.engine import compile_check
+
+
+@models.table("subscribers")
+class Subscriber(models.Model):
+    id = columns.Integer(primary_key=True, auto_increment=True)
+    email = columns.String(max_length=100, validators=[validators.Email()])
+    name = columns.String(max_length=50, nullable=True, validators=[validators.MinLength(2)])
+    age = columns.Integer(validators=[validators.Range(min_value=0, max_value=150)])
+    score = columns.Float(nullable=True, validators=[validators.Positive()])
+
+
+def test_batch_validation_reports_errors_per_row():
+    rows = [
+        {"email": "a@example.com", "name": "ann", "age": 30, "score": 1.5},
+        {"email": "broken", "name": "b", "age": 200, "score": None},
+        {"email": "c@example.com", "name": None, "age": None, "score": 0},
+    ]
+    
+    errors = validate_batch(Subscriber, rows)
+    
+    assert list(errors) == [1, 2]
+    assert sorted(error.field for error in errors[1]) == ["age", "email", "name"]
+    assert sorted(error.field for error in errors[2]) == ["age", "score"]
+    assert "age cannot be None" in {error.message for error in errors[2]}
+
+
+def test_batch_validation_matches_scalar_validators():
+    rows = [{"email": email, "age": age} for email, age in [("x@y.io", 0), ("x@y.io", 150), ("nope", -1), ("nope", 151)]]
+    
+    errors = validate_batch(Subscriber, rows)
+    
+    for index, row in enumerate(rows):
+        scalar_failures = set()
+        for name, value in row.items():
+            try:
+                Subscriber.__columns__[name].validate(value)
+            except ValueError:
+                scalar_failures.add(name)
+        assert scalar_failures == {error.field for error in errors.get(index, [])}
+
+
+def test_compiled_validator_is_cached_per_model():
+    assert compile_validator(Subscriber) is compile_validator(Subscriber)
+
+
+class NoDatabase:
+    async def fetch(self, query, *args):
+        raise AssertionError("query should not run")
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_validate_rejects_batch_before_querying():
+    builder = BulkInsertBuilder(Subscriber, NoDatabase()).values(
+        {"email": "ok@example.com", "age": 1},
+        {"email": "bad", "age": 1},
+    ).returning().validate()
+    
+    with pytest.raises(BatchValidationError) as info:
+        await builder.execute()
+    
+    assert list(info.value.errors) == [1]
+
+
+def test_bounds_checks_do_not_let_nan_hide_out_of_range_rows():
+    nan = float("nan")
+    
+    assert compile_check(validators.Range(min_value=0, max_value=10))([nan, 20, -5, 3]) == [1, 2]
+    assert compile_check(validators.Positive())([nan, -3, 1]) == [1]